@@ -1,12 +1,10 @@
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.schema import HumanMessage
 import os
 import time
 import logging
-from urllib.parse import urlparse, urljoin
+
+from gemini_scraper import GeminiWebScraper
+from llm_cache import LLMResponseCache
 
 # Load environment variables from .env file
 try:
@@ -19,131 +17,11 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class GeminiWebScraper:
-    def __init__(self, api_key: str = None):
-        """Initialize the Gemini Web Scraper"""
-        self.api_key = api_key or os.getenv('GOOGLE_API_KEY')
-        if not self.api_key:
-            raise ValueError("Google API key not found. Set GOOGLE_API_KEY environment variable.")
-        
-        # Initialize Gemini model
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            google_api_key=self.api_key,
-            temperature=0.1
-        )
-        
-        # Request headers to avoid blocking
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-    
-    def fetch_webpage(self, url: str) -> tuple[str, str]:
-        """
-        Fetch webpage content with error handling
-        Returns: (content, status_message)
-        """
-        try:
-            # Validate URL
-            parsed_url = urlparse(url)
-            if not parsed_url.scheme:
-                url = 'https://' + url
-            
-            logger.info(f"Fetching: {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer"]):
-                script.decompose()
-            
-            # Extract main content
-            content = soup.get_text()
-            # Clean up whitespace
-            content = '\n'.join(line.strip() for line in content.splitlines() if line.strip())
-            
-            # Limit content size (Gemini has token limits)
-            if len(content) > 10000:
-                content = content[:10000] + "\n\n[Content truncated...]"
-            
-            return content, f"SUCCESS: Successfully scraped {len(content)} characters"
-            
-        except requests.exceptions.RequestException as e:
-            error_msg = f"ERROR: Network error: {str(e)}"
-            logger.error(error_msg)
-            return "", error_msg
-        except Exception as e:
-            error_msg = f"ERROR: Parsing error: {str(e)}"
-            logger.error(error_msg)
-            return "", error_msg
-    
-    def analyze_content(self, content: str, user_prompt: str) -> str:
-        """
-        Use Gemini to analyze the scraped content based on user prompt
-        """
-        if not content:
-            return "ERROR: No content to analyze. Please check if the webpage loaded correctly."
-        
-        try:
-            # Construct the analysis prompt
-            analysis_prompt = f"""
-            You are a helpful web content analyst. Please analyze the following webpage content and respond to the user's request.
-            
-            User Request: {user_prompt}
-            
-            Webpage Content:
-            {content}
-            
-            Instructions:
-            - Focus specifically on what the user asked for
-            - Provide clear, structured information
-            - If the requested information isn't available, say so clearly
-            - Be concise but comprehensive
-            - Use bullet points or numbered lists when appropriate
-            """
-            
-            # Get response from Gemini
-            message = HumanMessage(content=analysis_prompt)
-            response = self.llm.invoke([message])
-            
-            return response.content
-            
-        except Exception as e:
-            error_msg = f"ERROR: AI Analysis error: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
-    
-    def scrape_and_analyze(self, url: str, user_prompt: str) -> dict:
-        """
-        Complete pipeline: scrape webpage and analyze with user prompt
-        """
-        start_time = time.time()
-        
-        # Step 1: Fetch content
-        content, fetch_status = self.fetch_webpage(url)
-        
-        # Step 2: Analyze with Gemini
-        if content:
-            analysis = self.analyze_content(content, user_prompt)
-        else:
-            analysis = "Cannot analyze - no content retrieved."
-        
-        processing_time = time.time() - start_time
-        
-        return {
-            'content': content,
-            'analysis': analysis,
-            'fetch_status': fetch_status,
-            'processing_time': round(processing_time, 2),
-            'content_length': len(content)
-        }
+
+@st.cache_resource(show_spinner=False)
+def get_scraper(api_key: str) -> GeminiWebScraper:
+    """One scraper (LLM client + connection pool) per API key, reused across reruns"""
+    return GeminiWebScraper(api_key, llm_cache=LLMResponseCache(), report_savings=True)
 
 def main():
     st.set_page_config(
@@ -170,6 +48,23 @@ def main():
         if api_key:
             os.environ['GOOGLE_API_KEY'] = api_key
         
+        bypass_cache = st.checkbox(
+            "Bypass AI response cache",
+            help="Always ask Gemini again, even for a page and question it has already answered"
+        )
+        
+        content_mode = st.radio(
+            "Content extraction",
+            options=["main", "full"],
+            format_func=lambda mode: "Main content only" if mode == "main" else "Full page text",
+            help="Main content drops menus, cookie banners and sidebars before sending the page to Gemini"
+        )
+        
+        relevance_filter = st.checkbox(
+            "Skip unrelated sections of long pages",
+            help="Long pages are analyzed in chunks; skip chunks that share no keywords with your question"
+        )
+        
         st.markdown("---")
         st.markdown("**How it works:**")
         st.markdown("""
@@ -220,58 +115,93 @@ def main():
             return
         
         try:
-            # Initialize scraper
-            scraper = GeminiWebScraper(api_key)
+            # Reuse the cached scraper so connections stay warm between runs
+            scraper = get_scraper(api_key)
             
             # Show progress
             progress_bar = st.progress(0)
             status_text = st.empty()
             
             status_text.text("Fetching webpage...")
-            progress_bar.progress(25)
-            
-            # Scrape and analyze
-            result = scraper.scrape_and_analyze(url_input, user_prompt)
+            progress_bar.progress(10)
             
-            status_text.text("Analyzing with Gemini AI...")
-            progress_bar.progress(75)
+            start_time = time.perf_counter()
+            page = scraper.fetch_page(url_input, max_chars=None, content_mode=content_mode)
+            fetch_time = time.perf_counter() - start_time
             
-            status_text.text("Complete!")
-            progress_bar.progress(100)
+            # Report the fetch right away instead of after the analysis
+            if page['content']:
+                st.info(f"{page['fetch_status']} ({fetch_time:.2f}s)")
+            else:
+                st.error(page['fetch_status'])
             
-            # Display results
-            st.success(f"Processing completed in {result['processing_time']} seconds")
+            status_text.text("Analyzing with Gemini AI...")
+            progress_bar.progress(40)
             
-            # Main analysis result
+            # Main analysis result, rendered as the tokens arrive
             st.markdown("## Analysis Result")
-            st.markdown(result['analysis'])
+            answer = st.empty()
+            stream = scraper.stream_analysis(page['content'], user_prompt, use_cache=not bypass_cache,
+                                             relevance_filter=relevance_filter)
+            for _ in stream:
+                if progress_bar is not None:
+                    progress_bar.empty()
+                    progress_bar = None
+                    status_text.text("Receiving answer...")
+                answer.markdown(stream.text + "▌")
+            answer.markdown(stream.text)
+            
+            processing_time = time.perf_counter() - start_time
+            status_text.empty()
+            if progress_bar is not None:
+                progress_bar.empty()
+            
+            st.success(f"Processing completed in {processing_time:.2f} seconds")
             
             # Details in expander
             with st.expander("Scraping Details"):
-                col1, col2, col3 = st.columns(3)
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Content Length", f"{len(page['content']):,} chars")
+                with col2:
+                    st.metric("Processing Time", f"{processing_time:.2f}s")
+                with col3:
+                    st.metric("Fetch Time", f"{fetch_time:.2f}s")
+                with col4:
+                    st.metric("Status", "Success" if page['content'] else "Failed")
+                
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    ttft = stream.time_to_first_token
+                    st.metric("Time to First Token", f"{ttft:.2f}s" if ttft is not None else "-")
+                with col2:
+                    st.metric("Analysis Time", f"{stream.total_time:.2f}s")
+                with col4:
+                    chunk_stats = stream.chunk_stats
+                    st.metric("Chunks Analyzed", f"{chunk_stats['chunks_analyzed']} / {chunk_stats['chunks']}")
+                
+                cache_stats = scraper.llm_cache.stats()
+                col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("Content Length", f"{result['content_length']:,} chars")
+                    st.metric("AI Cache Hit Rate", f"{cache_stats['hit_rate']:.0%}")
                 with col2:
-                    st.metric("Processing Time", f"{result['processing_time']}s")
+                    st.metric("Latency Saved", f"{cache_stats['latency_saved']:.1f}s")
                 with col3:
-                    st.metric("Status", "Success" if result['content'] else "Failed")
+                    st.metric("Tokens Saved", f"{cache_stats['tokens_saved']:,}")
                 
-                st.markdown("**Fetch Status:**")
-                st.info(result['fetch_status'])
+                if page['extraction'] == "main":
+                    st.caption(f"Main-content extraction removed {page['chars_saved']:,} characters "
+                               f"(~{page['tokens_saved']:,} tokens) of boilerplate")
                 
-                if result['content']:
+                if page['content']:
                     st.markdown("**Raw Content Preview:**")
                     st.text_area(
                         "First 1000 characters of scraped content:",
-                        result['content'][:1000] + "..." if len(result['content']) > 1000 else result['content'],
+                        page['content'][:1000] + "..." if len(page['content']) > 1000 else page['content'],
                         height=200,
                         disabled=True
                     )
             
-            # Clear progress indicators
-            progress_bar.empty()
-            status_text.empty()
-            
         except Exception as e:
             st.error(f"ERROR: {str(e)}")
             logger.error(f"Streamlit error: {e}")
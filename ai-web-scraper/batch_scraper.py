@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Batch mode for the Gemini Web Scraper: one prompt, many URLs.
+
+Pages are fetched concurrently on a thread pool (through the scraper's pooled
+client, rate limiter and optional HTTP cache) and handed to a bounded set of
+async LLM workers that call the model's `ainvoke`. Each result is appended to
+an NDJSON file as soon as it completes, so huge URL lists never pile up in
+memory and partial runs are still useful.
+
+Usage:
+    python batch_scraper.py urls.txt --prompt "Summarize the main points"
+    python batch_scraper.py urls.txt --prompt "List prices" --fake-llm --output results.ndjson
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from fake_llm import FakeLLM
+from gemini_scraper import GeminiWebScraper  # also puts the repository root on sys.path
+from llm_cache import LLMResponseCache
+from scraping_common.http_cache import HTTPCache
+from scraping_common.http_client import PooledHTTPClient
+from scraping_common.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel telling a worker there is nothing left to do
+_DONE = object()
+
+
+def _failed_page(status: str) -> dict:
+    """fetch_page-shaped result for a URL whose fetch raised"""
+    return {'content': "", 'fetch_status': status, 'extraction': None, 'chars_saved': 0, 'tokens_saved': 0}
+
+
+@dataclass
+class BatchReport:
+    """Aggregate outcome of a batch run"""
+    urls: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    content_chars: int = 0
+    chars_saved: int = 0
+    tokens_saved: int = 0
+    elapsed: float = 0.0
+    output_path: str = ""
+
+    @property
+    def urls_per_second(self) -> float:
+        return self.urls / self.elapsed if self.elapsed else 0.0
+
+
+class BatchScraper:
+    """
+    Two-stage pipeline: fetch workers -> bounded queue -> LLM workers.
+
+    fetch_workers    -- pages fetched in parallel
+    llm_concurrency  -- pages analyzed at once, and the cap on model calls in
+                        flight in total (long pages fan out into chunks)
+    relevance_filter -- skip chunks of long pages unrelated to the prompt
+    """
+
+    def __init__(self, scraper: GeminiWebScraper, fetch_workers: int = 16, llm_concurrency: int = 8,
+                 relevance_filter: bool = False, progress_every: int = 100):
+        self.scraper = scraper
+        self.fetch_workers = fetch_workers
+        self.llm_concurrency = llm_concurrency
+        self.relevance_filter = relevance_filter
+        self.progress_every = progress_every
+
+    def run(self, urls: Iterable[str], user_prompt: str, output_path: str) -> BatchReport:
+        return asyncio.run(self.run_async(urls, user_prompt, output_path))
+
+    async def run_async(self, urls: Iterable[str], user_prompt: str, output_path: str) -> BatchReport:
+        report = BatchReport(output_path=output_path)
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        url_queue: asyncio.Queue = asyncio.Queue(maxsize=self.fetch_workers * 2)
+        page_queue: asyncio.Queue = asyncio.Queue(maxsize=self.llm_concurrency * 2)
+        # Caps model calls in flight across all pages, map chunks included
+        llm_slots = asyncio.Semaphore(self.llm_concurrency)
+
+        async def feed():
+            for url in urls:
+                await url_queue.put(url)
+            for _ in range(self.fetch_workers):
+                await url_queue.put(_DONE)
+
+        async def fetch_worker(pool: ThreadPoolExecutor):
+            while True:
+                url = await url_queue.get()
+                try:
+                    if url is _DONE:
+                        return
+                    fetch_start = time.perf_counter()
+                    try:
+                        page = await loop.run_in_executor(pool, self.scraper.fetch_page, url, None)
+                    except Exception as e:
+                        logger.error(f"Fetch failed for {url}: {e}")
+                        page = _failed_page(f"ERROR: Fetch error: {e}")
+                    await page_queue.put((url, page, time.perf_counter() - fetch_start))
+                finally:
+                    url_queue.task_done()
+
+        async def produce(pool: ThreadPoolExecutor):
+            await asyncio.gather(feed(), *(fetch_worker(pool) for _ in range(self.fetch_workers)))
+            for _ in range(self.llm_concurrency):
+                await page_queue.put(_DONE)
+
+        async def analyze(url: str, page: dict, fetch_time: float) -> dict:
+            content = page['content']
+            analysis_start = time.perf_counter()
+            chunk_stats = {'chunks': 0, 'chunks_analyzed': 0}
+            if content:
+                try:
+                    analysis, chunk_stats = await self.scraper.analyze_any_async(
+                        content, user_prompt, relevance_filter=self.relevance_filter, llm_slots=llm_slots)
+                except Exception as e:
+                    logger.error(f"Analysis failed for {url}: {e}")
+                    analysis = f"ERROR: AI Analysis error: {e}"
+            else:
+                analysis = "Cannot analyze - no content retrieved."
+
+            return {
+                'url': url,
+                'ok': bool(content) and not analysis.startswith("ERROR"),
+                'fetch_status': page['fetch_status'],
+                'content_length': len(content),
+                'extraction': page['extraction'],
+                'chars_saved': page['chars_saved'],
+                'tokens_saved': page['tokens_saved'],
+                **chunk_stats,
+                'analysis': analysis,
+                'fetch_time': round(fetch_time, 3),
+                'analysis_time': round(time.perf_counter() - analysis_start, 3),
+                'scraped_at': datetime.now().isoformat(),
+            }
+
+        async def llm_worker(output):
+            while True:
+                item = await page_queue.get()
+                try:
+                    if item is _DONE:
+                        return
+                    record = await analyze(*item)
+                    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    output.flush()
+
+                    report.urls += 1
+                    report.content_chars += record['content_length']
+                    report.chars_saved += record['chars_saved']
+                    report.tokens_saved += record['tokens_saved']
+                    if record['ok']:
+                        report.succeeded += 1
+                    else:
+                        report.failed += 1
+                    if self.progress_every and report.urls % self.progress_every == 0:
+                        logger.info(f"Progress: {report.urls} URLs done "
+                                    f"({report.urls / (time.perf_counter() - start):.1f} URLs/sec)")
+                finally:
+                    page_queue.task_done()
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool, \
+                open(output_path, 'w', encoding='utf-8') as output:
+            tasks = [asyncio.create_task(produce(pool))]
+            tasks += [asyncio.create_task(llm_worker(output)) for _ in range(self.llm_concurrency)]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # A stage that died (e.g. the output became unwritable) must
+                # not leave the other stages waiting on the queues forever
+                for task in tasks:
+                    task.cancel()
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+def read_urls(path: str) -> Iterator[str]:
+    """URLs one per line; blank lines and # comments are skipped ('-' reads stdin)"""
+    handle = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line in handle:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def build_scraper(args) -> GeminiWebScraper:
+    llm = FakeLLM(latency=args.fake_latency) if args.fake_llm else None
+
+    return GeminiWebScraper(
+        llm=llm,
+        rate_limiter=HostRateLimiter(rate=args.rate, max_rate=max(args.rate, 4.0)),
+        http_cache=HTTPCache(args.cache_dir) if args.cache_dir else None,
+        http_client=PooledHTTPClient(max_connections_per_host=args.per_host),
+        llm_cache=None if args.no_llm_cache else LLMResponseCache(args.llm_cache_dir),
+        extractor=args.extractor,
+        content_mode=args.content,
+        report_savings=args.report_savings,
+    )
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Analyze many URLs with one prompt")
+    parser.add_argument('urls_file', help="file with one URL per line ('-' for stdin)")
+    parser.add_argument('--prompt', required=True, help="question to ask about every page")
+    parser.add_argument('--output', help="NDJSON output file (default: batch_results_<timestamp>.ndjson)")
+    parser.add_argument('--fetch-workers', type=int, default=16, help="parallel page fetches")
+    parser.add_argument('--llm-concurrency', type=int, default=8, help="parallel model calls")
+    parser.add_argument('--relevance-filter', action='store_true',
+                        help="skip chunks of long pages that share no keywords with the prompt")
+    parser.add_argument('--extractor', default="auto",
+                        choices=["auto", "selectolax", "lxml", "stream", "bs4"], help="HTML-to-text backend")
+    parser.add_argument('--content', default="main", choices=["main", "full"],
+                        help="main content only (boilerplate removed) or all page text")
+    parser.add_argument('--report-savings', action='store_true',
+                        help="measure boilerplate removed by --content main (one extra extraction per page)")
+    parser.add_argument('--rate', type=float, default=1.0, help="starting requests/sec per host")
+    parser.add_argument('--per-host', type=int, default=4, help="max connections per host")
+    parser.add_argument('--cache-dir', help="enable the on-disk HTTP cache in this directory")
+    parser.add_argument('--llm-cache-dir', default=".llm_cache", help="LLM response cache directory")
+    parser.add_argument('--no-llm-cache', action='store_true', help="bypass the LLM response cache")
+    parser.add_argument('--fake-llm', action='store_true', help="use the offline FakeLLM")
+    parser.add_argument('--fake-latency', type=float, default=0.2, help="FakeLLM seconds per call")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    output = args.output or f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+
+    scraper = build_scraper(args)
+    try:
+        batch = BatchScraper(scraper, fetch_workers=args.fetch_workers, llm_concurrency=args.llm_concurrency,
+                             relevance_filter=args.relevance_filter)
+        report = batch.run(read_urls(args.urls_file), args.prompt, output)
+    finally:
+        scraper.close()
+
+    print(f"Batch complete: {report.urls} URLs in {report.elapsed:.1f}s "
+          f"({report.urls_per_second:.2f} URLs/sec)")
+    print(f"   Succeeded: {report.succeeded} | Failed: {report.failed} | "
+          f"Content: {report.content_chars:,} chars")
+    if args.report_savings:
+        print(f"   Boilerplate removed: {report.chars_saved:,} chars / ~{report.tokens_saved:,} tokens")
+    if scraper.llm_cache is not None:
+        stats = scraper.llm_cache.stats()
+        print(f"   LLM cache: {stats['hit_rate']:.0%} hit rate | "
+              f"{stats['latency_saved']:.1f}s and {stats['tokens_saved']:,} tokens saved")
+    print(f"   Results: {os.path.abspath(report.output_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+🧪 BENCHMARK: HTML-to-text extraction backends
+
+Runs every installed backend in html_text.py over the HTML fixtures in
+benchmarks/fixtures/ (synthetic pages are generated there on first run; drop
+saved real pages next to them to include those too) and reports:
+
+- median extraction time, full text and with the 10,000-char budget
+- peak Python heap per extraction (tracemalloc); memory allocated inside
+  libxml2/lexbor is not visible to tracemalloc, so lxml/selectolax peaks are
+  lower bounds
+- whether the output matches the original BeautifulSoup path
+
+Usage:
+    python benchmarks/bench_extraction.py --repeat 5
+"""
+
+import argparse
+import glob
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_text import available_backends, extract_text  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+BUDGET = 10000
+
+WORDS = ("data scraping python request parser memory latency model page content price "
+         "product review customer shipping account login search result article author").split()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+
+
+def _chrome(rng: random.Random, body: str, title: str) -> str:
+    """Wrap a body in the usual boilerplate: head, scripts, nav, cookie banner, footer"""
+    nav = "".join(f'<li><a href="/c/{i}">Category {i}</a></li>' for i in range(60))
+    script = "var state = " + "{" + ",".join(f'"k{i}": {i}' for i in range(2000)) + "};"
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>{'.c{color:red} ' * 400}</style><script>{script}</script></head>
+<body><nav><ul>{nav}</ul></nav>
+<div class="cookie">We use cookies &amp; similar technologies. <a href="/privacy">Privacy</a></div>
+{body}
+<footer>{''.join(f'<a href="/f/{i}">Footer link {i}</a>' for i in range(80))}</footer>
+<script>{script}</script></body></html>"""
+
+
+def build_fixtures(directory: str):
+    """Deterministic synthetic pages: an article, a product listing and a docs page"""
+    rng = random.Random(7)
+    os.makedirs(directory, exist_ok=True)
+
+    article = "<article><h1>Long read</h1>" + "".join(
+        f"<h2>Section {s}</h2>" + "".join(f"<p>{' '.join(_sentence(rng) for _ in range(5))}</p>" for _ in range(6))
+        for s in range(25)) + "</article>"
+
+    listing = "<main><h1>Laptops</h1>" + "".join(
+        f'<div class="card"><img src="/p/{i}.jpg"><h3>Laptop model {i}</h3>'
+        f'<span class="price">{rng.randint(500, 3000)} &euro;</span><p>{_sentence(rng)}</p>'
+        f'<button>Add to cart</button></div>' for i in range(1500)) + "</main>"
+
+    docs = "<main><h1>API reference</h1>" + "".join(
+        f"<h2>function_{i}()</h2><p>{_sentence(rng)} {_sentence(rng)}</p>"
+        f"<pre><code>result = function_{i}(arg, retries={i % 5})\nprint(result)</code></pre>"
+        for i in range(600)) + "</main>"
+
+    for name, body in (("article", article), ("listing", listing), ("docs", docs)):
+        with open(os.path.join(directory, f"synthetic_{name}.html"), "w", encoding="utf-8") as f:
+            f.write(_chrome(rng, body, name.title()))
+
+
+def _median_time(html: bytes, backend: str, max_chars, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_text(html, backend=backend, max_chars=max_chars)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def peak_memory(html: bytes, backend: str) -> int:
+    """Peak Python heap (tracemalloc) during one extraction"""
+    extract_text(b"<p>warm up</p>", backend=backend)  # keep lazy imports out of the peak
+    tracemalloc.start()
+    extract_text(html, backend=backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML-to-text backend benchmark")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help="directory of *.html fixtures")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    if not glob.glob(os.path.join(args.fixtures, "*.html")):
+        build_fixtures(args.fixtures)
+
+    backends = ["bs4"] + [b for b in ("lxml", "selectolax", "stream") if b in available_backends()]
+    print("🧪 HTML EXTRACTION BENCHMARK")
+    print("=" * 88)
+    print(f"{'fixture':28} {'backend':11} {'full ms':>9} {'10k ms':>9} {'heap peak':>11} "
+          f"{'speedup':>8}  same text")
+
+    for path in sorted(glob.glob(os.path.join(args.fixtures, "*.html"))):
+        with open(path, "rb") as f:
+            html = f.read()
+        reference, _ = extract_text(html, backend="bs4")
+        baseline = None
+
+        for backend in backends:
+            full = _median_time(html, backend, None, args.repeat)
+            budget = _median_time(html, backend, BUDGET, args.repeat)
+            heap = peak_memory(html, backend)
+            text, _ = extract_text(html, backend=backend)
+            baseline = baseline or full
+            name = f"{os.path.splitext(os.path.basename(path))[0][:20]} ({len(html) // 1024}K)"
+            print(f"{name:28} {backend:11} {full * 1000:9.1f} {budget * 1000:9.1f} "
+                  f"{heap / 1e6:9.1f}MB {baseline / full:7.1f}x  "
+                  f"{'yes' if text == reference else 'no'}")
+        print("-" * 88)
+
+
+if __name__ == "__main__":
+    main()
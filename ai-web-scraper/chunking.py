@@ -0,0 +1,105 @@
+"""
+Split cleaned page text into token-budgeted chunks for map-reduce analysis.
+
+Text arrives as one block per line (see fetch_webpage). Chunks are filled
+block by block, preferring to start a new chunk at a heading once the current
+one is half full, so sections stay together. Blocks larger than the budget
+are split on sentence boundaries, and only cut mid-sentence as a last resort.
+"""
+
+import re
+from typing import List, Optional
+
+from tokens import estimate_tokens
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+_WORD = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = frozenset("""
+    a an and are as at be by can do does for from has have how i in is it its me
+    my of on or please that the their this to was what when where which who why
+    will with you your all any about list find show give tell extract summarize
+""".split())
+
+
+def is_heading(line: str) -> bool:
+    """Short line without closing punctuation - most likely a title or heading"""
+    return len(line) <= 80 and not line.endswith(('.', ',', ';', ':', '!', '?')) and len(line.split()) <= 12
+
+
+def _split_block(block: str, max_tokens: int) -> List[str]:
+    if estimate_tokens(block) <= max_tokens:
+        return [block]
+
+    max_chars = max_tokens * 4
+    pieces, current = [], ""
+    for sentence in _SENTENCE_END.split(block):
+        while len(sentence) > max_chars:
+            # A single run-on "sentence" bigger than the budget
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_into_chunks(text: str, max_tokens: int = 2500) -> List[str]:
+    """Group the lines of `text` into chunks of at most ~max_tokens each"""
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        for block in _split_block(line, max_tokens):
+            tokens = estimate_tokens(block) + 1
+            starts_section = is_heading(block) and current_tokens >= max_tokens // 2
+            if current and (current_tokens + tokens > max_tokens or starts_section):
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(block)
+            current_tokens += tokens
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def keywords(text: str) -> set:
+    return {word for word in _WORD.findall(text.lower()) if word not in STOPWORDS and len(word) > 2}
+
+
+def relevance_score(chunk: str, user_prompt: str) -> float:
+    """Share of the question's keywords that occur in the chunk (0..1)"""
+    wanted = keywords(user_prompt)
+    if not wanted:
+        return 1.0
+    return len(wanted & keywords(chunk)) / len(wanted)
+
+
+def select_relevant(chunks: List[str], user_prompt: str, max_chunks: Optional[int] = None,
+                    min_score: float = 0.0) -> List[int]:
+    """
+    Indexes of the chunks worth sending to the model, in page order.
+
+    The first chunk (title and intro) is always kept. Chunks scoring at or
+    below `min_score` are dropped, and at most `max_chunks` of the best are kept.
+    """
+    if not chunks:
+        return []
+    scores = [relevance_score(chunk, user_prompt) for chunk in chunks]
+    ranked = sorted((i for i in range(1, len(chunks)) if scores[i] > min_score),
+                    key=lambda i: scores[i], reverse=True)
+    if max_chunks is not None:
+        ranked = ranked[:max(0, max_chunks - 1)]
+    return [0] + sorted(ranked)
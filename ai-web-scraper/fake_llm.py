@@ -0,0 +1,75 @@
+"""
+Offline stand-in for the Gemini chat model.
+
+Implements the slice of the LangChain chat-model interface the scraper uses
+(invoke / ainvoke / stream) with a configurable latency, so the batch
+pipeline and the streaming UI can be exercised without an API key or network
+access.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator
+
+from tokens import estimate_tokens
+
+
+@dataclass
+class FakeMessage:
+    """Mimics an AIMessage: text content plus token usage"""
+    content: str
+    usage_metadata: Dict[str, int] = field(default_factory=dict)
+
+
+def _prompt_text(messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(getattr(message, 'content', str(message)) for message in messages)
+
+
+class FakeLLM:
+    """
+    Deterministic chat model with simulated latency.
+
+    latency       -- seconds per call (time to a complete answer)
+    token_latency -- seconds between streamed tokens (stream only)
+    """
+
+    def __init__(self, latency: float = 0.2, model: str = "fake-llm", token_latency: float = 0.02):
+        self.latency = latency
+        self.model = model
+        self.token_latency = token_latency
+        self.calls = 0
+
+    def _answer(self, messages) -> FakeMessage:
+        self.calls += 1
+        prompt = _prompt_text(messages)
+        request = next((line.strip() for line in prompt.splitlines()
+                        if line.strip().startswith("User Request:")), "User Request: ?")
+        content = f"[{self.model}] {request} ({len(prompt):,} prompt chars)"
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(content)
+        return FakeMessage(content, {
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+        })
+
+    def invoke(self, messages) -> FakeMessage:
+        time.sleep(self.latency)
+        return self._answer(messages)
+
+    async def ainvoke(self, messages) -> FakeMessage:
+        await asyncio.sleep(self.latency)
+        return self._answer(messages)
+
+    def stream(self, messages) -> Iterator[FakeMessage]:
+        """Yield the answer word by word; the first word arrives after `latency`"""
+        answer = self._answer(messages)
+        time.sleep(self.latency)
+        words = answer.content.split(" ")
+        for i, word in enumerate(words):
+            if i:
+                time.sleep(self.token_latency)
+            last = i == len(words) - 1
+            yield FakeMessage(word if last else word + " ", answer.usage_metadata if last else {})
@@ -0,0 +1,583 @@
+"""
+Gemini Web Scraper - fetching and analysis pipeline used by the Streamlit app
+and the batch CLI. Pass `llm=` to use any LangChain-style chat model (e.g.
+FakeLLM for offline runs); otherwise a Gemini client is created.
+"""
+
+import asyncio
+import requests
+import os
+import sys
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+from urllib.parse import urlparse
+
+from chunking import select_relevant, split_into_chunks
+from html_text import charset_from_content_type, extract_text
+from main_content import extract_main_content
+from llm_cache import LLMResponseCache, analysis_key
+from tokens import estimate_tokens, usage_tokens
+
+# Shared infrastructure lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_common.http_cache import HTTPCache
+from scraping_common.http_client import PooledHTTPClient
+from scraping_common.metrics import Metrics, shared_metrics
+from scraping_common.rate_limiter import HostRateLimiter, shared_rate_limiter
+
+# LangChain is only needed for the real Gemini client
+try:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain.schema import HumanMessage
+except ImportError:
+    ChatGoogleGenerativeAI = None
+    HumanMessage = None
+
+logger = logging.getLogger(__name__)
+
+# Map-step answer for a chunk with nothing relevant; dropped before the reduce
+NO_RELEVANT_INFO = "NO RELEVANT INFORMATION"
+
+class AnalysisStream:
+    """
+    Answer text as the model generates it, with timings.
+
+    Iterate to receive text pieces; afterwards `text` holds the full answer.
+    time_to_first_token and total_time are measured from creation, so the
+    map step of a long page counts towards the first token.
+    """
+    
+    def __init__(self, pieces: Iterator[str], chunk_stats: dict):
+        self._pieces = pieces
+        self.chunk_stats = chunk_stats
+        self.text = ""
+        self.started = time.perf_counter()
+        self.time_to_first_token: Optional[float] = None
+        self.total_time: Optional[float] = None
+    
+    def __iter__(self) -> Iterator[str]:
+        for piece in self._pieces:
+            if piece and self.time_to_first_token is None:
+                self.time_to_first_token = time.perf_counter() - self.started
+            self.text += piece
+            yield piece
+        self.total_time = time.perf_counter() - self.started
+
+class GeminiWebScraper:
+    MODEL = "gemini-1.5-flash"
+    TEMPERATURE = 0.1
+    
+    # Pages up to this size go to the model in one call; longer ones are chunked
+    SINGLE_CALL_CHARS = 10000
+    CHUNK_TOKENS = 2500
+    MAP_CONCURRENCY = 6
+    
+    def __init__(self, api_key: str = None, rate_limiter: HostRateLimiter = None,
+                 http_cache: HTTPCache = None, http_client: PooledHTTPClient = None,
+                 llm=None, llm_cache: LLMResponseCache = None, extractor: str = "auto",
+                 content_mode: str = "main", metrics: Metrics = None, report_savings: bool = False):
+        """Initialize the Gemini Web Scraper"""
+        self.api_key = api_key or os.getenv('GOOGLE_API_KEY')
+        
+        if llm is not None:
+            # Any chat model with invoke/ainvoke works (e.g. FakeLLM offline)
+            self.llm = llm
+            self.model_name = getattr(llm, 'model', type(llm).__name__)
+            self.temperature = getattr(llm, 'temperature', None)
+        else:
+            if not self.api_key:
+                raise ValueError("Google API key not found. Set GOOGLE_API_KEY environment variable.")
+            if ChatGoogleGenerativeAI is None:
+                raise ImportError("langchain-google-genai is required for Gemini analysis")
+            
+            # Initialize Gemini model
+            self.llm = ChatGoogleGenerativeAI(
+                model=self.MODEL,
+                google_api_key=self.api_key,
+                temperature=self.TEMPERATURE
+            )
+            self.model_name = self.MODEL
+            self.temperature = self.TEMPERATURE
+        
+        # Request headers to avoid blocking
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        }
+        
+        # Per-host pacing shared with every other scraper in this process
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        
+        # Optional on-disk response cache (fresh hits skip the network)
+        self.http_cache = http_cache
+        
+        # Long-lived pooled client so repeat fetches reuse open connections
+        self.http_client = http_client or PooledHTTPClient(max_connections_per_host=4)
+        
+        # Optional cache of analyses keyed on (model, temperature, content, prompt)
+        self.llm_cache = llm_cache
+        
+        # HTML-to-text backend: auto / selectolax / lxml / stream / bs4
+        self.extractor = extractor
+        
+        # "main" keeps only the main content block (falls back to the full
+        # page when no block scores convincingly); "full" keeps all text
+        self.content_mode = content_mode
+        
+        # Measure boilerplate savings against full-page text (one extra,
+        # budgeted extraction pass per page in main-content mode)
+        self.report_savings = report_savings
+        
+        # Per-stage timings (no-op unless enabled, e.g. SCRAPER_METRICS=metrics.prom)
+        self.metrics = metrics or shared_metrics
+    
+    def fetch_webpage(self, url: str, max_chars: int = 10000) -> tuple[str, str]:
+        """
+        Fetch webpage content with error handling
+        (max_chars=None keeps the full text for chunked analysis)
+        Returns: (content, status_message)
+        """
+        page = self.fetch_page(url, max_chars)
+        return page['content'], page['fetch_status']
+    
+    def fetch_page(self, url: str, max_chars: int = 10000, content_mode: str = None) -> dict:
+        """
+        fetch_webpage plus extraction details: which extraction was used (None
+        when the fetch failed) and, with report_savings, how many
+        characters/tokens of boilerplate main-content mode removed
+        """
+        content_mode = content_mode or self.content_mode
+        page = {'content': "", 'fetch_status': "", 'extraction': None,
+                'chars_saved': 0, 'tokens_saved': 0}
+        try:
+            # Validate URL
+            parsed_url = urlparse(url)
+            if not parsed_url.scheme:
+                url = 'https://' + url
+            
+            logger.info(f"Fetching: {url}")
+            response = self._get(url)
+            response.raise_for_status()
+            encoding = charset_from_content_type(response.headers.get('Content-Type'))
+            
+            details = {'extraction': content_mode, 'chars_saved': 0, 'tokens_saved': 0}
+            with self.metrics.span("extract", scraper="ai", mode=content_mode):
+                if content_mode == "main":
+                    content, truncated = self._extract_main(response.content, encoding, max_chars, details)
+                else:
+                    # Extract visible text without script/style/nav/footer; with a
+                    # budget the extractor stops as soon as it has max_chars characters
+                    content, truncated = extract_text(response.content, backend=self.extractor,
+                                                      max_chars=max_chars, encoding=encoding)
+            
+            # Limit content size (Gemini has token limits)
+            if truncated:
+                content += "\n\n[Content truncated...]"
+            
+            page.update(details, content=content)
+            page['fetch_status'] = f"SUCCESS: Successfully scraped {len(content)} characters"
+            if page['extraction'] == "main" and self.report_savings:
+                page['fetch_status'] += (f" (main content; {page['chars_saved']:,} chars / "
+                                         f"~{page['tokens_saved']:,} tokens of boilerplate removed)")
+            return page
+            
+        except requests.exceptions.RequestException as e:
+            error_msg = f"ERROR: Network error: {str(e)}"
+            logger.error(error_msg)
+            page['fetch_status'] = error_msg
+            return page
+        except Exception as e:
+            error_msg = f"ERROR: Parsing error: {str(e)}"
+            logger.error(error_msg)
+            page['fetch_status'] = error_msg
+            return page
+    
+    def _extract_main(self, html: bytes, encoding: str, max_chars: int, details: dict) -> tuple[str, bool]:
+        """Main content when a block scores convincingly, else the (budgeted) full text"""
+        text = extract_main_content(html, encoding=encoding)
+        if text is None:
+            details['extraction'] = "full"
+            return extract_text(html, backend=self.extractor, max_chars=max_chars, encoding=encoding)
+        
+        truncated = bool(max_chars) and len(text) > max_chars
+        if truncated:
+            text = text[:max_chars]
+        
+        if self.report_savings:
+            # Savings compared to what full-page mode would have sent
+            baseline, _ = extract_text(html, backend=self.extractor, max_chars=max_chars, encoding=encoding)
+            details['chars_saved'] = max(0, len(baseline) - len(text))
+            details['tokens_saved'] = max(0, estimate_tokens(baseline) - estimate_tokens(text))
+        return text, truncated
+    
+    def _get(self, url: str) -> requests.Response:
+        """GET through the HTTP cache (if any) and the shared rate limiter"""
+        def send(conditional_headers: dict) -> requests.Response:
+            waited = self.rate_limiter.acquire(url)
+            self.metrics.observe("rate_limit_wait_seconds", waited, scraper="ai")
+            start = time.perf_counter()
+            response = self.http_client.get(url, headers={**self.headers, **conditional_headers}, timeout=10)
+            self.metrics.observe_http(response, time.perf_counter() - start, scraper="ai")
+            self.rate_limiter.observe(url, response)
+            return response
+        
+        with self.metrics.span("fetch", scraper="ai"):
+            if self.http_cache is None:
+                return send({})
+            return self.http_cache.fetch(url, send)
+    
+    def close(self):
+        """Release pooled connections"""
+        self.http_client.close()
+    
+    def analyze_content(self, content: str, user_prompt: str, use_cache: bool = True) -> str:
+        """
+        Use Gemini to analyze the scraped content based on user prompt
+        (use_cache=False bypasses the LLM response cache)
+        """
+        if not content:
+            return "ERROR: No content to analyze. Please check if the webpage loaded correctly."
+        
+        try:
+            return self._complete(self.build_prompt(content, user_prompt),
+                                  self._cache_key(content, user_prompt, use_cache))
+            
+        except Exception as e:
+            error_msg = f"ERROR: AI Analysis error: {str(e)}"
+            logger.error(error_msg)
+            return error_msg
+    
+    async def analyze_content_async(self, content: str, user_prompt: str, use_cache: bool = True,
+                                    llm_slots: Optional[asyncio.Semaphore] = None) -> str:
+        """
+        Async variant of analyze_content (uses the model's ainvoke), for fan-out.
+        llm_slots, when given, bounds model calls in flight across all callers
+        """
+        if not content:
+            return "ERROR: No content to analyze. Please check if the webpage loaded correctly."
+        
+        try:
+            return await self._complete_async(self.build_prompt(content, user_prompt),
+                                              self._cache_key(content, user_prompt, use_cache), llm_slots)
+            
+        except Exception as e:
+            error_msg = f"ERROR: AI Analysis error: {str(e)}"
+            logger.error(error_msg)
+            return error_msg
+    
+    def analyze_chunked(self, content: str, user_prompt: str, use_cache: bool = True,
+                        relevance_filter: bool = False, max_chunks: int = None) -> tuple[str, dict]:
+        """
+        Map-reduce analysis for long pages: chunks are analyzed concurrently
+        (map) and the partial answers merged in one more call (reduce).
+        relevance_filter skips chunks that share no keywords with the prompt.
+        Returns: (analysis, chunk_stats)
+        """
+        chunks, selected = self._plan_chunks(content, user_prompt, relevance_filter, max_chunks)
+        chunk_stats = {'chunks': len(chunks), 'chunks_analyzed': len(selected)}
+        
+        try:
+            partials = self._run_map(self._map_calls(chunks, selected, user_prompt, use_cache))
+            reduce_call = self._reduce_call(partials, user_prompt, use_cache)
+            if isinstance(reduce_call, str):
+                return reduce_call, chunk_stats
+            return self._complete(*reduce_call), chunk_stats
+            
+        except Exception as e:
+            error_msg = f"ERROR: AI Analysis error: {str(e)}"
+            logger.error(error_msg)
+            return error_msg, chunk_stats
+    
+    async def analyze_chunked_async(self, content: str, user_prompt: str, use_cache: bool = True,
+                                    relevance_filter: bool = False, max_chunks: int = None,
+                                    llm_slots: Optional[asyncio.Semaphore] = None) -> tuple[str, dict]:
+        """
+        Async variant of analyze_chunked (map calls fan out through ainvoke;
+        llm_slots, when given, bounds model calls in flight across all callers)
+        """
+        chunks, selected = self._plan_chunks(content, user_prompt, relevance_filter, max_chunks)
+        chunk_stats = {'chunks': len(chunks), 'chunks_analyzed': len(selected)}
+        
+        try:
+            slots = asyncio.Semaphore(self.MAP_CONCURRENCY)
+            
+            async def run_map(call):
+                async with slots:
+                    return await self._complete_async(*call, llm_slots)
+            
+            partials = await asyncio.gather(*(run_map(call) for call in
+                                              self._map_calls(chunks, selected, user_prompt, use_cache)))
+            
+            reduce_call = self._reduce_call(list(partials), user_prompt, use_cache)
+            if isinstance(reduce_call, str):
+                return reduce_call, chunk_stats
+            return await self._complete_async(*reduce_call, llm_slots), chunk_stats
+            
+        except Exception as e:
+            error_msg = f"ERROR: AI Analysis error: {str(e)}"
+            logger.error(error_msg)
+            return error_msg, chunk_stats
+    
+    def stream_analysis(self, content: str, user_prompt: str, use_cache: bool = True,
+                        relevance_filter: bool = False) -> AnalysisStream:
+        """
+        Streaming variant of analyze_any: the answer arrives piece by piece
+        through the model's stream API. Long pages run the map step first and
+        stream the reduce step. Cached answers arrive as a single piece.
+        """
+        if not content:
+            return AnalysisStream(iter(["ERROR: No content to analyze. Please check if the webpage loaded correctly."]),
+                                  {'chunks': 0, 'chunks_analyzed': 0})
+        
+        if len(content) <= self.SINGLE_CALL_CHARS:
+            pieces = self._stream_call(self.build_prompt(content, user_prompt),
+                                       self._cache_key(content, user_prompt, use_cache))
+            return AnalysisStream(pieces, {'chunks': 1, 'chunks_analyzed': 1})
+        
+        chunks, selected = self._plan_chunks(content, user_prompt, relevance_filter)
+        pieces = self._stream_map_reduce(chunks, selected, user_prompt, use_cache)
+        return AnalysisStream(pieces, {'chunks': len(chunks), 'chunks_analyzed': len(selected)})
+    
+    def analyze_any(self, content: str, user_prompt: str, use_cache: bool = True,
+                    relevance_filter: bool = False) -> tuple[str, dict]:
+        """
+        Single call for pages that fit the budget, map-reduce for longer ones.
+        Returns: (analysis, chunk_stats)
+        """
+        if len(content) <= self.SINGLE_CALL_CHARS:
+            return self.analyze_content(content, user_prompt, use_cache=use_cache), {'chunks': 1, 'chunks_analyzed': 1}
+        return self.analyze_chunked(content, user_prompt, use_cache=use_cache, relevance_filter=relevance_filter)
+    
+    async def analyze_any_async(self, content: str, user_prompt: str, use_cache: bool = True,
+                                relevance_filter: bool = False,
+                                llm_slots: Optional[asyncio.Semaphore] = None) -> tuple[str, dict]:
+        if len(content) <= self.SINGLE_CALL_CHARS:
+            analysis = await self.analyze_content_async(content, user_prompt, use_cache=use_cache,
+                                                        llm_slots=llm_slots)
+            return analysis, {'chunks': 1, 'chunks_analyzed': 1}
+        return await self.analyze_chunked_async(content, user_prompt, use_cache=use_cache,
+                                                relevance_filter=relevance_filter, llm_slots=llm_slots)
+    
+    @staticmethod
+    def build_prompt(content: str, user_prompt: str) -> str:
+        """Construct the analysis prompt"""
+        return f"""
+            You are a helpful web content analyst. Please analyze the following webpage content and respond to the user's request.
+            
+            User Request: {user_prompt}
+            
+            Webpage Content:
+            {content}
+            
+            Instructions:
+            - Focus specifically on what the user asked for
+            - Provide clear, structured information
+            - If the requested information isn't available, say so clearly
+            - Be concise but comprehensive
+            - Use bullet points or numbered lists when appropriate
+            """
+    
+    @staticmethod
+    def build_map_prompt(chunk: str, user_prompt: str, part: int, total: int) -> str:
+        """Prompt for one chunk of a long page (map step)"""
+        return f"""
+            You are a helpful web content analyst. Below is part {part} of {total} of a long webpage.
+            
+            User Request: {user_prompt}
+            
+            Webpage Content (part {part} of {total}):
+            {chunk}
+            
+            Instructions:
+            - Extract only what is relevant to the user's request from this part
+            - Keep facts, names, numbers and quotes exactly as written
+            - If this part contains nothing relevant, reply with exactly: {NO_RELEVANT_INFO}
+            """
+    
+    @staticmethod
+    def build_reduce_prompt(partials: list, user_prompt: str) -> str:
+        """Prompt merging the per-chunk answers into one (reduce step)"""
+        notes = "\n\n".join(f"--- Notes from part {i} ---\n{partial}" for i, partial in enumerate(partials, 1))
+        return f"""
+            You are a helpful web content analyst. A long webpage was analyzed in parts and the notes
+            from each part are below. Combine them into a single answer to the user's request.
+            
+            User Request: {user_prompt}
+            
+            {notes}
+            
+            Instructions:
+            - Merge duplicates and keep the original order of the page where it matters
+            - Provide clear, structured information
+            - If the requested information isn't available, say so clearly
+            - Be concise but comprehensive
+            - Use bullet points or numbered lists when appropriate
+            """
+    
+    def _plan_chunks(self, content: str, user_prompt: str, relevance_filter: bool,
+                     max_chunks: int = None) -> tuple[list, list]:
+        chunks = split_into_chunks(content, self.CHUNK_TOKENS)
+        if relevance_filter or max_chunks:
+            selected = select_relevant(chunks, user_prompt, max_chunks=max_chunks,
+                                       min_score=0.0 if relevance_filter else -1.0)
+        else:
+            selected = list(range(len(chunks)))
+        logger.info(f"Map-reduce: {len(selected)} of {len(chunks)} chunks selected")
+        return chunks, selected
+    
+    def _map_calls(self, chunks: list, selected: list, user_prompt: str, use_cache: bool) -> list:
+        """(prompt, cache_key) for every selected chunk"""
+        total = len(chunks)
+        return [
+            (self.build_map_prompt(chunks[i], user_prompt, i + 1, total),
+             self._cache_key(chunks[i], f"[map {i + 1}/{total}] {user_prompt}", use_cache))
+            for i in selected
+        ]
+    
+    def _reduce_call(self, partials: list, user_prompt: str, use_cache: bool):
+        """(prompt, cache_key) for the reduce step, or the final answer when no merge is needed"""
+        relevant = [partial for partial in partials if NO_RELEVANT_INFO not in partial]
+        if not relevant:
+            return "The requested information isn't available on this page."
+        if len(relevant) == 1:
+            return relevant[0]
+        prompt = self.build_reduce_prompt(relevant, user_prompt)
+        return prompt, self._cache_key("\n".join(relevant), f"[reduce] {user_prompt}", use_cache)
+    
+    def _run_map(self, map_calls: list) -> list:
+        with ThreadPoolExecutor(max_workers=self.MAP_CONCURRENCY) as pool:
+            return list(pool.map(lambda call: self._complete(*call), map_calls))
+    
+    def _stream_map_reduce(self, chunks: list, selected: list, user_prompt: str, use_cache: bool) -> Iterator[str]:
+        try:
+            partials = self._run_map(self._map_calls(chunks, selected, user_prompt, use_cache))
+            reduce_call = self._reduce_call(partials, user_prompt, use_cache)
+        except Exception as e:
+            error_msg = f"ERROR: AI Analysis error: {str(e)}"
+            logger.error(error_msg)
+            yield error_msg
+            return
+        
+        if isinstance(reduce_call, str):
+            yield reduce_call
+        else:
+            yield from self._stream_call(*reduce_call)
+    
+    def _stream_call(self, prompt: str, key: str) -> Iterator[str]:
+        """One streamed model call; the full answer is cached once it is complete"""
+        cached = self._cached(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        start = time.perf_counter()
+        pieces = []
+        tokens = None
+        try:
+            for chunk in self.llm.stream(self._messages(prompt)):
+                tokens = usage_tokens(chunk) or tokens
+                if chunk.content:
+                    pieces.append(chunk.content)
+                    yield chunk.content
+        except Exception as e:
+            error_msg = f"ERROR: AI Analysis error: {str(e)}"
+            logger.error(error_msg)
+            self.metrics.inc("stage_errors_total", scraper="ai", stage="llm")
+            yield ("\n\n" if pieces else "") + error_msg
+            return
+        
+        latency = time.perf_counter() - start
+        self.metrics.observe("stage_seconds", latency, scraper="ai", stage="llm")
+        self._remember(key, prompt, "".join(pieces), latency, tokens)
+    
+    def _complete(self, prompt: str, key: str) -> str:
+        """One model call, answered from the LLM cache when possible"""
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        
+        start = time.perf_counter()
+        with self.metrics.span("llm", scraper="ai"):
+            response = self.llm.invoke(self._messages(prompt))
+        self._remember(key, prompt, response.content, time.perf_counter() - start, usage_tokens(response))
+        return response.content
+    
+    async def _complete_async(self, prompt: str, key: str, llm_slots: Optional[asyncio.Semaphore] = None) -> str:
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        if llm_slots is None:
+            return await self._invoke_async(prompt, key)
+        async with llm_slots:
+            return await self._invoke_async(prompt, key)
+    
+    async def _invoke_async(self, prompt: str, key: str) -> str:
+        start = time.perf_counter()
+        with self.metrics.span("llm", scraper="ai"):
+            response = await self.llm.ainvoke(self._messages(prompt))
+        self._remember(key, prompt, response.content, time.perf_counter() - start, usage_tokens(response))
+        return response.content
+    
+    def _cache_key(self, content: str, user_prompt: str, use_cache: bool) -> str:
+        if self.llm_cache is None or not use_cache:
+            return ""
+        return analysis_key(self.model_name, self.temperature, content, user_prompt)
+    
+    def _cached(self, key: str) -> Optional[str]:
+        cached = self.llm_cache.get(key) if key else None
+        self.metrics.inc("llm_calls_total", scraper="ai", cache="hit" if cached is not None else "miss")
+        return cached
+    
+    def _remember(self, key: str, prompt: str, answer: str, latency: float, tokens: Optional[int] = None):
+        if tokens is None:
+            tokens = estimate_tokens(prompt) + estimate_tokens(answer)
+        self.metrics.inc("llm_tokens_total", tokens, scraper="ai")
+        if key:
+            self.llm_cache.put(key, answer, latency, tokens)
+    
+    @staticmethod
+    def _messages(prompt: str) -> list:
+        if HumanMessage is None:
+            return [prompt]
+        return [HumanMessage(content=prompt)]
+    
+    def scrape_and_analyze(self, url: str, user_prompt: str, use_cache: bool = True,
+                           relevance_filter: bool = False, content_mode: str = None) -> dict:
+        """
+        Complete pipeline: scrape webpage and analyze with user prompt
+        """
+        start_time = time.time()
+        
+        # Step 1: Fetch the full content (long pages are chunked, not truncated)
+        page = self.fetch_page(url, max_chars=None, content_mode=content_mode)
+        content = page['content']
+        fetch_time = time.time() - start_time
+        
+        # Step 2: Analyze with Gemini
+        chunk_stats = {'chunks': 0, 'chunks_analyzed': 0}
+        if content:
+            with self.metrics.span("analyze", scraper="ai"):
+                analysis, chunk_stats = self.analyze_any(content, user_prompt, use_cache=use_cache,
+                                                         relevance_filter=relevance_filter)
+        else:
+            analysis = "Cannot analyze - no content retrieved."
+        
+        processing_time = time.time() - start_time
+        
+        return {
+            'content': content,
+            'analysis': analysis,
+            'fetch_status': page['fetch_status'],
+            'extraction': page['extraction'],
+            'chars_saved': page['chars_saved'],
+            'tokens_saved': page['tokens_saved'],
+            'processing_time': round(processing_time, 2),
+            'fetch_time': round(fetch_time, 3),
+            'content_length': len(content),
+            **chunk_stats,
+        }
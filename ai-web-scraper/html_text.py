@@ -0,0 +1,222 @@
+"""
+HTML-to-text extraction backends for fetch_webpage.
+
+Every backend produces the same shape of output as the original
+BeautifulSoup path: visible text with script/style/nav/footer removed, one
+stripped non-empty line per line break, and at most `max_chars` characters.
+
+    bs4        -- BeautifulSoup + html.parser (original behaviour, slowest)
+    lxml       -- libxml2 tree, unwanted subtrees stripped in C, lazy itertext
+    selectolax -- lexbor tree, unwanted subtrees stripped in C
+    stream     -- stdlib tokenizer, no tree at all: unwanted subtrees are
+                  skipped while parsing and input stops once the budget is full
+    auto       -- selectolax, then lxml, then stream, whichever is installed
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as LexborParser
+except ImportError:
+    LexborParser = None
+
+DROP_TAGS = ("script", "style", "nav", "footer")
+
+# Input is fed to the streaming tokenizer in slices this big
+STREAM_SLICE = 16 * 1024
+
+# Everything str.splitlines() treats as a line boundary
+_LINE_BREAK = re.compile('[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+
+def available_backends() -> List[str]:
+    backends = ["bs4", "stream"]
+    if lxml is not None:
+        backends.append("lxml")
+    if LexborParser is not None:
+        backends.append("selectolax")
+    return backends
+
+
+def resolve_backend(backend: str) -> str:
+    if backend != "auto":
+        if backend not in available_backends():
+            raise ValueError(f"Extraction backend '{backend}' is not available "
+                             f"(installed: {', '.join(available_backends())})")
+        return backend
+    if LexborParser is not None:
+        return "selectolax"
+    if lxml is not None:
+        return "lxml"
+    return "stream"
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Charset explicitly declared in a Content-Type header, if any"""
+    if not content_type:
+        return None
+    match = re.search(r'charset=["\']?([\w\-]+)', content_type, re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def decode_html(html: Union[bytes, str], encoding: Optional[str] = None) -> str:
+    """Declared encoding, else a <meta charset>, else UTF-8"""
+    if isinstance(html, str):
+        return html
+    if not encoding:
+        match = _META_CHARSET.search(html[:4096])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return html.decode(encoding, errors='replace')
+    except LookupError:
+        return html.decode('utf-8', errors='replace')
+
+
+class _LineAssembler:
+    """
+    Turns a stream of text fragments into stripped, non-empty lines.
+
+    With `max_line` set, a pending line is emitted early once it holds more
+    than max_line characters, so one huge unbroken line cannot defeat the
+    character budget (the caller truncates and stops right after it).
+    """
+
+    def __init__(self, max_line: Optional[int] = None):
+        self.max_line = max_line
+        self._pending: List[str] = []
+        self._pending_chars = 0
+
+    def feed(self, text: str) -> List[str]:
+        if not _LINE_BREAK.search(text):
+            # Common case: no line break yet - buffer without re-joining
+            self._pending.append(text)
+            self._pending_chars += len(text)
+            if self.max_line and self._pending_chars > self.max_line:
+                line = "".join(self._pending).strip()
+                if len(line) > self.max_line:
+                    self._pending, self._pending_chars = [], 0
+                    return [line]
+            return []
+
+        self._pending.append(text)
+        parts = "".join(self._pending).splitlines(True)
+        last = parts[-1]
+        if last.splitlines()[0] == last:
+            self._pending, self._pending_chars = [last], len(last)
+            parts = parts[:-1]
+        else:
+            self._pending, self._pending_chars = [], 0
+        return [line.strip() for line in parts if line.strip()]
+
+    def close(self) -> List[str]:
+        line = "".join(self._pending).strip()
+        self._pending, self._pending_chars = [], 0
+        return [line] if line else []
+
+
+def lines_from_fragments(fragments: Iterable[str], max_line: Optional[int] = None) -> Iterator[str]:
+    assembler = _LineAssembler(max_line)
+    for fragment in fragments:
+        yield from assembler.feed(fragment)
+    yield from assembler.close()
+
+
+class _StreamingTextParser(HTMLParser):
+    """Collects visible text, skipping DROP_TAGS subtrees as they are tokenized"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.fragments: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in DROP_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.fragments.append(data)
+
+    def take(self) -> List[str]:
+        fragments, self.fragments = self.fragments, []
+        return fragments
+
+
+def _stream_lines(html: str, max_chars: Optional[int]) -> Iterator[str]:
+    parser = _StreamingTextParser()
+    assembler = _LineAssembler(max_chars)
+    for start in range(0, len(html), STREAM_SLICE):
+        parser.feed(html[start:start + STREAM_SLICE])
+        for fragment in parser.take():
+            yield from assembler.feed(fragment)
+    parser.close()
+    for fragment in parser.take():
+        yield from assembler.feed(fragment)
+    yield from assembler.close()
+
+
+def _lxml_lines(html: Union[bytes, str], encoding: Optional[str], max_chars: Optional[int]) -> Iterator[str]:
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding and isinstance(html, bytes) else None
+    root = lxml.html.document_fromstring(html, parser=parser)
+    lxml.etree.strip_elements(root, *DROP_TAGS, with_tail=False)
+    # Comments and processing instructions are not visible text
+    lxml.etree.strip_elements(root, lxml.etree.Comment, lxml.etree.ProcessingInstruction, with_tail=False)
+    return lines_from_fragments(root.itertext(), max_chars)
+
+
+def _selectolax_lines(html: Union[bytes, str], encoding: Optional[str]) -> Iterator[str]:
+    tree = LexborParser(decode_html(html, encoding))
+    tree.strip_tags(list(DROP_TAGS))
+    root = tree.root
+    text = root.text(separator='') if root is not None else ""
+    return (line.strip() for line in text.splitlines() if line.strip())
+
+
+def _bs4_lines(html: Union[bytes, str], encoding: Optional[str]) -> Iterator[str]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding if isinstance(html, bytes) else None)
+    for element in soup(list(DROP_TAGS)):
+        element.decompose()
+    return (line.strip() for line in soup.get_text().splitlines() if line.strip())
+
+
+def extract_text(html: Union[bytes, str], backend: str = "auto", max_chars: Optional[int] = None,
+                 encoding: Optional[str] = None) -> Tuple[str, bool]:
+    """
+    Visible text of `html`, one line per block.
+    Returns: (text, truncated) - text is cut to max_chars when truncated
+    """
+    backend = resolve_backend(backend)
+    if backend == "stream":
+        lines = _stream_lines(decode_html(html, encoding), max_chars)
+    elif backend == "lxml":
+        lines = _lxml_lines(html, encoding, max_chars)
+    elif backend == "selectolax":
+        lines = _selectolax_lines(html, encoding)
+    else:
+        lines = _bs4_lines(html, encoding)
+
+    kept: List[str] = []
+    size = -1  # no newline before the first line
+    for line in lines:
+        size += len(line) + 1
+        kept.append(line)
+        if max_chars and size > max_chars:
+            # Stop pulling lines - the streaming backend stops parsing here too
+            return "\n".join(kept)[:max_chars], True
+    return "\n".join(kept), False
@@ -0,0 +1,125 @@
+"""
+Content-addressed cache for LLM analyses.
+
+The key is a hash of (model, temperature, normalized page content, normalized
+user prompt), so re-asking the same question about an unchanged page returns
+the stored answer instead of a model round trip. Entries expire after `ttl`
+seconds and the least recently used ones are evicted beyond `max_entries`.
+Hits add the original call's latency and token count to the savings counters.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry"""
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def analysis_key(model: str, temperature: float, content: str, user_prompt: str) -> str:
+    payload = json.dumps([model, temperature, normalize_text(content), normalize_text(user_prompt)])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Persistent SQLite store of analysis results.
+
+    cache_dir   -- directory holding llm_cache.db
+    ttl         -- seconds an answer stays valid
+    max_entries -- LRU bound on the number of stored answers
+    """
+
+    def __init__(self, cache_dir: str = ".llm_cache", ttl: float = 7 * 24 * 3600,
+                 max_entries: int = 10_000):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "llm_cache.db")
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+        self.tokens_saved = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS analyses (
+                key         TEXT PRIMARY KEY,
+                response    TEXT NOT NULL,
+                latency     REAL NOT NULL,
+                tokens      INTEGER NOT NULL,
+                stored_at   REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS analyses_lru ON analyses (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Stored answer for `key`, or None when missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, latency, tokens, stored_at FROM analyses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[3] >= self.ttl:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE analyses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            self.latency_saved += row[1]
+            self.tokens_saved += row[2]
+            return row[0]
+
+    def put(self, key: str, response: str, latency: float, tokens: int):
+        """Store an answer with what it cost to produce"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, response, latency, tokens, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'latency_saved': round(self.latency_saved, 3),
+            'tokens_saved': self.tokens_saved,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM analyses")
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM analyses WHERE stored_at <= ?", (now - self.ttl,))
+        count = self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM analyses WHERE key IN "
+                "(SELECT key FROM analyses ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
@@ -0,0 +1,155 @@
+"""
+Readability-style main-content extraction.
+
+Menus, cookie banners, sidebars and footers are removed and the block with
+the densest, least link-heavy text is kept:
+
+1. boilerplate tags and elements whose class/id looks like chrome (nav,
+   cookie, sidebar, share...) are dropped, unless they also look like content
+2. every paragraph-like element scores 1 + commas + up to 3 for length, added
+   to its parent and half to its grandparent
+3. each candidate's score is scaled by (1 - link density) and by its text
+   density (characters per element), so link lists and card grids lose
+4. the best candidate plus siblings that score nearly as well are kept
+
+When nothing scores convincingly the caller falls back to the full page text.
+Needs lxml; without it extract_main_content always returns None.
+"""
+
+import re
+from typing import Dict, Optional, Union
+
+from html_text import decode_html, lines_from_fragments
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "header", "aside", "form",
+                    "noscript", "iframe", "button", "select", "svg", "template")
+PARAGRAPH_TAGS = ("p", "pre", "td", "blockquote", "li", "dd")
+KEEP_TAGS = ("html", "body", "main", "article")
+
+UNLIKELY = re.compile(
+    r"\bads?\b|banner|breadcrumb|combx|comment|community|consent|cookie|disqus|footer|gdpr|"
+    r"header|\bmenu|modal|\bnav|newsletter|pager|pagination|popup|promo|related|share|"
+    r"sidebar|skyscraper|social|sponsor|subscribe|widget", re.IGNORECASE)
+LIKELY = re.compile(r"article|blog|body|content|entry|main|post|story|text", re.IGNORECASE)
+
+TAG_WEIGHTS = {"article": 10, "main": 10, "div": 5, "section": 3, "pre": 3, "td": 3, "blockquote": 3}
+
+# Below this many characters the winner is not trusted
+MIN_CONTENT_CHARS = 250
+# Characters per element at which the text-density factor stops penalizing
+DENSE_TEXT = 40.0
+
+
+def _class_weight(element) -> int:
+    names = f"{element.get('class', '')} {element.get('id', '')}"
+    weight = 0
+    if UNLIKELY.search(names):
+        weight -= 25
+    if LIKELY.search(names):
+        weight += 25
+    return weight
+
+
+def _text_length(element) -> int:
+    return len(" ".join(element.text_content().split()))
+
+
+def link_density(element) -> float:
+    """Share of the element's text that sits inside links"""
+    total = _text_length(element)
+    if not total:
+        return 1.0
+    return sum(_text_length(link) for link in element.iter("a")) / total
+
+
+def text_density(element) -> float:
+    """Characters of text per descendant element"""
+    return _text_length(element) / (sum(1 for _ in element.iter()) or 1)
+
+
+def _drop_boilerplate(root):
+    lxml.etree.strip_elements(root, *BOILERPLATE_TAGS, with_tail=False)
+    lxml.etree.strip_elements(root, lxml.etree.Comment, lxml.etree.ProcessingInstruction, with_tail=False)
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str) or element.tag in KEEP_TAGS:
+            continue
+        names = f"{element.get('class', '')} {element.get('id', '')}"
+        if UNLIKELY.search(names) and not LIKELY.search(names) and element.getparent() is not None:
+            element.drop_tree()
+
+
+def _score_candidates(root) -> Dict:
+    scores: Dict = {}
+
+    def candidate(element):
+        if element not in scores:
+            scores[element] = TAG_WEIGHTS.get(element.tag, 0) + _class_weight(element)
+        return element
+
+    for paragraph in root.iter(*PARAGRAPH_TAGS):
+        length = _text_length(paragraph)
+        if length < 25:
+            continue
+        score = 1 + paragraph.text_content().count(",") + min(length // 100, 3)
+        parent = paragraph.getparent()
+        if parent is None:
+            continue
+        scores[candidate(parent)] += score
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[candidate(grandparent)] += score / 2
+
+    for element in scores:
+        density_factor = min(1.0, text_density(element) / DENSE_TEXT)
+        scores[element] *= (1 - link_density(element)) * density_factor
+    return scores
+
+
+def extract_main_content(html: Union[bytes, str], encoding: Optional[str] = None,
+                         min_chars: int = MIN_CONTENT_CHARS) -> Optional[str]:
+    """Main content as stripped lines, or None when no block is convincing"""
+    if lxml is None:
+        return None
+
+    try:
+        root = lxml.html.document_fromstring(decode_html(html, encoding))
+    except (ValueError, lxml.etree.ParserError):
+        return None
+    _drop_boilerplate(root)
+    scores = _score_candidates(root)
+    if not scores:
+        return None
+
+    top = max(scores, key=scores.get)
+    threshold = max(10.0, scores[top] * 0.2)
+
+    # Keep siblings that score almost as well, or that are clean prose
+    blocks = [top]
+    parent = top.getparent()
+    if parent is not None:
+        blocks = []
+        for sibling in parent:
+            if sibling is top or scores.get(sibling, 0) >= threshold:
+                blocks.append(sibling)
+            elif sibling.tag == "p" and _text_length(sibling) > 80 and link_density(sibling) < 0.25:
+                blocks.append(sibling)
+
+    fragments = []
+    for block in blocks:
+        fragments.extend(block.itertext())
+        fragments.append("\n")
+    lines = list(lines_from_fragments(fragments))
+    if sum(len(line) for line in lines) < min_chars:
+        return None
+
+    # The page title is usually outside the content block but worth keeping
+    title = " ".join((root.findtext(".//title") or "").split())
+    if title and title != lines[0]:
+        lines.insert(0, title)
+    return "\n".join(lines)
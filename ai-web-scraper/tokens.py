@@ -0,0 +1,16 @@
+"""
+Token accounting helpers shared by the cache, the chunker and FakeLLM.
+"""
+
+from typing import Optional
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text (~4 characters per token)"""
+    return max(1, len(text) // 4) if text else 0
+
+
+def usage_tokens(response) -> Optional[int]:
+    """Total tokens reported by a chat-model response, if the model reports them"""
+    usage = getattr(response, 'usage_metadata', None) or {}
+    return usage.get('total_tokens')
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+🗃️ BENCHMARK: HTTPCache against a local stub server
+
+Fetches a set of pages three times - cold (misses), warm within the TTL
+(fresh hits, no network) and after the TTL has expired (conditional requests
+answered with 304) - and reports latency, server requests and bytes saved.
+
+Usage:
+    python benchmarks/bench_http_cache.py --pages 20 --size 200000 --latency 0.05
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraping_common.http_cache import HTTPCache  # noqa: E402
+from scraping_common.stub_server import StubServer, static_routes  # noqa: E402
+
+
+def run_pass(cache: HTTPCache, session: requests.Session, urls: list) -> float:
+    start = time.perf_counter()
+    for url in urls:
+        response = cache.fetch(url, lambda extra, url=url: session.get(url, headers=extra, timeout=10))
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP cache hit/revalidation benchmark")
+    parser.add_argument('--pages', type=int, default=20, help="distinct URLs")
+    parser.add_argument('--size', type=int, default=200_000, help="body size in bytes")
+    parser.add_argument('--latency', type=float, default=0.05, help="stub latency in seconds")
+    args = parser.parse_args()
+
+    pages = {f'/page/{i}': (f'<html><body>page {i} '.encode() + b'x' * args.size) for i in range(args.pages)}
+
+    with StubServer(static_routes(pages), latency=args.latency) as server, \
+            tempfile.TemporaryDirectory() as cache_dir:
+        urls = [server.url(path) for path in pages]
+        cache = HTTPCache(cache_dir, ttl=60)
+        session = requests.Session()
+
+        timings = []
+        for label in ('cold', 'warm (fresh)'):
+            before = server.requests
+            timings.append((label, run_pass(cache, session, urls), server.requests - before))
+
+        cache.ttl = 0  # every entry is now stale and must be revalidated
+        before = server.requests
+        timings.append(('revalidate', run_pass(cache, session, urls), server.requests - before))
+        cache.close()
+
+    print("🗃️ HTTP CACHE BENCHMARK")
+    print("=" * 50)
+    print(f"Pages: {args.pages} x {args.size:,} bytes | Stub latency: {args.latency}s")
+    for label, elapsed, requests_made in timings:
+        print(f"   {label:14}: {elapsed * 1000:8.1f} ms ({requests_made} server requests)")
+    stats = cache.stats()
+    print(f"   hits={stats['hits']} revalidated={stats['revalidated']} misses={stats['misses']} "
+          f"hit_rate={stats['hit_rate']:.0%} bytes_saved={stats['bytes_saved']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+🔌 BENCHMARK: per-request latency with and without connection reuse
+
+Fetches the same URL repeatedly with a bare `requests.get` (new connection
+every time) and with PooledHTTPClient (keep-alive pool), and reports the
+median latency of the repeat fetches. Runs against the local stub server by
+default, with --handshake standing in for the TCP/TLS setup of a remote host;
+pass --url to measure a real HTTPS site instead.
+
+Usage:
+    python benchmarks/bench_keepalive.py --requests 50 --handshake 0.03
+    python benchmarks/bench_keepalive.py --url https://example.com --requests 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraping_common.http_client import PooledHTTPClient  # noqa: E402
+from scraping_common.stub_server import StubServer, static_routes  # noqa: E402
+
+
+def time_fetches(get, url: str, count: int) -> list:
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        get(url, timeout=10).raise_for_status()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list):
+    first, repeat = timings[0], timings[1:]
+    print(f"   {label:22}: first {first * 1000:7.2f} ms | "
+          f"repeat median {statistics.median(repeat) * 1000:7.2f} ms")
+    return statistics.median(repeat)
+
+
+def run(url: str, count: int):
+    cold = time_fetches(requests.get, url, count)
+    with PooledHTTPClient() as client:
+        pooled = time_fetches(client.get, url, count)
+        protocol = client.protocol
+
+    print(f"URL: {url} | {count} requests each")
+    cold_median = report("requests.get", cold)
+    pooled_median = report(f"pooled ({protocol})", pooled)
+    print(f"   saved per repeat fetch: {(cold_median - pooled_median) * 1000:.2f} ms "
+          f"({cold_median / pooled_median:.1f}x faster)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep-alive connection reuse benchmark")
+    parser.add_argument('--url', help="real URL to fetch instead of the local stub")
+    parser.add_argument('--requests', type=int, default=50, help="fetches per client")
+    parser.add_argument('--handshake', type=float, default=0.03,
+                        help="stub delay per new connection in seconds")
+    args = parser.parse_args()
+
+    print("🔌 KEEP-ALIVE BENCHMARK")
+    print("=" * 50)
+    if args.url:
+        run(args.url, args.requests)
+        return
+
+    page = b'<html><body>' + b'hello world ' * 2000 + b'</body></html>'
+    with StubServer(static_routes({'/': page}, validators=False), connect_latency=args.handshake) as server:
+        run(server.url('/'), args.requests)
+        print(f"   connections opened: {server.connections} for {2 * args.requests} requests")
+
+
+if __name__ == "__main__":
+    main()
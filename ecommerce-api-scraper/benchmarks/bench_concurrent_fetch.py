@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+⚡ BENCHMARK: serial vs concurrent page fetching
+
+Starts a local stub of the sponsored-products API (fixed latency per request,
+products on pages 1..N and an empty page after that) and times
+search_products_ultimate with one page in flight versus a concurrent window.
+
+Usage:
+    python benchmarks/bench_concurrent_fetch.py --pages 6 --latency 0.3
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ecommerce_api_scraper import ECommerceAPIScraperV12_UltimateEdition  # noqa: E402
+from scraping_common.rate_limiter import HostRateLimiter  # noqa: E402
+from strategy_board import StrategyScoreboard  # noqa: E402
+
+
+def make_stub_handler(last_page: int, latency: float, products_per_page: int):
+    """Build a request handler that mimics the ads API"""
+
+    class StubAPIHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query.get('page', ['1'])[0])
+            time.sleep(latency)
+
+            ads = []
+            if page <= last_page:
+                ads.append({'products': [
+                    {
+                        'productId': f'P{page:03d}{i:03d}',
+                        'name': f'Stub Laptop {page}-{i}',
+                        'brand': 'Stub',
+                        'price': {'value': 1000.0 + i},
+                        'originalPrice': {'value': 1100.0 + i},
+                        'discountRate': 9,
+                        'merchantName': 'Stub Store',
+                        'listingId': f'L{page:03d}{i:03d}',
+                    }
+                    for i in range(products_per_page)
+                ]})
+
+            body = json.dumps({'ads': ads}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubAPIHandler
+
+
+def run_once(base_url: str, pages: int, window: int, rate: float) -> tuple:
+    # Fresh limiter per run so both runs start with the same host budget
+    limiter = HostRateLimiter(rate=rate, burst=2, jitter=0.0, max_rate=rate)
+    scraper = ECommerceAPIScraperV12_UltimateEdition(
+        base_url=base_url, max_concurrent_pages=window, rate_limiter=limiter,
+        strategy_board=StrategyScoreboard(":memory:"),
+    )
+    start = time.perf_counter()
+    products = scraper.search_products_ultimate("laptop", pages=pages)
+    return time.perf_counter() - start, len(products)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs concurrent page fetching")
+    parser.add_argument('--pages', type=int, default=6, help="pages requested per search")
+    parser.add_argument('--last-page', type=int, default=None, help="last page with products (default: --pages)")
+    parser.add_argument('--latency', type=float, default=0.3, help="stub response latency in seconds")
+    parser.add_argument('--rate', type=float, default=8.0, help="per-host requests per second")
+    parser.add_argument('--window', type=int, default=4, help="concurrent pages in flight")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    handler = make_stub_handler(args.last_page or args.pages, args.latency, products_per_page=8)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+
+    try:
+        serial_time, serial_count = run_once(base_url, args.pages, 1, args.rate)
+        concurrent_time, concurrent_count = run_once(base_url, args.pages, args.window, args.rate)
+    finally:
+        server.shutdown()
+
+    print("⚡ CONCURRENT FETCH BENCHMARK")
+    print("=" * 50)
+    print(f"Pages: {args.pages} | Latency: {args.latency}s | Rate cap: {args.rate}/s")
+    print(f"   {'serial':12}: {serial_time:6.2f}s ({serial_count} products)")
+    print(f"   {f'window={args.window}':12}: {concurrent_time:6.2f}s ({concurrent_count} products)")
+    print(f"   {'speedup':12}: {serial_time / concurrent_time:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+🗜️ BENCHMARK: memory of product dicts vs compact ProductBatch storage
+
+Builds synthetic API pages (realistic repetition of brands, merchants,
+categories and tags) and measures the memory retained by the extracted
+products with tracemalloc.
+
+Usage:
+    python benchmarks/bench_product_memory.py --products 50000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ecommerce_api_scraper import ECommerceAPIScraperV12_UltimateEdition  # noqa: E402
+from strategy_board import StrategyScoreboard  # noqa: E402
+
+BRANDS = ['Acer', 'Apple', 'Asus', 'Casper', 'Dell', 'HP', 'Huawei', 'Lenovo', 'MSI', 'Samsung']
+MERCHANTS = ['Hepsiburada', 'TeknoMarket', 'Bilgisayar Dunyasi', 'Vatan', 'MediaPlus']
+TAGS = [f'campaign-tag-{i}' for i in range(60)]
+
+
+def make_pages(total_products: int, per_page: int = 24) -> list:
+    """Synthetic API responses shaped like the sponsored-products payload"""
+    rng = random.Random(42)
+    pages = []
+    for start in range(0, total_products, per_page):
+        products = []
+        for i in range(start, min(start + per_page, total_products)):
+            price = float(rng.randint(5000, 80000))
+            products.append({
+                'productId': f'HBC{i:010d}',
+                'name': f'{rng.choice(BRANDS)} Laptop Model {i} 16GB 512GB SSD 15.6" FHD',
+                'brand': rng.choice(BRANDS),
+                'price': {'value': price},
+                'originalPrice': {'value': price + rng.choice([0, 0, 500, 1500])},
+                'discountRate': rng.choice([0, 0, 3, 10]),
+                'imageUrl': f'https://productimages.example.net/s/{i}/{{size}}/{i}.jpg',
+                'productUrl': f'https://www.example.com/laptop-{i}-p-HBCV{i:010d}',
+                'merchantName': rng.choice(MERCHANTS),
+                'catalogName': 'Bilgisayar',
+                'sku': f'HBCV{i:010d}',
+                'mainCategoryId': '98',
+                'listingId': f'{i:08x}-0bfa-4c9a-b4af-d78d26c1635d',
+                'tags': rng.sample(TAGS, 20),
+            })
+        pages.append({'ads': [{'products': products}]})
+    return pages
+
+
+def measure(label: str, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return label, retained, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Product dict vs ProductBatch memory")
+    parser.add_argument('--products', type=int, default=50000, help="number of synthetic products")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    scraper = ECommerceAPIScraperV12_UltimateEdition(strategy_board=StrategyScoreboard(":memory:"))
+    pages = make_pages(args.products)
+
+    results = [
+        measure("dicts", lambda: [
+            product
+            for page, data in enumerate(pages, start=1)
+            for product in scraper._extract_products(data, page)
+        ]),
+        measure("ProductBatch", lambda: [
+            scraper._extract_product_batch(data, page)
+            for page, data in enumerate(pages, start=1)
+        ]),
+    ]
+
+    baseline = results[0][1]
+    print("🗜️ PRODUCT MEMORY BENCHMARK")
+    print("=" * 50)
+    print(f"Products: {args.products:,} across {len(pages):,} pages")
+    for label, retained, elapsed in results:
+        print(f"   {label:14}: {retained / 1024 / 1024:8.1f} MiB "
+              f"({retained / args.products:6.0f} B/product, {elapsed:5.2f}s, "
+              f"{baseline / retained:4.1f}x vs dicts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+🧱 Columnar (Parquet / Arrow IPC) output for scraped products
+
+Products are written with a fixed schema matching `_clean_product_data`
+(`tags` stays a real list column) into a hive-style partitioned layout:
+
+    <root_dir>/keyword=laptop/date=2025-08-27/part-<time>-<id>.parquet
+
+Every flushed buffer becomes one row group (or record batch), so files grow
+incrementally during the crawl and analytics can later read only the columns
+they need.
+"""
+
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # pyarrow not installed, columnar output unavailable
+
+STRING_FIELDS = (
+    'product_id', 'name', 'brand', 'currency', 'image_url', 'product_url',
+    'merchant_name', 'category', 'sku', 'main_category_id', 'listing_id',
+)
+FLOAT_FIELDS = ('price', 'original_price', 'discount_rate', 'savings')
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar output. Install it with: pip install pyarrow")
+
+
+def product_schema() -> "pa.Schema":
+    """Arrow schema for one cleaned product row (column order matches the CSV)"""
+    _require_pyarrow()
+    return pa.schema([
+        ('product_id', pa.string()),
+        ('name', pa.string()),
+        ('brand', pa.string()),
+        ('price', pa.float64()),
+        ('original_price', pa.float64()),
+        ('discount_rate', pa.float64()),
+        ('currency', pa.string()),
+        ('image_url', pa.string()),
+        ('product_url', pa.string()),
+        ('merchant_name', pa.string()),
+        ('category', pa.string()),
+        ('sku', pa.string()),
+        ('main_category_id', pa.string()),
+        ('listing_id', pa.string()),
+        ('tags', pa.list_(pa.string())),
+        ('savings', pa.float64()),
+        ('scraped_page', pa.int32()),
+        ('scraped_at', pa.timestamp('us')),
+    ])
+
+
+def products_to_table(products: List[Dict], schema: Optional["pa.Schema"] = None) -> "pa.Table":
+    """Convert cleaned product dicts to an Arrow table with the fixed schema"""
+    schema = schema or product_schema()
+    columns = {}
+    for name in STRING_FIELDS:
+        columns[name] = [None if p.get(name) is None else str(p.get(name)) for p in products]
+    for name in FLOAT_FIELDS:
+        columns[name] = [None if p.get(name) is None else float(p.get(name)) for p in products]
+    columns['tags'] = [list(p.get('tags') or []) for p in products]
+    columns['scraped_page'] = [p.get('scraped_page') for p in products]
+    columns['scraped_at'] = [
+        datetime.fromisoformat(p['scraped_at']) if p.get('scraped_at') else None for p in products
+    ]
+    return pa.Table.from_pydict(columns, schema=schema)
+
+
+class ColumnarProductWriter:
+    """
+    Stream products into a partitioned Parquet (or Arrow IPC) dataset.
+
+    Same interface as StreamingProductWriter (write_page / flush / close), so
+    it can be passed straight to stream_products_ultimate as the emitter.
+
+    fmt            -- 'parquet' or 'arrow' (Arrow IPC file, zero-copy reads)
+    row_group_size -- rows buffered before a row group is appended
+    """
+
+    EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow'}
+
+    def __init__(self, keyword: str, root_dir: str = "ecommerce_dataset", fmt: str = 'parquet',
+                 partition_date: Optional[str] = None, row_group_size: int = 10000,
+                 compression: str = 'zstd'):
+        _require_pyarrow()
+        if fmt not in self.EXTENSIONS:
+            raise ValueError(f"Unsupported columnar format: {fmt}")
+
+        partition_date = partition_date or datetime.now().strftime("%Y-%m-%d")
+        partition_dir = os.path.join(root_dir, f"keyword={keyword}", f"date={partition_date}")
+        os.makedirs(partition_dir, exist_ok=True)
+
+        part_name = f"part-{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.path = os.path.join(partition_dir, f"{part_name}.{self.EXTENSIONS[fmt]}")
+        self.fmt = fmt
+        self.row_group_size = row_group_size
+        self.schema = product_schema()
+        self.rows_written = 0
+        self.row_groups = 0
+
+        if fmt == 'parquet':
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=compression)
+        else:
+            self._sink = pa.OSFile(self.path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+        self._buffer: List[Dict] = []
+        self.closed = False
+
+    def write_page(self, products: Sequence[Dict]):
+        """Queue one page of products; appends a row group once the buffer is full"""
+        self._buffer.extend(products)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Append buffered rows as one row group"""
+        rows, self._buffer = self._buffer, []
+        if not rows:
+            return
+        self._writer.write_table(products_to_table(rows, self.schema))
+        self.rows_written += len(rows)
+        self.row_groups += 1
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self._writer.close()
+        if self.fmt == 'arrow':
+            self._sink.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_products(root_dir: str = "ecommerce_dataset", columns: Optional[Sequence[str]] = None,
+                  keyword: Optional[str] = None, fmt: str = 'parquet') -> "pa.Table":
+    """
+    Load a partitioned product dataset, reading only `columns` and, when
+    `keyword` is given, only that keyword's partition.
+    """
+    _require_pyarrow()
+    dataset = ds.dataset(root_dir, format='ipc' if fmt == 'arrow' else fmt, partitioning='hive')
+    row_filter = ds.field('keyword') == keyword if keyword else None
+    return dataset.to_table(columns=list(columns) if columns else None, filter=row_filter)
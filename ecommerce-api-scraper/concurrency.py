@@ -0,0 +1,101 @@
+"""
+🧵 Thread-safety helpers for the e-commerce scraper
+
+One scraper instance serves many keywords from a thread pool, so nothing it
+shares between threads may be mutated without a lock:
+
+- frozen_headers() -- read-only header sets; per-request changes go into a
+  fresh dict, never into the shared one
+- SessionPool      -- every request borrows a requests.Session that no other
+  thread is using (cookie jars and adapters are not thread-safe); sessions
+  are returned and reused, so keep-alive connections survive
+- AtomicCounter    -- counters updated from worker threads
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Iterator, List, Mapping, Optional
+
+import requests
+
+
+def frozen_headers(headers: Mapping[str, str]) -> Mapping[str, str]:
+    """Read-only view of a copy of `headers` (`.copy()` still gives a mutable dict)"""
+    return MappingProxyType(dict(headers))
+
+
+class AtomicCounter:
+    """Integer counter that is safe to increment from several threads"""
+
+    def __init__(self, value: int = 0):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def add(self, amount: int = 1) -> int:
+        with self._lock:
+            self._value += amount
+            return self._value
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def __int__(self) -> int:
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"AtomicCounter({self._value})"
+
+
+class SessionPool:
+    """
+    Up to `size` requests.Session objects, each used by one thread at a time.
+
+    Sessions are created on demand; when all of them are busy, borrowers
+    wait for one to come back. The most recently returned session is handed
+    out first, so its pooled connections are the ones kept warm.
+    """
+
+    def __init__(self, size: int, headers: Optional[Mapping[str, str]] = None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.headers = dict(headers or {})
+        self._idle: "queue.LifoQueue[requests.Session]" = queue.LifoQueue()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """Borrow a session for the duration of the block"""
+        session = self._acquire()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+
+    def _acquire(self) -> requests.Session:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._sessions) < self.size:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                self._sessions.append(session)
+                return session
+        return self._idle.get()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,155 @@
+"""
+📒 Resumable crawl journal
+
+A small SQLite journal records every completed (keyword, page, strategy)
+unit together with the page's products, committed as each page arrives. If a
+crawl crashes or bails out halfway, the next run for that keyword replays
+the journaled pages instead of fetching them again, skips straight to the
+missing pages and tries the strategy that last worked first.
+
+A keyword's crawl is finished once it reaches an empty page or has every
+requested page; the next run for a finished keyword starts from scratch.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from product_record import ProductBatch
+
+
+class CrawlJournal:
+    """
+    Durable record of completed pages per keyword.
+
+    Pages with products are stored as 'ok' with their products; an 'empty'
+    page marks the end of the listing, so pages after it are never requested.
+    """
+
+    def __init__(self, path: str = "ecommerce_crawl.db"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                keyword       TEXT NOT NULL,
+                page          INTEGER NOT NULL,
+                strategy      TEXT NOT NULL,
+                status        TEXT NOT NULL,
+                product_count INTEGER NOT NULL,
+                products      TEXT NOT NULL,
+                completed_at  REAL NOT NULL,
+                PRIMARY KEY (keyword, page)
+            );
+            CREATE TABLE IF NOT EXISTS keywords (
+                keyword       TEXT PRIMARY KEY,
+                strategy      TEXT,
+                finished      INTEGER NOT NULL DEFAULT 0,
+                updated_at    REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def begin(self, keyword: str) -> Dict[int, str]:
+        """
+        Start (or resume) a keyword's crawl. Returns {page: status} for the
+        pages already completed; a finished crawl is cleared and starts over
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT finished FROM keywords WHERE keyword = ?", (keyword,)).fetchone()
+            if row is not None and row[0]:
+                self._conn.execute("DELETE FROM pages WHERE keyword = ?", (keyword,))
+                self._conn.execute("UPDATE keywords SET finished = 0, updated_at = ? WHERE keyword = ?",
+                                   (time.time(), keyword))
+                self._conn.commit()
+                return {}
+            return dict(self._conn.execute("SELECT page, status FROM pages WHERE keyword = ?", (keyword,)))
+
+    def record_page(self, keyword: str, page: int, strategy: str, products: Sequence[Dict]):
+        """Commit one completed page; an empty `products` marks the end of the listing"""
+        rows = [dict(product) for product in products]
+        status = 'ok' if rows else 'empty'
+        now = time.time()
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               (keyword, page, strategy, status, len(rows),
+                                json.dumps(rows, ensure_ascii=False), now))
+            if rows:
+                # The strategy that last produced products is tried first on resume
+                self._conn.execute(
+                    "INSERT INTO keywords (keyword, strategy, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(keyword) DO UPDATE SET strategy = excluded.strategy, updated_at = excluded.updated_at",
+                    (keyword, strategy, now),
+                )
+            self._conn.commit()
+
+    def finish(self, keyword: str):
+        """Mark a keyword's crawl complete, so the next run starts over"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO keywords (keyword, finished, updated_at) VALUES (?, 1, ?) "
+                "ON CONFLICT(keyword) DO UPDATE SET finished = 1, updated_at = excluded.updated_at",
+                (keyword, time.time()),
+            )
+            self._conn.commit()
+
+    def reset(self, keyword: str):
+        """Forget everything journaled for a keyword"""
+        with self._lock:
+            self._conn.execute("DELETE FROM pages WHERE keyword = ?", (keyword,))
+            self._conn.execute("DELETE FROM keywords WHERE keyword = ?", (keyword,))
+            self._conn.commit()
+
+    def last_strategy(self, keyword: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT strategy FROM keywords WHERE keyword = ?", (keyword,)).fetchone()
+        return row[0] if row else None
+
+    def is_complete(self, keyword: str, pages: int) -> bool:
+        """
+        True when every page up to `pages` is journaled, or every page before
+        the end of the listing (the first empty page) is - a page that failed
+        before the end still has to be fetched
+        """
+        with self._lock:
+            done = dict(self._conn.execute(
+                "SELECT page, status FROM pages WHERE keyword = ? AND page <= ?", (keyword, pages)))
+        empty = [page for page, status in done.items() if status == 'empty']
+        last = min(empty) - 1 if empty else pages
+        return all(page in done for page in range(1, last + 1))
+
+    def pages(self, keyword: str) -> List[ProductBatch]:
+        """Journaled product pages of a keyword, in page order, as ProductBatches"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page, products FROM pages WHERE keyword = ? AND status = 'ok' ORDER BY page",
+                (keyword,),
+            ).fetchall()
+        batches = []
+        for page, payload in rows:
+            products = json.loads(payload)
+            batch = ProductBatch(page, products[0].get('scraped_at', ''), products[0].get('currency', 'TRY'))
+            for product in products:
+                batch.append(product)
+            batches.append(batch)
+        return batches
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pages, products = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(product_count), 0) FROM pages").fetchone()
+            keywords = self._conn.execute("SELECT COUNT(*) FROM keywords WHERE finished = 0").fetchone()[0]
+        return {'pages': pages, 'products': products, 'unfinished_keywords': keywords}
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
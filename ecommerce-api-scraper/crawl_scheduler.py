@@ -0,0 +1,81 @@
+"""
+🗓️ Multi-keyword crawl scheduler
+
+Runs many keywords at once on one scraper instance, so every keyword shares
+the scraper's connection pool, its global in-flight request cap and the
+per-host rate limiter. Each keyword's products are handed to the sink as soon
+as that keyword finishes instead of after the whole crawl. A keyword listed
+more than once is crawled (and reported) once.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+KeywordSink = Callable[[str, List[Dict]], None]
+
+
+@dataclass
+class CrawlReport:
+    """Totals and throughput for one scheduler run"""
+    keywords: int = 0
+    pages: int = 0
+    products: int = 0
+    elapsed: float = 0.0
+    product_counts: Dict[str, int] = field(default_factory=dict)
+    failed_keywords: List[str] = field(default_factory=list)
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def products_per_second(self) -> float:
+        return self.products / self.elapsed if self.elapsed else 0.0
+
+
+class KeywordCrawlScheduler:
+    """
+    Crawl keywords concurrently with `scraper.search_products_ultimate`.
+
+    max_concurrent_keywords bounds how many keywords run at once; the total
+    number of requests in flight is capped by the scraper itself
+    (`max_concurrent_requests`), and per-host pacing by its rate limiter.
+    """
+
+    def __init__(self, scraper, max_concurrent_keywords: int = 4):
+        self.scraper = scraper
+        self.max_concurrent_keywords = max_concurrent_keywords
+
+    def run(self, keywords: Iterable[str], pages: int, sink: KeywordSink) -> CrawlReport:
+        """Crawl every keyword and stream each result set to `sink`"""
+        report = CrawlReport()
+        pages_before = self.scraper.pages_fetched
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_keywords,
+                                thread_name_prefix="keyword") as executor:
+            futures = {
+                executor.submit(self.scraper.search_products_ultimate, keyword, pages): keyword
+                for keyword in dict.fromkeys(keywords)
+            }
+
+            for future in as_completed(futures):
+                keyword = futures[future]
+                report.keywords += 1
+                try:
+                    products = future.result()
+                    report.products += len(products)
+                    report.product_counts[keyword] = len(products)
+                    sink(keyword, products)
+                except Exception as e:
+                    logger.error(f"💥 Keyword '{keyword}' failed: {str(e)}")
+                    report.failed_keywords.append(keyword)
+
+        report.elapsed = time.perf_counter() - start
+        report.pages = self.scraper.pages_fetched - pages_before
+        return report
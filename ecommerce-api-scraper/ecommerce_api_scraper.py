@@ -1,16 +1,48 @@
 import requests
-import json
-import pandas as pd
-import time
-import random
-from typing import List, Dict, Optional
+import os
+import sys
+from typing import Callable, List, Dict, Mapping, Optional, Sequence
 import logging
+import threading
+import time
+from contextlib import closing, nullcontext
 from datetime import datetime
+from urllib.parse import urlparse
+
+from columnar_output import ColumnarProductWriter
+from concurrency import AtomicCounter, SessionPool, frozen_headers
+from crawl_journal import CrawlJournal
+from crawl_scheduler import KeywordCrawlScheduler
+from page_fetcher import ConcurrentPageFetcher, FetchCancelled, KeywordProgress, PageResult
+from product_analytics import ProductStats, summarize_products
+from product_record import ProductBatch
+from product_sink import StreamingProductWriter
+from product_store import ProductChangeStore
+from strategy_board import StrategyScoreboard
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Shared infrastructure lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_common.http_cache import HTTPCache
+from scraping_common.logging_setup import configure_logging
+from scraping_common.metrics import Metrics, shared_metrics
+from scraping_common.rate_limiter import HostRateLimiter, shared_rate_limiter
+
+# Set up logging (SCRAPER_LOG_LEVEL=DEBUG for per-page detail, SCRAPER_LOG_FORMAT=json)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Receives each page's products (a ProductBatch) as soon as they are extracted
+ProductEmitter = Callable[[Sequence[Dict]], None]
+
+STRATEGY_BANNERS = {
+    # 🎯 STRATEGY 1: Start with simple headers (your breakthrough!)
+    'SIMPLE': "🥇 STRATEGY 1: Simple Headers (Your Discovery)",
+    # 🔥 STRATEGY 2: Advanced headers (cURL backup)
+    'ADVANCED': "🥈 STRATEGY 2: Advanced Headers (cURL Power)",
+    # 🚨 STRATEGY 3: Dynamic approach
+    'DYNAMIC': "🥉 STRATEGY 3: Dynamic Multi-Session",
+}
+
 class ECommerceAPIScraperV12_UltimateEdition:
     """
     🏆 ULTIMATE EDITION V12 - Professional Grade API Scraper
@@ -23,16 +55,48 @@ class ECommerceAPIScraperV12_UltimateEdition:
     ✅ Anti-detection techniques
     """
     
-    def __init__(self):
-        self.base_url = "https://hepsiads-gw.hepsiburada.com/sponsored-brands/v2/display/api/v1"
+    DEFAULT_BASE_URL = "https://hepsiads-gw.hepsiburada.com/sponsored-brands/v2/display/api/v1"
+
+    def __init__(self, base_url: Optional[str] = None, max_concurrent_pages: int = 4,
+                 max_concurrent_requests: int = 8, rate_limiter: Optional[HostRateLimiter] = None,
+                 http_cache: Optional[HTTPCache] = None, metrics: Optional[Metrics] = None,
+                 journal: Optional[CrawlJournal] = None, strategy_board: Optional[StrategyScoreboard] = None,
+                 strategy_db: str = "ecommerce_strategies.db"):
+        self.base_url = base_url or self.DEFAULT_BASE_URL
+        self.host = urlparse(self.base_url).netloc
+        
+        # ⚡ CONCURRENCY: pages in flight per keyword, a global cap on requests
+        # in flight across keywords, and a per-host token bucket for pacing
+        self.max_concurrent_pages = max_concurrent_pages
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        
+        # 🗃️ CACHING: optional on-disk response cache with conditional requests
+        self.http_cache = http_cache
+        
+        # ⏱️ METRICS: per-stage timings and counters (no-op unless enabled)
+        self.metrics = metrics or shared_metrics
+        
+        # 📒 CHECKPOINTS: optional journal of completed pages, so a crashed or
+        # bailed-out crawl resumes where it stopped
+        self.journal = journal
+        
+        # 🧭 ADAPTIVE STRATEGY: per-host success/block/latency scores decide
+        # which header strategy each keyword starts with (kept across runs in
+        # `strategy_db` unless a StrategyScoreboard is passed; the scraper
+        # closes only a board it opened itself)
+        self._owns_strategy_board = strategy_board is None
+        self.strategy_board = strategy_board or StrategyScoreboard(strategy_db)
         
         # 🎯 BREAKTHROUGH: Simple headers work best!
-        self.simple_headers = {
+        # (header sets are read-only: every request builds its own dict)
+        self.simple_headers = frozen_headers({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        })
         
         # 🔥 ADVANCED: Your cURL headers as backup
-        self.advanced_headers = {
+        self.advanced_headers = frozen_headers({
             'accept': 'application/json, text/plain, */*',
             'accept-language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
             'authorization': 'Bearer undefined',
@@ -48,101 +112,264 @@ class ECommerceAPIScraperV12_UltimateEdition:
             'sec-fetch-mode': 'cors',
             'sec-fetch-site': 'same-site',
             'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36'
-        }
+        })
         
-        # 🛡️ PROFESSIONAL: Session management
-        self.session = requests.Session()
-        self.total_scraped = 0
+        # 🛡️ PROFESSIONAL: Session management - each request borrows a session
+        # no other thread is using, so one scraper can serve many keywords
+        self.session_pool = SessionPool(max_concurrent_requests)
+        self._products_scraped = AtomicCounter()
+        self._pages_fetched = AtomicCounter()
         self.start_time = datetime.now()
         
         logger.info("🚀 ECommerceAPIScraperV12 ULTIMATE EDITION initialized!")
         logger.info("💡 Strategy: Start simple, escalate if needed")
+    
+    @property
+    def total_scraped(self) -> int:
+        """Products handed out by every search on this instance so far"""
+        return self._products_scraped.value
+    
+    @property
+    def pages_fetched(self) -> int:
+        """Requests sent by every search on this instance so far (cache hits excluded)"""
+        return self._pages_fetched.value
+    
+    def close(self):
+        """Close the pooled sessions and the strategy scoreboard the scraper opened"""
+        self.session_pool.close()
+        if self._owns_strategy_board:
+            self.strategy_board.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def search_products_ultimate(self, keyword: str, pages: int = 10) -> List[Dict]:
         """
         🏆 ULTIMATE SEARCH METHOD - Multi-layer approach
         """
+        all_products = []
+        self.stream_products_ultimate(keyword, pages, all_products.extend)
+        return all_products
+    
+    def search_many(self, keywords: Sequence[str], pages: int = 10,
+                    max_concurrent_keywords: int = 4) -> Dict[str, List[Dict]]:
+        """
+        🧵 PARALLEL SEARCH - search_products_ultimate for many keywords at
+        once on one thread pool; every keyword shares this instance's session
+        pool, request cap and rate limiter. Returns {keyword: products} in the
+        order given (an empty list for a keyword that failed); repeated
+        keywords are crawled once
+        """
+        keywords = list(dict.fromkeys(keywords))
+        results: Dict[str, List[Dict]] = {}
+        scheduler = KeywordCrawlScheduler(self, max_concurrent_keywords=max_concurrent_keywords)
+        report = scheduler.run(keywords, pages, sink=results.__setitem__)
+        logger.info(f"🧵 {report.keywords} keywords: {report.products} products, "
+                    f"{report.pages_per_second:.2f} pages/s ({report.elapsed:.1f}s)")
+        return {keyword: results.get(keyword, []) for keyword in keywords}
+    
+    def search_products_compact(self, keyword: str, pages: int = 10) -> List[ProductBatch]:
+        """
+        🗜️ COMPACT SEARCH - same as search_products_ultimate, but keeps one
+        ProductBatch per page instead of a dict per product
+        """
+        batches = []
+        self.stream_products_ultimate(keyword, pages, batches.append)
+        return batches
+    
+    def search_products_incremental(self, keyword: str, pages: int,
+                                    store: ProductChangeStore) -> List[Dict]:
+        """
+        🔁 INCREMENTAL SEARCH - only products that are new or changed since
+        the store last saw them; duplicates within the run are dropped
+        """
+        changed_products = []
+        self.stream_products_ultimate(keyword, pages, store.filtering(changed_products.extend))
+        logger.info(f"🔁 '{keyword}': {store.new} new, {store.changed} changed, "
+                    f"{store.unchanged} unchanged, {store.duplicates} duplicates")
+        return changed_products
+    
+    def stream_products_ultimate(self, keyword: str, pages: int, emit: ProductEmitter) -> int:
+        """
+        🌊 STREAMING SEARCH - same multi-layer approach, but every page's
+        products go to `emit` (e.g. StreamingProductWriter.write_page) as soon
+        as they arrive instead of being collected. Returns the product count.
+        """
         logger.info(f"🎯 ULTIMATE SEARCH: '{keyword}' - {pages} pages")
         logger.info("=" * 60)
         
-        all_products = []
-        
-        # 🎯 STRATEGY 1: Start with simple headers (your breakthrough!)
-        logger.info("🥇 STRATEGY 1: Simple Headers (Your Discovery)")
-        products_simple = self._scrape_with_headers(keyword, pages, self.simple_headers, "SIMPLE")
-        
-        if products_simple:
-            logger.info(f"✅ SUCCESS with simple headers! Got {len(products_simple)} products")
-            return products_simple
-        
-        # 🔥 STRATEGY 2: Advanced headers (cURL backup)
-        logger.info("🥈 STRATEGY 2: Advanced Headers (cURL Power)")
-        products_advanced = self._scrape_with_headers(keyword, pages, self.advanced_headers, "ADVANCED")
-        
-        if products_advanced:
-            logger.info(f"✅ SUCCESS with advanced headers! Got {len(products_advanced)} products")
-            return products_advanced
-        
-        # 🚨 STRATEGY 3: Dynamic approach
-        logger.info("🥉 STRATEGY 3: Dynamic Multi-Session")
-        return self._scrape_dynamic(keyword, pages)
+        # 📒 RESUME: replay pages an interrupted run already journaled, fetch only the rest
+        progress = KeywordProgress(pages)
+        resumed = 0
+        if self.journal is not None:
+            journaled = self.journal.begin(keyword)
+            progress.done = {page for page in journaled if page <= pages}
+            for page, status in journaled.items():
+                if status == 'empty':
+                    progress.mark_end(page)
+            for batch in self.journal.pages(keyword):
+                if batch.page <= pages:
+                    emit(batch)
+                    resumed += len(batch)
+            if progress.done:
+                logger.info(f"📒 Resuming '{keyword}': {len(progress.done)} pages ({resumed} products) from the journal")
+            if self._crawl_complete(keyword, pages):
+                self._products_scraped.add(resumed)
+                return resumed
+        
+        # 🧭 ADAPTIVE: start with the strategy most likely to work on this host
+        order, probe = self.strategy_board.plan(self.host)
+        if self.journal is not None:
+            # The strategy that worked last time for this keyword goes first
+            last_strategy = self.journal.last_strategy(keyword)
+            order.sort(key=lambda strategy: strategy != last_strategy)
+        logger.info(f"🧭 Strategy scores for {self.host}: {self.strategy_board.describe(self.host)}")
+        
+        total_products = 0
+        if probe is not None and progress.remaining():
+            # A cheaper strategy lost its place a while ago: give it one page
+            logger.info(f"🔬 Re-probing {probe} on page {progress.remaining()[0]}")
+            count = self._run_strategy(probe, keyword, pages, emit, progress, limit=1)
+            total_products += count
+            order.remove(probe)
+            if count:
+                order.insert(0, probe)
+        
+        for strategy_name in order:
+            remaining = progress.remaining()
+            if not remaining:
+                break
+            logger.info(STRATEGY_BANNERS[strategy_name] +
+                        (f" - continuing at page {remaining[0]}" if remaining[0] > 1 else ""))
+            count = self._run_strategy(strategy_name, keyword, pages, emit, progress)
+            total_products += count
+            if count:
+                logger.info(f"✅ SUCCESS with {strategy_name.lower()} strategy! Got {count} products")
+        
+        self._crawl_complete(keyword, pages)
+        self._products_scraped.add(resumed + total_products)
+        return resumed + total_products
     
-    def _scrape_with_headers(self, keyword: str, pages: int, headers: Dict, strategy_name: str) -> List[Dict]:
-        """Scrape with specific headers"""
-        all_products = []
+    def _run_strategy(self, strategy_name: str, keyword: str, pages: int, emit: ProductEmitter,
+                      progress: KeywordProgress, limit: Optional[int] = None) -> int:
+        """Run one strategy on the pages `progress` still misses (at most `limit` of them)"""
+        if strategy_name == "DYNAMIC":
+            return self._scrape_dynamic(keyword, pages, emit, progress, limit)
+        headers = self.simple_headers if strategy_name == "SIMPLE" else self.advanced_headers
+        return self._scrape_with_headers(keyword, pages, headers, strategy_name, emit, progress, limit)
+    
+    def _crawl_complete(self, keyword: str, pages: int) -> bool:
+        """With a journal: mark the keyword finished once the end of the listing or every page is in"""
+        if self.journal is None or not self.journal.is_complete(keyword, pages):
+            return False
+        self.journal.finish(keyword)
+        return True
+    
+    def _scrape_with_headers(self, keyword: str, pages: int, headers: Dict, strategy_name: str,
+                             emit: ProductEmitter, progress: Optional[KeywordProgress] = None,
+                             limit: Optional[int] = None) -> int:
+        """
+        Scrape with specific headers, several pages in flight at once. With
+        `progress`, only the pages it still misses are fetched and the ones
+        handled here are marked done
+        """
+        total_products = 0
         failed_pages = 0
-        
-        for page in range(1, pages + 1):
-            try:
-                logger.info(f"📄 [{strategy_name}] Page {page}/{pages}")
-                
-                # Update referer for advanced headers
-                if 'referer' in headers:
-                    headers['referer'] = f'https://www.hepsiburada.com/ara?q={keyword}'
-                
-                url = f"{self.base_url}/{keyword}"
-                params = {'page': page, 'platform': 'desktop'}
-                
-                response = self.session.get(url, headers=headers, params=params, timeout=15)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    page_products = self._extract_products(data, page)
+        pages_ok = 0
+        progress = progress or KeywordProgress(pages)
+        
+        # Per-keyword copy so concurrent pages never touch the shared header sets
+        request_headers = dict(headers)
+        if 'referer' in request_headers:
+            request_headers['referer'] = f'https://www.hepsiburada.com/ara?q={keyword}'
+        request_headers = frozen_headers(request_headers)
+        
+        def fetch(page: int, stop_event) -> PageResult:
+            return self._fetch_page(keyword, page, pages, request_headers, strategy_name, stop_event)
+        
+        fetcher = ConcurrentPageFetcher(fetch, max_in_flight=self.max_concurrent_pages)
+        
+        # Results arrive in page order; leaving the loop cancels later pages
+        with self.metrics.span("strategy", scraper="ecommerce", strategy=strategy_name), \
+                closing(fetcher.fetch_in_order(progress.remaining()[:limit])) as results:
+            for result in results:
+                self.metrics.inc("pages_total", scraper="ecommerce", strategy=strategy_name, status=result.status)
+                if result.status != 'cancelled':
+                    self.strategy_board.record(self.host, strategy_name, result.status, result.elapsed)
+                if result.status in ('ok', 'empty'):
+                    progress.done.add(result.page)
+                    if self.journal is not None:
+                        self.journal.record_page(keyword, result.page, strategy_name, result.products)
+                if result.status == 'ok':
+                    emit(result.products)
+                    total_products += len(result.products)
+                    pages_ok += 1
+                    logger.debug("   ✅ Page %d: extracted %d products", result.page, len(result.products))
+                    failed_pages = 0  # Reset failure counter
                     
-                    if page_products:
-                        all_products.extend(page_products)
-                        logger.info(f"   ✅ Extracted {len(page_products)} products")
-                        failed_pages = 0  # Reset failure counter
-                    else:
-                        logger.info(f"   📭 No products on page {page} - might be end")
-                        break
-                        
-                elif response.status_code == 403:
+                elif result.status == 'empty':
+                    logger.debug("   📭 No products on page %d - might be end", result.page)
+                    progress.mark_end(result.page)
+                    break
+                    
+                elif result.status == 'blocked':
                     logger.warning(f"   🚨 403 Forbidden - {strategy_name} headers blocked!")
                     break
                     
                 else:
-                    logger.warning(f"   ⚠️ Status {response.status_code}")
+                    if result.error:
+                        logger.error(f"   💥 Error on page {result.page}: {result.error}")
+                    else:
+                        logger.warning(f"   ⚠️ Status {result.status_code} on page {result.page}")
                     failed_pages += 1
                     if failed_pages >= 3:
                         logger.error(f"   💥 Too many failures, switching strategy")
                         break
-                
-                # 🕐 Professional pacing
-                if page < pages:
-                    delay = random.uniform(1.5, 3.5)
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                logger.error(f"   💥 Error on page {page}: {str(e)}")
-                failed_pages += 1
-                if failed_pages >= 3:
-                    break
-                continue
         
-        return all_products
+        # One line per strategy run instead of one per page
+        logger.info(f"   📊 [{strategy_name}] '{keyword}': {total_products} products from {pages_ok} pages",
+                    extra={'fields': {'keyword': keyword, 'strategy': strategy_name,
+                                      'pages': pages_ok, 'products': total_products}})
+        return total_products
+    
+    def _fetch_page(self, keyword: str, page: int, pages: int, headers: Dict, strategy_name: str,
+                    stop_event) -> PageResult:
+        """Fetch and extract a single page (runs on a fetcher worker thread)"""
+        url = f"{self.base_url}/{keyword}"
+        params = {'page': page, 'platform': 'desktop'}
+        
+        start = time.perf_counter()
+        
+        try:
+            if stop_event.is_set():
+                return PageResult(page=page, status='cancelled')
+            
+            logger.debug("📄 [%s] Page %d/%d", strategy_name, page, pages)
+            
+            response = self._get(None, url, stop_event=stop_event, headers=headers, params=params)
+            
+            if response.status_code == 200:
+                page_products = self._extract_product_batch(response.json(), page)
+                status = 'ok' if page_products else 'empty'
+                return PageResult(page=page, status=status, products=page_products, status_code=200,
+                                  elapsed=time.perf_counter() - start)
+            
+            if response.status_code == 403:
+                return PageResult(page=page, status='blocked', status_code=403, elapsed=time.perf_counter() - start)
+            
+            return PageResult(page=page, status='error', status_code=response.status_code,
+                              elapsed=time.perf_counter() - start)
+            
+        except FetchCancelled:
+            return PageResult(page=page, status='cancelled')
+        except Exception as e:
+            return PageResult(page=page, status='error', error=str(e), elapsed=time.perf_counter() - start)
     
-    def _scrape_dynamic(self, keyword: str, pages: int) -> List[Dict]:
+    def _scrape_dynamic(self, keyword: str, pages: int, emit: ProductEmitter,
+                        progress: Optional[KeywordProgress] = None, limit: Optional[int] = None) -> int:
         """Dynamic multi-session approach"""
         logger.info("🔄 Using dynamic multi-session approach...")
         
@@ -155,52 +382,102 @@ class ECommerceAPIScraperV12_UltimateEdition:
             session.headers.update(headers)
             sessions.append(session)
         
-        all_products = []
+        total_products = 0
         session_index = 0
-        
-        for page in range(1, pages + 1):
-            try:
-                # Rotate sessions
-                current_session = sessions[session_index % len(sessions)]
-                session_index += 1
+        progress = progress or KeywordProgress(pages)
+        
+        try:
+            for page in progress.remaining()[:limit]:
+                start = time.perf_counter()
+                try:
+                    # Rotate sessions
+                    current_session = sessions[session_index % len(sessions)]
+                    session_index += 1
                 
-                url = f"{self.base_url}/{keyword}"
-                params = {'page': page, 'platform': 'desktop'}
+                    url = f"{self.base_url}/{keyword}"
+                    params = {'page': page, 'platform': 'desktop'}
                 
-                response = current_session.get(url, params=params, timeout=15)
+                    response = self._get(current_session, url, params=params)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    page_products = self._extract_products(data, page)
-                    all_products.extend(page_products)
-                    
-                time.sleep(random.uniform(2, 4))
+                    if response.status_code == 200:
+                        data = response.json()
+                        page_products = self._extract_product_batch(data, page)
+                        self.strategy_board.record(self.host, "DYNAMIC", 'ok' if page_products else 'empty',
+                                                   time.perf_counter() - start)
+                        progress.done.add(page)
+                        if self.journal is not None:
+                            self.journal.record_page(keyword, page, "DYNAMIC", page_products)
+                        if not page_products:
+                            progress.mark_end(page)
+                            break
+                        emit(page_products)
+                        total_products += len(page_products)
+                    else:
+                        self.strategy_board.record(self.host, "DYNAMIC",
+                                                   'blocked' if response.status_code == 403 else 'error')
                 
-            except Exception as e:
-                logger.error(f"Dynamic scraping error: {str(e)}")
-                continue
-        
-        return all_products
+                except Exception as e:
+                    logger.error(f"Dynamic scraping error: {str(e)}")
+                    self.strategy_board.record(self.host, "DYNAMIC", 'error')
+                    continue
+        finally:
+            for session in sessions:
+                session.close()
+        
+        return total_products
+    
+    def _get(self, session: Optional[requests.Session], url: str, stop_event=None,
+             headers: Optional[Mapping[str, str]] = None, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Issue one GET: served from the HTTP cache when fresh, otherwise paced
+        by the rate limiter and sent under the global request cap. With
+        session=None a session is borrowed from the pool for the request
+        """
+        def send(conditional_headers: Dict[str, str]) -> requests.Response:
+            # 🕐 Professional pacing: wait for this host's next token
+            waited = self.rate_limiter.acquire(url)
+            self.metrics.observe("rate_limit_wait_seconds", waited, scraper="ecommerce")
+            if stop_event is not None and stop_event.is_set():
+                raise FetchCancelled()
+            
+            borrowed = nullcontext(session) if session is not None else self.session_pool.session()
+            with self._request_slots, borrowed as client:
+                start = time.perf_counter()
+                response = client.get(url, headers={**(headers or {}), **conditional_headers},
+                                      params=params, timeout=15)
+                self.metrics.observe_http(response, time.perf_counter() - start, scraper="ecommerce")
+            
+            self.rate_limiter.observe(url, response)
+            self._pages_fetched.add()
+            return response
+        
+        with self.metrics.span("fetch", scraper="ecommerce"):
+            if self.http_cache is None:
+                return send({})
+            return self.http_cache.fetch(url, send, params=params)
     
     def _extract_products(self, data: Dict, page: int) -> List[Dict]:
         """Extract and clean product data"""
-        products = []
-        
-        if 'ads' in data:
-            ads_count = len(data['ads'])
-            logger.info(f"   📊 Found {ads_count} ad groups")
+        return self._extract_product_batch(data, page).to_dicts()
+    
+    def _extract_product_batch(self, data: Dict, page: int) -> ProductBatch:
+        """Extract and clean one page of products into compact columnar storage"""
+        with self.metrics.span("extract", scraper="ecommerce"):
+            # One timestamp per page instead of one isoformat() string per product
+            products = ProductBatch(page, datetime.now().isoformat())
             
-            for ad_index, ad in enumerate(data['ads']):
-                if 'products' in ad:
-                    ad_products = len(ad['products'])
-                    logger.info(f"     📦 Ad {ad_index + 1}: {ad_products} products")
-                    
-                    for product in ad['products']:
-                        clean_product = self._clean_product_data(product)
-                        clean_product['scraped_page'] = page
-                        clean_product['scraped_at'] = datetime.now().isoformat()
-                        products.append(clean_product)
+            if 'ads' in data:
+                # Ad-group detail is per item: DEBUG only, formatted lazily
+                logger.debug("   📊 Page %d: found %d ad groups", page, len(data['ads']))
+                
+                for ad_index, ad in enumerate(data['ads']):
+                    if 'products' in ad:
+                        logger.debug("     📦 Ad %d: %d products", ad_index + 1, len(ad['products']))
+                        
+                        for product in ad['products']:
+                            products.append(self._clean_product_data(product))
         
+        self.metrics.inc("products_total", len(products), scraper="ecommerce")
         return products
     
     def _clean_product_data(self, product: Dict) -> Dict:
@@ -224,38 +501,38 @@ class ECommerceAPIScraperV12_UltimateEdition:
             'savings': product.get('originalPrice', {}).get('value', 0) - product.get('price', {}).get('value', 0)
         }
     
-    def analyze_results(self, products: List[Dict]):
-        """Professional data analysis"""
+    def analyze_results(self, products: Sequence):
+        """Professional data analysis (product dicts or ProductBatches)"""
         if not products:
             logger.warning("No products to analyze")
             return
         
-        df = pd.DataFrame(products)
-        
+        self.report_stats(summarize_products(products))
+    
+    def report_stats(self, stats: ProductStats):
+        """Print an analysis from precomputed (e.g. OnlineProductStats) statistics"""
         print("\n" + "="*60)
         print("📊 ULTIMATE SCRAPING RESULTS ANALYSIS")
         print("="*60)
         
-        print(f"🎯 Total Products Scraped: {len(products)}")
-        print(f"🏷️ Unique Brands: {df['brand'].nunique()}")
-        print(f"🏪 Merchants: {df['merchant_name'].nunique()}")
+        print(f"🎯 Total Products Scraped: {stats.total}")
+        print(f"🏷️ Unique Brands: {stats.unique_brands}")
+        print(f"🏪 Merchants: {stats.unique_merchants}")
         
         print(f"\n💰 Price Analysis:")
-        print(f"   Average Price: {df['price'].mean():,.0f} TRY")
-        print(f"   Median Price: {df['price'].median():,.0f} TRY")
-        print(f"   Price Range: {df['price'].min():,.0f} - {df['price'].max():,.0f} TRY")
+        print(f"   Average Price: {stats.mean_price:,.0f} TRY")
+        print(f"   Median Price: {stats.median_price:,.0f} TRY")
+        print(f"   Price Range: {stats.min_price:,.0f} - {stats.max_price:,.0f} TRY")
         
-        if df['discount_rate'].max() > 0:
-            discounted = df[df['discount_rate'] > 0]
+        if stats.discounted:
             print(f"\n🔥 Discount Analysis:")
-            print(f"   Products on Sale: {len(discounted)}")
-            print(f"   Average Discount: {discounted['discount_rate'].mean():.1f}%")
-            print(f"   Best Deal: {discounted['discount_rate'].max():.0f}% off")
+            print(f"   Products on Sale: {stats.discounted}")
+            print(f"   Average Discount: {stats.mean_discount:.1f}%")
+            print(f"   Best Deal: {stats.max_discount:.0f}% off")
         
         print(f"\n🏆 Top 5 Cheapest Products:")
-        top_cheap = df.nsmallest(5, 'price')[['name', 'brand', 'price']]
-        for i, row in top_cheap.iterrows():
-            print(f"   {row['brand']}: {row['name'][:40]}... - {row['price']:,.0f} TRY")
+        for brand, name, price in stats.cheapest:
+            print(f"   {brand}: {name[:40]}... - {price:,.0f} TRY")
         
         runtime = datetime.now() - self.start_time
         print(f"\n⏱️ Scraping completed in: {runtime.total_seconds():.1f} seconds")
@@ -265,33 +542,27 @@ class ECommerceAPIScraperV12_UltimateEdition:
         if not products:
             return
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_filename = f"ecommerce_{keyword}_{timestamp}"
-        
-        # Save CSV
-        df = pd.DataFrame(products)
-        csv_file = f"{base_filename}.csv"
-        df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-        logger.info(f"💾 Saved {len(products)} products to {csv_file}")
-        
-        # Save JSON
-        json_file = f"{base_filename}.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        logger.info(f"💾 Saved {len(products)} products to {json_file}")
-        
-        # Save summary
-        summary_file = f"{base_filename}_summary.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"E-commerce Scraping Summary\n")
-            f.write(f"===========================\n")
-            f.write(f"Keyword: {keyword}\n")
-            f.write(f"Products: {len(products)}\n")
-            f.write(f"Scraped: {datetime.now()}\n")
-            f.write(f"Brands: {df['brand'].nunique()}\n")
-            f.write(f"Price Range: {df['price'].min():,.0f} - {df['price'].max():,.0f} TRY\n")
-        
-        logger.info(f"📋 Summary saved to {summary_file}")
+        with self.metrics.span("save", scraper="ecommerce"), \
+                StreamingProductWriter(keyword, formats=('csv', 'json')) as writer:
+            writer.write_page(products)
+        
+        for path in writer.paths.values():
+            logger.info(f"💾 Saved {len(products)} products to {path}")
+        logger.info(f"📋 Summary saved to {writer.summary_path}")
+    
+    def open_stream(self, keyword: str, **writer_options) -> StreamingProductWriter:
+        """
+        Streaming sink for stream_products_ultimate: products are appended to
+        CSV/NDJSON page by page and the summary is written on close()
+        """
+        return StreamingProductWriter(keyword, **writer_options)
+    
+    def open_columnar_stream(self, keyword: str, **writer_options) -> ColumnarProductWriter:
+        """
+        Columnar sink for stream_products_ultimate: products are appended as
+        Parquet/Arrow row groups under keyword=<keyword>/date=<day>/
+        """
+        return ColumnarProductWriter(keyword, **writer_options)
 
 # 🏆 ULTIMATE TESTING AND DEMO
 if __name__ == "__main__":
@@ -334,38 +605,49 @@ if __name__ == "__main__":
     else:
         print("❌ Hmm, something went wrong. But we have multiple strategies!")
         print("💡 Try running again or check network connection")
+    
+    scraper.close()
 
 # 🎯 ADVANCED USAGE EXAMPLES:
 
-def scrape_multiple_categories_ultimate():
-    """Ultimate multi-category scraping"""
+def scrape_multiple_categories_ultimate(categories: Optional[List[str]] = None, pages: int = 4,
+                                        max_concurrent_keywords: int = 4):
+    """Ultimate multi-category scraping - keywords crawled in parallel"""
     scraper = ECommerceAPIScraperV12_UltimateEdition()
-    categories = ["laptop", "phone", "tablet", "headphone", "mouse"]
-    
-    all_results = {}
+    categories = categories or ["laptop", "phone", "tablet", "headphone", "mouse"]
+    scheduler = KeywordCrawlScheduler(scraper, max_concurrent_keywords=max_concurrent_keywords)
     
     print("🚀 ULTIMATE MULTI-CATEGORY SCRAPING")
     print("=" * 50)
+    print(f"🔍 Scraping {len(categories)} categories, {max_concurrent_keywords} at a time...")
     
-    for category in categories:
-        print(f"\n🔍 Scraping {category}s...")
-        products = scraper.search_products_ultimate(category, pages=4)
-        all_results[category] = products
-        
+    def save_category(category: str, products: List[Dict]):
+        # Runs as soon as each category finishes
         if products:
             scraper.save_ultimate(products, category)
             print(f"✅ {category}: {len(products)} products saved!")
+        else:
+            print(f"📭 {category}: no products found")
+    
+    try:
+        report = scheduler.run(categories, pages, sink=save_category)
+    finally:
+        scraper.close()
     
     # Ultimate summary
     print(f"\n🏆 ULTIMATE RESULTS SUMMARY:")
     print("=" * 40)
-    total = 0
-    for category, products in all_results.items():
-        count = len(products)
-        total += count
+    for category in categories:
+        count = report.product_counts.get(category, 0)
         print(f"   {category:12}: {count:4} products")
     
-    print(f"   {'TOTAL':12}: {total:4} products")
+    print(f"   {'TOTAL':12}: {report.products:4} products")
+    if report.failed_keywords:
+        print(f"   ⚠️ Failed: {', '.join(report.failed_keywords)}")
+    
+    print(f"\n⚡ Throughput: {report.pages_per_second:.2f} pages/s | "
+          f"{report.products_per_second:.2f} products/s ({report.elapsed:.1f}s total)")
     print(f"\n🎉 ULTIMATE MISSION COMPLETE!")
+    return report
 
 # 🏆 YOU ARE NOW A PROFESSIONAL WEB SCRAPER!
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+⚡ Concurrent page fetching for the e-commerce scraper
+
+Pages are fetched in a bounded sliding window (a few requests in flight per
+host) but handed back strictly in page order, so callers keep the simple
+"walk pages 1..N and stop at the first empty one" logic of the serial loop.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+
+class FetchCancelled(Exception):
+    """Raised by a worker that noticed the stop event before sending its request"""
+
+
+@dataclass
+class PageResult:
+    """Outcome of fetching a single search-result page"""
+    page: int
+    status: str  # 'ok', 'empty', 'blocked', 'error' or 'cancelled'
+    products: Sequence[Dict] = field(default_factory=list)
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0  # seconds spent fetching and extracting
+
+
+@dataclass
+class KeywordProgress:
+    """
+    Pages of one keyword's crawl that are already handled. Strategies take
+    turns on the same progress, so a strategy that gets blocked on page 5
+    hands over at page 5 instead of the next one starting from page 1.
+    """
+    pages: int
+    done: Set[int] = field(default_factory=set)
+    end_page: Optional[int] = None  # lowest empty page seen: nothing after it to fetch
+
+    def mark_end(self, page: int):
+        if self.end_page is None or page < self.end_page:
+            self.end_page = page
+
+    def remaining(self) -> List[int]:
+        """Pages still missing; after an empty page, only the ones before it (e.g. pages that failed)"""
+        last = self.pages if self.end_page is None else min(self.pages, self.end_page - 1)
+        return [page for page in range(1, last + 1) if page not in self.done]
+
+
+class ConcurrentPageFetcher:
+    """
+    Fetch pages with at most `max_in_flight` requests running at once.
+
+    `fetch_page(page, stop_event)` runs on a worker thread and must return a
+    PageResult. Workers should check `stop_event` before going to the network
+    so pages beyond an early stop are not requested at all.
+    """
+
+    def __init__(self, fetch_page: Callable[[int, threading.Event], PageResult], max_in_flight: int = 4):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.fetch_page = fetch_page
+        self.max_in_flight = max_in_flight
+
+    def fetch_in_order(self, pages: Iterable[int]) -> Iterator[PageResult]:
+        """
+        Yield a PageResult for every page, in the order given.
+
+        Closing the generator early (e.g. `break` inside `closing(...)`)
+        cancels every page that has not been handed back yet.
+        """
+        page_iter = iter(pages)
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="page-fetch")
+        window: List[Future] = []
+
+        def submit_next() -> bool:
+            page = next(page_iter, None)
+            if page is None:
+                return False
+            window.append(executor.submit(self.fetch_page, page, stop_event))
+            return True
+
+        try:
+            while len(window) < self.max_in_flight and submit_next():
+                pass
+
+            while window:
+                result = window.pop(0).result()
+                submit_next()
+                yield result
+        finally:
+            # Early termination: stop workers before they hit the network and
+            # drop queued pages
+            stop_event.set()
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
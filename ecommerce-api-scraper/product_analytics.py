@@ -0,0 +1,248 @@
+"""
+📊 Product analytics engine
+
+Two ways to get the same statistics that analyze_results prints:
+
+- summarize_products(): one vectorized pass over columnar data (numpy arrays
+  built straight from ProductBatch buffers, or from a list of dicts)
+- OnlineProductStats: constant-memory statistics updated page by page while
+  the crawl runs - P² sketch for the median, a bounded heap for the cheapest
+  products and exact sets for unique brands/merchants
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from product_record import ProductBatch
+
+TOP_N_CHEAPEST = 5
+
+# (brand, name, price) of one of the cheapest products
+CheapProduct = Tuple[str, str, float]
+
+
+@dataclass
+class ProductStats:
+    """Everything analyze_results and the summary file report"""
+    total: int = 0
+    unique_brands: int = 0
+    unique_merchants: int = 0
+    mean_price: Optional[float] = None
+    median_price: Optional[float] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    discounted: int = 0
+    mean_discount: Optional[float] = None
+    max_discount: Optional[float] = None
+    cheapest: List[CheapProduct] = field(default_factory=list)
+
+
+def _columns_from_batches(batches: Sequence[ProductBatch]) -> Dict:
+    return {
+        'brand': list(itertools.chain.from_iterable(b.brand for b in batches)),
+        'merchant_name': list(itertools.chain.from_iterable(b.merchant_name for b in batches)),
+        'name': list(itertools.chain.from_iterable(b.name for b in batches)),
+        'price': np.concatenate([np.frombuffer(b.price, dtype=np.float64) for b in batches]),
+        'discount_rate': np.fromiter(
+            itertools.chain.from_iterable(b.discount_rate for b in batches), dtype=np.float64
+        ),
+    }
+
+
+def _columns_from_dicts(products: Sequence[Dict]) -> Dict:
+    columns = {'brand': [], 'merchant_name': [], 'name': [], 'price': [], 'discount_rate': []}
+    for product in products:
+        for key, values in columns.items():
+            values.append(product.get(key))
+    columns['price'] = np.asarray(columns['price'], dtype=np.float64)
+    columns['discount_rate'] = np.asarray(columns['discount_rate'], dtype=np.float64)
+    return columns
+
+
+def _unique_count(values: Iterable) -> int:
+    # Same as pandas nunique(): missing values are not counted
+    return len(set(values) - {None})
+
+
+def summarize_products(products: Sequence) -> ProductStats:
+    """
+    Compute all statistics in one vectorized pass.
+
+    Accepts a list of product dicts, a ProductBatch, or a list of batches
+    (as returned by search_products_compact).
+    """
+    if isinstance(products, ProductBatch):
+        products = [products]
+    if not products:
+        return ProductStats()
+
+    if isinstance(products[0], ProductBatch):
+        columns = _columns_from_batches(products)
+    else:
+        columns = _columns_from_dicts(products)
+
+    price = columns['price']
+    discount = columns['discount_rate']
+    stats = ProductStats(
+        total=len(price),
+        unique_brands=_unique_count(columns['brand']),
+        unique_merchants=_unique_count(columns['merchant_name']),
+        mean_price=float(price.mean()),
+        median_price=float(np.median(price)),
+        min_price=float(price.min()),
+        max_price=float(price.max()),
+    )
+
+    on_sale = discount[discount > 0]
+    stats.discounted = int(on_sale.size)
+    if on_sale.size:
+        stats.mean_discount = float(on_sale.mean())
+        stats.max_discount = float(on_sale.max())
+
+    # Cheapest products in price order, ties kept in scrape order (like nsmallest)
+    top_n = min(TOP_N_CHEAPEST, price.size)
+    threshold = np.partition(price, top_n - 1)[top_n - 1]
+    candidates = np.flatnonzero(price <= threshold)
+    order = candidates[np.argsort(price[candidates], kind='stable')][:top_n]
+    stats.cheapest = [(columns['brand'][i], columns['name'][i], float(price[i])) for i in order]
+    return stats
+
+
+class P2Quantile:
+    """
+    P² streaming quantile estimator (Jain & Chlamtac): five markers, O(1)
+    memory. Exact until five values have been seen.
+    """
+
+    def __init__(self, q: float = 0.5):
+        self.q = q
+        self._initial: List[float] = []
+        self.heights: List[float] = []
+        self.positions: List[float] = []
+        self.desired: List[float] = []
+        self.increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, x: float):
+        if not self.heights:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self.heights = sorted(self._initial)
+                self.positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+                self.desired = [1.0, 1 + 2 * self.q, 1 + 4 * self.q, 3 + 2 * self.q, 5.0]
+            return
+
+        h, n = self.heights, self.positions
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if h[i] <= x < h[i + 1])
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not h[i - 1] < candidate < h[i + 1]:
+                    candidate = h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+                h[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        if self.heights:
+            return self.heights[2]
+        if not self._initial:
+            return None
+        return float(np.quantile(self._initial, self.q))
+
+
+class OnlineProductStats:
+    """
+    Statistics updated one page at a time in constant memory.
+
+    `update` has the emitter signature, so an instance can be passed straight
+    to stream_products_ultimate or combined with a streaming writer.
+    """
+
+    def __init__(self, top_n: int = TOP_N_CHEAPEST):
+        self.top_n = top_n
+        self.count = 0
+        self.brands = set()
+        self.merchants = set()
+        self.priced = 0
+        self.price_sum = 0.0
+        self.min_price: Optional[float] = None
+        self.max_price: Optional[float] = None
+        self.median = P2Quantile(0.5)
+        self.discounted = 0
+        self.discount_sum = 0.0
+        self.max_discount: Optional[float] = None
+        # Max-heap (negated price) of the cheapest products; the sequence
+        # number keeps the earliest product on ties, like nsmallest
+        self._cheapest: List[Tuple[float, int, str, str]] = []
+
+    def update(self, products: Iterable[Dict]):
+        for product in products:
+            seq = self.count
+            self.count += 1
+            self.brands.add(product.get('brand'))
+            self.merchants.add(product.get('merchant_name'))
+
+            price = product.get('price')
+            if price is not None:
+                price = float(price)
+                self.priced += 1
+                self.price_sum += price
+                self.median.add(price)
+                if self.min_price is None or price < self.min_price:
+                    self.min_price = price
+                if self.max_price is None or price > self.max_price:
+                    self.max_price = price
+
+                entry = (-price, -seq, product.get('brand'), product.get('name'))
+                if len(self._cheapest) < self.top_n:
+                    heapq.heappush(self._cheapest, entry)
+                elif entry > self._cheapest[0]:
+                    heapq.heapreplace(self._cheapest, entry)
+
+            discount = product.get('discount_rate') or 0
+            if discount > 0:
+                self.discounted += 1
+                self.discount_sum += discount
+                if self.max_discount is None or discount > self.max_discount:
+                    self.max_discount = float(discount)
+
+    def result(self) -> ProductStats:
+        cheapest = sorted(self._cheapest, key=lambda entry: (-entry[0], -entry[1]))
+        return ProductStats(
+            total=self.count,
+            unique_brands=len(self.brands - {None}),
+            unique_merchants=len(self.merchants - {None}),
+            mean_price=self.price_sum / self.priced if self.priced else None,
+            median_price=self.median.value(),
+            min_price=self.min_price,
+            max_price=self.max_price,
+            discounted=self.discounted,
+            mean_discount=self.discount_sum / self.discounted if self.discounted else None,
+            max_discount=self.max_discount,
+            cheapest=[(brand, name, -neg_price) for neg_price, _, brand, name in cheapest],
+        )
@@ -0,0 +1,122 @@
+"""
+🗜️ Compact product storage
+
+A ProductBatch holds one page of cleaned products column by column instead of
+as one 18-key dict per product:
+
+- prices live in `array('d')` buffers (8 bytes each, no float objects)
+- brand / merchant / category / tag strings are interned, so repeated values
+  share one object across every batch in the process
+- currency, page number and scraped-at timestamp are stored once per batch
+
+The batch is a read-only Sequence of product dicts (`len`,
+iteration, indexing, `to_dicts()`), so existing consumers keep working and
+only materialise dicts when they actually need them.
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterator, List
+
+def _intern(value) -> str:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ProductBatch(Sequence):
+    """Columnar, interned storage for the products of one page"""
+
+    __slots__ = (
+        'page', 'scraped_at', 'currency',
+        'product_id', 'name', 'brand', 'price', 'original_price', 'discount_rate',
+        'image_url', 'product_url', 'merchant_name', 'category', 'sku',
+        'main_category_id', 'listing_id', 'tags',
+    )
+
+    def __init__(self, page: int, scraped_at: str, currency: str = 'TRY'):
+        self.page = page
+        self.scraped_at = scraped_at
+        self.currency = currency
+
+        self.product_id: List[str] = []
+        self.name: List[str] = []
+        self.brand: List[str] = []
+        self.price = array('d')
+        self.original_price = array('d')
+        self.discount_rate: list = []  # small ints are shared by CPython anyway
+        self.image_url: List[str] = []
+        self.product_url: List[str] = []
+        self.merchant_name: List[str] = []
+        self.category: List[str] = []
+        self.sku: List[str] = []
+        self.main_category_id: List[str] = []
+        self.listing_id: List[str] = []
+        self.tags: List[tuple] = []
+
+    def append(self, product: Dict):
+        """Add one cleaned product (the dict from _clean_product_data)"""
+        self.product_id.append(product.get('product_id', ''))
+        self.name.append(product.get('name', ''))
+        self.brand.append(_intern(product.get('brand', '')))
+        self.price.append(float(product.get('price') or 0))
+        self.original_price.append(float(product.get('original_price') or 0))
+        self.discount_rate.append(product.get('discount_rate', 0))
+        self.image_url.append(product.get('image_url', ''))
+        self.product_url.append(product.get('product_url', ''))
+        self.merchant_name.append(_intern(product.get('merchant_name', '')))
+        self.category.append(_intern(product.get('category', '')))
+        self.sku.append(product.get('sku', ''))
+        self.main_category_id.append(_intern(product.get('main_category_id', '')))
+        self.listing_id.append(product.get('listing_id', ''))
+        self.tags.append(tuple(_intern(tag) for tag in product.get('tags') or ()))
+
+    def row(self, index: int) -> Dict:
+        """Materialise one product in the classic dict layout"""
+        price = self.price[index]
+        original_price = self.original_price[index]
+        return {
+            'product_id': self.product_id[index],
+            'name': self.name[index],
+            'brand': self.brand[index],
+            'price': price,
+            'original_price': original_price,
+            'discount_rate': self.discount_rate[index],
+            'currency': self.currency,
+            'image_url': self.image_url[index],
+            'product_url': self.product_url[index],
+            'merchant_name': self.merchant_name[index],
+            'category': self.category[index],
+            'sku': self.sku[index],
+            'main_category_id': self.main_category_id[index],
+            'listing_id': self.listing_id[index],
+            'tags': list(self.tags[index]),
+            'savings': original_price - price,
+            'scraped_page': self.page,
+            'scraped_at': self.scraped_at,
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        """Compatibility converter: the exact list-of-dicts _extract_products returns"""
+        return [self.row(i) for i in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self.product_id)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (self.row(i) for i in range(len(self)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ProductBatch index out of range")
+        return self.row(index)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        return f"ProductBatch(page={self.page}, products={len(self)})"
+
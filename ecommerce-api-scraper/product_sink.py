@@ -0,0 +1,137 @@
+"""
+💾 Streaming product output
+
+Products are appended to CSV / NDJSON / JSON files page by page through a
+small bounded buffer, so memory stays flat however long the crawl runs and a
+crash only loses the rows still sitting in the buffer. The summary file is
+built from OnlineProductStats kept while writing instead of re-reading the
+output.
+"""
+
+import csv
+import json
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from product_analytics import OnlineProductStats, ProductStats
+
+
+def write_summary(path: str, keyword: str, stats: ProductStats):
+    """Write the plain-text summary file next to the product files"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"E-commerce Scraping Summary\n")
+        f.write(f"===========================\n")
+        f.write(f"Keyword: {keyword}\n")
+        f.write(f"Products: {stats.total}\n")
+        f.write(f"Scraped: {datetime.now()}\n")
+        f.write(f"Brands: {stats.unique_brands}\n")
+        if stats.min_price is not None:
+            f.write(f"Price Range: {stats.min_price:,.0f} - {stats.max_price:,.0f} TRY\n")
+
+
+class StreamingProductWriter:
+    """
+    Append products to `<base_filename>.<format>` as they are scraped.
+
+    formats        -- any of 'csv', 'ndjson' and 'json' (a JSON array, only
+                      valid once the writer is closed)
+    buffer_size    -- rows held in memory before they are written out
+    flush_interval -- seconds after which buffered rows are written anyway
+
+    Use as a context manager, or call close() to flush and write the summary.
+    """
+
+    SUPPORTED_FORMATS = ('csv', 'ndjson', 'json')
+
+    def __init__(self, keyword: str, base_filename: Optional[str] = None,
+                 formats: Sequence[str] = ('csv', 'ndjson'), buffer_size: int = 500,
+                 flush_interval: float = 5.0):
+        unknown = set(formats) - set(self.SUPPORTED_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported output formats: {', '.join(sorted(unknown))}")
+
+        if not base_filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_filename = f"ecommerce_{keyword}_{timestamp}"
+
+        self.keyword = keyword
+        self.base_filename = base_filename
+        self.formats = tuple(formats)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.stats = OnlineProductStats()
+        self.paths = {fmt: f"{base_filename}.{fmt}" for fmt in self.formats}
+        self.summary_path = f"{base_filename}_summary.txt"
+
+        self._buffer: List[Dict] = []
+        self._last_flush = time.monotonic()
+        self._csv_writer = None
+        self._json_rows = 0
+        self._files = {
+            fmt: open(path, 'w', encoding='utf-8-sig' if fmt == 'csv' else 'utf-8', newline='')
+            for fmt, path in self.paths.items()
+        }
+        self.closed = False
+
+    def write_page(self, products: Sequence[Dict]):
+        """Queue one page of products; flushes when the buffer is full or stale"""
+        rows = list(products)  # materialise a ProductBatch once
+        self.stats.update(rows)
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows to every output file"""
+        rows, self._buffer = self._buffer, []
+        if rows:
+            if 'csv' in self._files:
+                self._write_csv(rows)
+            if 'ndjson' in self._files:
+                self._files['ndjson'].writelines(
+                    json.dumps(row, ensure_ascii=False) + '\n' for row in rows
+                )
+            if 'json' in self._files:
+                self._write_json(rows)
+
+        for f in self._files.values():
+            f.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """Flush, finish the files and write the summary"""
+        if self.closed:
+            return
+        self.flush()
+        if 'json' in self._files:
+            self._files['json'].write('\n]' if self._json_rows else '[]')
+        for f in self._files.values():
+            f.close()
+        write_summary(self.summary_path, self.keyword, self.stats.result())
+        self.closed = True
+
+    def _write_csv(self, rows: List[Dict]):
+        if self._csv_writer is None:
+            # Columns are fixed by the first row, like DataFrame.to_csv
+            self._csv_writer = csv.DictWriter(
+                self._files['csv'], fieldnames=list(rows[0].keys()),
+                extrasaction='ignore', lineterminator='\n'
+            )
+            self._csv_writer.writeheader()
+        self._csv_writer.writerows(rows)
+
+    def _write_json(self, rows: List[Dict]):
+        # Same layout as json.dump(products, indent=2), one element at a time
+        f = self._files['json']
+        for row in rows:
+            f.write('[\n' if self._json_rows == 0 else ',\n')
+            item = json.dumps(row, ensure_ascii=False, indent=2)
+            f.write('\n'.join('  ' + line for line in item.split('\n')))
+            self._json_rows += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
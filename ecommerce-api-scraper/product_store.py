@@ -0,0 +1,135 @@
+"""
+🗄️ Incremental crawl store
+
+A small SQLite database remembers every product seen so far, keyed by
+(product_id, listing_id), together with a hash of its cleaned content. Each
+crawl then only emits what is new or changed (price, discount, name...) and
+drops products that show up twice in the same run (several pages or ad
+groups). Volatile fields such as the scrape timestamp are not hashed.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Sequence
+
+VOLATILE_FIELDS = ('scraped_page', 'scraped_at')
+
+
+def content_hash(product: Dict) -> str:
+    """Stable hash of a cleaned product, ignoring when/where it was scraped"""
+    stable = {key: value for key, value in product.items() if key not in VOLATILE_FIELDS}
+    payload = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ProductChangeStore:
+    """
+    Persistent product index used to filter a crawl down to new/changed rows.
+
+    Every store instance starts a new run; call begin_run() to start another.
+    Rows already touched in the current run are treated as duplicates, so
+    within-run deduplication needs no in-memory set.
+    """
+
+    def __init__(self, path: str = "ecommerce_products.db"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                product_id   TEXT NOT NULL,
+                listing_id   TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                price        REAL,
+                first_seen   REAL NOT NULL,
+                last_seen    REAL NOT NULL,
+                last_run     INTEGER NOT NULL,
+                PRIMARY KEY (product_id, listing_id)
+            )
+        """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.begin_run()
+
+    def begin_run(self) -> int:
+        """Start a new crawl run and reset the per-run counters"""
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(MAX(last_run), 0) FROM products").fetchone()
+            self.run_id = row[0] + 1
+            self.new = 0
+            self.changed = 0
+            self.unchanged = 0
+            self.duplicates = 0
+        return self.run_id
+
+    def filter_changed(self, products: Sequence[Dict]) -> List[Dict]:
+        """Record a page of products and return only the new or changed ones"""
+        now = time.time()
+        emitted = []
+
+        # One transaction per page; rows are written as we go so a product
+        # repeated within the same page is already marked for this run
+        with self._lock:
+            for product in products:
+                key = (str(product.get('product_id', '')), str(product.get('listing_id', '')))
+                digest = content_hash(product)
+                row = self._conn.execute(
+                    "SELECT content_hash, last_run FROM products WHERE product_id = ? AND listing_id = ?",
+                    key,
+                ).fetchone()
+
+                if row is None:
+                    self._conn.execute(
+                        "INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (*key, digest, product.get('price'), now, now, self.run_id),
+                    )
+                    self.new += 1
+                    emitted.append(product)
+                elif row[1] == self.run_id:
+                    self.duplicates += 1
+                elif row[0] != digest:
+                    self._conn.execute(
+                        "UPDATE products SET content_hash = ?, price = ?, last_seen = ?, last_run = ? "
+                        "WHERE product_id = ? AND listing_id = ?",
+                        (digest, product.get('price'), now, self.run_id, *key),
+                    )
+                    self.changed += 1
+                    emitted.append(product)
+                else:
+                    self._conn.execute(
+                        "UPDATE products SET last_seen = ?, last_run = ? WHERE product_id = ? AND listing_id = ?",
+                        (now, self.run_id, *key),
+                    )
+                    self.unchanged += 1
+            self._conn.commit()
+
+        return emitted
+
+    def filtering(self, emit: Callable[[Sequence[Dict]], None]) -> Callable[[Sequence[Dict]], None]:
+        """Wrap an emitter so it only receives new or changed products"""
+        def emit_changed(products: Sequence[Dict]):
+            changed = self.filter_changed(products)
+            if changed:
+                emit(changed)
+        return emit_changed
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'new': self.new,
+            'changed': self.changed,
+            'unchanged': self.unchanged,
+            'duplicates': self.duplicates,
+        }
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,183 @@
+"""
+🧭 Adaptive strategy scoreboard
+
+Remembers, per host, how each header strategy (SIMPLE, ADVANCED, DYNAMIC)
+has been doing: success rate, block (403) rate, failure rate and latency.
+Every keyword starts with the strategy most likely to work instead of
+burning a 403 round trip on SIMPLE first.
+
+- counts decay with every new observation, so a strategy that gets
+  blocked (or unblocked) moves up or down within a few pages
+- strategies with no history score like a coin flip, so a new host is tried
+  in cost order: cheapest first
+- a cheaper strategy that lost its place is re-probed on a single page once
+  `reprobe_interval` seconds have passed since it was last tried
+- strategies with equal success rates are ordered by block rate, then
+  latency, then cost
+- the scores live in SQLite (ecommerce_strategies.db by default, so they
+  carry over between runs; ":memory:" keeps them per process) and are safe
+  to share between threads; changes are written in one transaction every
+  `flush_interval` seconds and on close(), not once per page
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# Cheapest first: the order strategies are tried in when nothing is known yet
+STRATEGIES = ('SIMPLE', 'ADVANCED', 'DYNAMIC')
+
+
+@dataclass
+class StrategyStats:
+    """Decayed outcome counts of one strategy on one host"""
+    attempts: float = 0.0
+    successes: float = 0.0
+    blocks: float = 0.0
+    failures: float = 0.0
+    latency: float = 0.0       # moving average, seconds per page
+    last_attempt: float = 0.0  # wall clock
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace smoothing: an untried strategy scores 0.5
+        return (self.successes + 1) / (self.attempts + 2)
+
+    @property
+    def block_rate(self) -> float:
+        return self.blocks / self.attempts if self.attempts else 0.0
+
+
+class StrategyScoreboard:
+    """
+    Per-host strategy scores used to order (and re-probe) strategies.
+
+    decay            -- weight kept by older observations at each new one
+                        (0.9 -> roughly the last 10 pages matter)
+    reprobe_interval -- seconds before a cheaper, demoted strategy gets
+                        another one-page try
+    flush_interval   -- seconds between writes of the changed scores
+    """
+
+    def __init__(self, path: str = "ecommerce_strategies.db", strategies: Sequence[str] = STRATEGIES,
+                 decay: float = 0.9, reprobe_interval: float = 900.0, flush_interval: float = 5.0):
+        self.path = path
+        self.strategies = tuple(strategies)
+        self.decay = decay
+        self.reprobe_interval = reprobe_interval
+        self.flush_interval = flush_interval
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS strategy_stats (
+                host         TEXT NOT NULL,
+                strategy     TEXT NOT NULL,
+                attempts     REAL NOT NULL,
+                successes    REAL NOT NULL,
+                blocks       REAL NOT NULL,
+                failures     REAL NOT NULL,
+                latency      REAL NOT NULL,
+                last_attempt REAL NOT NULL,
+                PRIMARY KEY (host, strategy)
+            )
+        """)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], StrategyStats] = {
+            (host, strategy): StrategyStats(*values)
+            for host, strategy, *values in self._conn.execute("SELECT * FROM strategy_stats")
+        }
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._flushed_at = time.monotonic()
+
+    def record(self, host: str, strategy: str, outcome: str, latency: float = 0.0):
+        """
+        Count one page. outcome is a PageResult status: 'ok' and 'empty' are
+        successes, 'blocked' a block, anything else a failure
+        """
+        with self._lock:
+            stats = self._stats.setdefault((host, strategy), StrategyStats())
+            stats.attempts = stats.attempts * self.decay + 1
+            stats.successes *= self.decay
+            stats.blocks *= self.decay
+            stats.failures *= self.decay
+            if outcome in ('ok', 'empty'):
+                stats.successes += 1
+                stats.latency = latency if not stats.latency else 0.8 * stats.latency + 0.2 * latency
+            elif outcome == 'blocked':
+                stats.blocks += 1
+            else:
+                stats.failures += 1
+            stats.last_attempt = time.time()
+            self._dirty.add((host, strategy))
+            if time.monotonic() - self._flushed_at >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        """Write the scores changed since the last flush"""
+        with self._lock:
+            self._flush()
+
+    def ranking(self, host: str) -> List[str]:
+        """Strategies for `host`, most likely to work first (ties: fewer blocks, faster, cheaper)"""
+        with self._lock:
+            return self._ranking(host)
+
+    def plan(self, host: str) -> Tuple[List[str], Optional[str]]:
+        """
+        (ranking, probe): `probe` is a cheaper strategy due for a one-page
+        re-probe before the ranking is followed, or None. Handing out a probe
+        counts as trying it, so concurrent keywords don't all probe at once
+        """
+        with self._lock:
+            ranking = self._ranking(host)
+            now = time.time()
+            for strategy in self.strategies[:self.strategies.index(ranking[0])]:
+                stats = self._stats.get((host, strategy))
+                if stats is not None and now - stats.last_attempt >= self.reprobe_interval:
+                    stats.last_attempt = now
+                    self._dirty.add((host, strategy))
+                    return ranking, strategy
+            return ranking, None
+
+    def stats(self, host: str) -> Dict[str, StrategyStats]:
+        with self._lock:
+            return {strategy: self._stats.get((host, strategy), StrategyStats()) for strategy in self.strategies}
+
+    def describe(self, host: str) -> str:
+        """One-line summary for logs, in ranking order"""
+        stats = self.stats(host)
+        return ", ".join(
+            f"{strategy} {stats[strategy].success_rate:.0%} ok / {stats[strategy].block_rate:.0%} blocked"
+            f" / {stats[strategy].latency:.2f}s" for strategy in self.ranking(host)
+        )
+
+    def _ranking(self, host: str) -> List[str]:
+        def score(strategy: str) -> tuple:
+            stats = self._stats.get((host, strategy), StrategyStats())
+            # Rounded so noise in the rates doesn't reorder equivalent strategies
+            return (-round(stats.success_rate, 2), round(stats.block_rate, 2),
+                    round(stats.latency, 1), self.strategies.index(strategy))
+        return sorted(self.strategies, key=score)
+
+    def _flush(self):
+        if self._dirty:
+            self._conn.executemany("INSERT OR REPLACE INTO strategy_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                   [(host, strategy, *astuple(self._stats[(host, strategy)]))
+                                    for host, strategy in self._dirty])
+            self._conn.commit()
+            self._dirty.clear()
+        self._flushed_at = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+🕸️ BENCHMARK: sequential vs concurrent listing crawl
+
+Serves the saved listing pages in fixtures/ from a local stub server (with a
+fixed per-request latency), crawls every section with one page in flight and
+with a concurrent window, and checks the merged result:
+
+- ranks run 1..M without gaps
+- every athing id appears once (the story repeated on news page 2 is dropped)
+- both crawls return the same stories
+
+Numbered pages past the end of a listing come back empty, like the real site.
+
+Usage:
+    python benchmarks/bench_crawl.py --pages 3 --latency 0.2
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from hn_crawler import SECTIONS, HNCrawler  # noqa: E402
+from scraping_common.rate_limiter import HostRateLimiter  # noqa: E402
+from scraping_common.stub_server import StubServer  # noqa: E402
+
+FIXTURE_DIR = os.path.join(PROJECT_DIR, "fixtures")
+EMPTY_LISTING = b'<html><body><table class="itemlist"></table></body></html>'
+
+
+def fixture_route(directory: str):
+    """Serve <section>_p<N>.html for /<section>?p=N and cursor links (?next=..&n=31)"""
+    def route(path, query, headers):
+        section = path.strip('/') or 'news'
+        if section not in SECTIONS:
+            return 404, {'Content-Type': 'text/plain'}, b'not found'
+        if 'n' in query:
+            page = (int(query['n'][0]) - 1) // 30 + 1
+        else:
+            page = int(query.get('p', ['1'])[0])
+
+        fixture = os.path.join(directory, f"{section}_p{page}.html")
+        body = EMPTY_LISTING
+        if os.path.exists(fixture):
+            with open(fixture, 'rb') as f:
+                body = f.read()
+        return 200, {'Content-Type': 'text/html; charset=utf-8'}, body
+
+    return route
+
+
+def crawl_all(base_url: str, pages: int, workers: int) -> tuple:
+    # Generous host budget so the stub's latency, not pacing, dominates
+    limiter = HostRateLimiter(rate=50.0, burst=10, jitter=0.0, max_rate=50.0)
+    results, reports = {}, {}
+    start = time.perf_counter()
+    with HNCrawler(base_url=base_url, max_workers=workers, rate_limiter=limiter) as crawler:
+        for section in SECTIONS:
+            results[section] = crawler.crawl(section, pages)
+            reports[section] = crawler.last_report
+    return time.perf_counter() - start, results, reports
+
+
+def check(results: dict, reports: dict) -> list:
+    problems = []
+    for section, stories in results.items():
+        ranks = [story['rank'] for story in stories]
+        ids = [story['id'] for story in stories]
+        if ranks != list(range(1, len(stories) + 1)):
+            problems.append(f"{section}: ranks are not 1..{len(stories)}")
+        if len(set(ids)) != len(ids):
+            problems.append(f"{section}: duplicate story ids")
+        if reports[section].failed_pages:
+            problems.append(f"{section}: failed pages {reports[section].failed_pages}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs concurrent listing crawl")
+    parser.add_argument('--pages', type=int, default=3, help="pages requested per section")
+    parser.add_argument('--latency', type=float, default=0.2, help="stub response latency in seconds")
+    parser.add_argument('--workers', type=int, default=4, help="listing pages in flight")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help="directory of <section>_p<N>.html files")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with StubServer(fixture_route(args.fixtures), latency=args.latency) as server:
+        serial_time, serial, _ = crawl_all(server.url(), args.pages, 1)
+        concurrent_time, concurrent, reports = crawl_all(server.url(), args.pages, args.workers)
+
+    print("🕸️ LISTING CRAWL BENCHMARK")
+    print("=" * 60)
+    print(f"Sections: {', '.join(SECTIONS)} | Pages: {args.pages} | Latency: {args.latency}s")
+    for section in SECTIONS:
+        report = reports[section]
+        print(f"   {section:8}: {report.stories:4} stories from {report.pages} pages, "
+              f"{report.duplicates} duplicates dropped")
+    print(f"   {'serial':12}: {serial_time:6.2f}s")
+    print(f"   {f'workers={args.workers}':12}: {concurrent_time:6.2f}s ({serial_time / concurrent_time:.2f}x)")
+
+    problems = check(concurrent, reports)
+    same = all([s['id'] for s in serial[k]] == [s['id'] for s in concurrent[k]] for k in SECTIONS)
+    if not same:
+        problems.append("serial and concurrent crawls disagree")
+    for problem in problems:
+        print(f"   ❌ {problem}")
+    if not problems:
+        print("   ✅ ranks contiguous, ids unique, serial == concurrent")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
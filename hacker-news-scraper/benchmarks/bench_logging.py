@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+📝 BENCHMARK: story extraction throughput by logging level
+
+Builds synthetic front pages in the Hacker News markup and runs
+extract_stories over them with logging configured as:
+
+- quiet     -- INFO (per-story lines are skipped before formatting)
+- verbose   -- DEBUG, every story logged as text
+- json      -- DEBUG, every story logged as structured JSON
+- sampled   -- DEBUG, one story line in --sample kept
+
+Log output is counted and discarded, so the numbers show formatting and
+handler cost without terminal speed; writing to a real terminal or log
+shipper only widens the gap. The line count shows the volume each mode sends
+to the log pipeline.
+
+Usage:
+    python benchmarks/bench_logging.py --pages 50 --stories 30
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hn_pages import build_front_page  # noqa: E402
+from hn_parser import extract_stories  # noqa: E402
+from scraping_common.logging_setup import configure_logging  # noqa: E402
+
+class CountingSink:
+    """Write-only stream that keeps nothing but a line count"""
+
+    def __init__(self):
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        self.lines += text.count("\n")
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def run(pages: list, level: str, structured: bool, sample: int) -> tuple:
+    """(stories per second, log lines written) over all pages with the given logging setup"""
+    sink = CountingSink()
+    configure_logging(level, structured=structured, debug_sample=sample, stream=sink, force=True)
+    stories = 0
+    start = time.perf_counter()
+    for html in pages:
+        stories += len(extract_stories(html)[0])
+    elapsed = time.perf_counter() - start
+    return stories / elapsed, sink.lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Story extraction throughput by logging level")
+    parser.add_argument('--pages', type=int, default=50, help="front pages per run")
+    parser.add_argument('--stories', type=int, default=30, help="stories per page")
+    parser.add_argument('--sample', type=int, default=20, help="keep one debug line in N for 'sampled'")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    pages = [build_front_page(rng, args.stories, 40000000 + i * args.stories) for i in range(args.pages)]
+
+    modes = [
+        ("quiet", "INFO", False, 1),
+        ("verbose", "DEBUG", False, 1),
+        ("json", "DEBUG", True, 1),
+        (f"sampled/{args.sample}", "DEBUG", False, args.sample),
+    ]
+    run(pages[:2], "INFO", False, 1)  # warm up imports and selector caches
+
+    results = [(name, *run(pages, level, structured, sample)) for name, level, structured, sample in modes]
+    logging.getLogger().handlers.clear()
+
+    quiet = results[0][1]
+    print("📝 LOGGING OVERHEAD BENCHMARK")
+    print("=" * 60)
+    print(f"{args.pages} pages x {args.stories} stories")
+    for name, rate, lines in results:
+        print(f"   {name:12}: {rate:8.0f} stories/s ({rate / quiet:5.2f}x quiet) {lines:7,} log lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🧩 BENCHMARK: listing parse throughput by parser backend
+
+Parses the saved listing pages in fixtures/ plus synthetic front pages with
+every installed backend (bs4, lxml, stream) and reports stories per second.
+Before timing, each backend's output is checked against bs4's: same stories,
+same fields, same problem counts, same More link (scraped_at aside).
+
+Logging stays at WARNING so the numbers show parsing alone.
+
+Usage:
+    python benchmarks/bench_parser.py --pages 50 --repeat 3
+"""
+
+import argparse
+import glob
+import logging
+import os
+import random
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from hn_pages import build_front_page  # noqa: E402
+from hn_parser import available_backends, parse_listing  # noqa: E402
+
+FIXTURE_DIR = os.path.join(PROJECT_DIR, "fixtures")
+
+
+def comparable(parsed: tuple) -> tuple:
+    """parse_listing output without the timestamps"""
+    stories, problems, more = parsed
+    return [{k: v for k, v in story.items() if k != 'scraped_at'} for story in stories], problems, more
+
+
+def run(pages: list, backend: str, repeat: int) -> float:
+    """Best stories per second over `repeat` passes through all pages"""
+    best = 0.0
+    for _ in range(repeat):
+        stories = 0
+        start = time.perf_counter()
+        for html in pages:
+            stories += len(parse_listing(html, backend=backend)[0])
+        best = max(best, stories / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Listing parse throughput by parser backend")
+    parser.add_argument('--pages', type=int, default=50, help="synthetic front pages on top of the fixtures")
+    parser.add_argument('--stories', type=int, default=30, help="stories per synthetic page")
+    parser.add_argument('--repeat', type=int, default=3, help="passes per backend (best one counts)")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help="directory of saved listing pages")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(args.fixtures, "*.html"))):
+        with open(path, encoding='utf-8') as f:
+            pages.append(f.read())
+    rng = random.Random(20)
+    pages += [build_front_page(rng, args.stories, 40000000 + i * args.stories) for i in range(args.pages)]
+
+    backends = available_backends()
+    mismatches = []
+    for i, html in enumerate(pages):
+        expected = comparable(parse_listing(html, backend="bs4"))
+        for backend in backends:
+            if comparable(parse_listing(html, backend=backend)) != expected:
+                mismatches.append(f"{backend} differs from bs4 on page {i}")
+
+    results = [(backend, run(pages, backend, args.repeat)) for backend in backends]
+    baseline = dict(results)["bs4"]
+
+    print("🧩 PARSER BACKEND BENCHMARK")
+    print("=" * 60)
+    print(f"{len(pages)} pages ({len(pages) - args.pages} fixtures + {args.pages} synthetic) x {args.repeat} passes")
+    for backend, rate in results:
+        print(f"   {backend:8}: {rate:8.0f} stories/s ({rate / baseline:5.2f}x bs4)")
+
+    for mismatch in mismatches[:10]:
+        print(f"   ❌ {mismatch}")
+    if not mismatches:
+        print("   ✅ every backend matches bs4 output")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+🧪 Synthetic Hacker News listing pages
+
+Builds pages in the table markup news.ycombinator.com serves (athing rows,
+subtext rows, job posts without score/author, the "More" link) for the
+benchmarks and the crawler fixtures in ../fixtures/.
+
+Regenerate the fixtures with:
+    python benchmarks/hn_pages.py --write fixtures
+"""
+
+import argparse
+import os
+import random
+from typing import List, Optional
+
+WORDS = ("show ask rust python postgres compiler startup launch open source database "
+         "browser kernel llm release security paper design").split()
+
+STORIES_PER_PAGE = 30
+
+
+def story_rows(rng: random.Random, item: int, rank: int, job: bool = False) -> str:
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 10))).capitalize()
+    if job:
+        title = f"Example (YC S25) is hiring {rng.choice(WORDS)} engineers"
+    head = (
+        f'<tr class="athing submission" id="{item}">'
+        f'<td align="right" valign="top" class="title"><span class="rank">{rank}.</span></td>'
+    )
+    if job:
+        return (
+            head + '<td></td>'
+            f'<td class="title"><span class="titleline"><a href="https://example.com/jobs/{item}">{title}</a>'
+            f'</span></td></tr>'
+            f'<tr><td colspan="2"></td><td class="subtext">'
+            f'<span class="age" title="2025-08-26T17:00:00"><a href="item?id={item}">2 hours ago</a></span>'
+            f'</td></tr><tr class="spacer" style="height:5px"></tr>'
+        )
+    return (
+        head +
+        f'<td valign="top" class="votelinks"><center><a id="up_{item}" href="vote?id={item}&amp;how=up">'
+        f'<div class="votearrow" title="upvote"></div></a></center></td>'
+        f'<td class="title"><span class="titleline"><a href="https://example.com/{item}">{title}</a>'
+        f'<span class="sitebit comhead"> (<a href="from?site=example.com">'
+        f'<span class="sitestr">example.com</span></a>)</span></span></td></tr>'
+        f'<tr><td colspan="2"></td><td class="subtext"><span class="subline">'
+        f'<span class="score" id="score_{item}">{rng.randint(1, 900)} points</span> by '
+        f'<a href="user?id=user{item % 97}" class="hnuser">user{item % 97}</a> '
+        f'<span class="age" title="2025-08-26T19:00:00"><a href="item?id={item}">3 hours ago</a></span> '
+        f'<span id="unv_{item}"></span> | <a href="hide?id={item}&amp;goto=news">hide</a> | '
+        f'<a href="item?id={item}">{rng.randint(0, 400)}&nbsp;comments</a></span></td></tr>'
+        f'<tr class="spacer" style="height:5px"></tr>'
+    )
+
+
+def build_listing_page(rng: random.Random, items: List[int], first_rank: int = 1,
+                       more_href: Optional[str] = None, jobs: tuple = ()) -> str:
+    """A listing with one story per item id; ids in `jobs` are rendered as job posts"""
+    rows = [story_rows(rng, item, first_rank + i, job=item in jobs) for i, item in enumerate(items)]
+    if more_href:
+        rows.append(f'<tr class="morespace" style="height:10px"></tr><tr><td colspan="2"></td>'
+                    f'<td class="title"><a href="{more_href}" class="morelink" rel="next">More</a></td></tr>')
+    return ('<html lang="en"><head><title>Hacker News</title></head><body><center>'
+            '<table id="hnmain"><tr><td><table class="itemlist">' + "".join(rows) +
+            '</table></td></tr></table></center></body></html>')
+
+
+def build_front_page(rng: random.Random, stories: int, first_id: int = 40000000) -> str:
+    """One page of `stories` regular stories with a More link"""
+    return build_listing_page(rng, [first_id + i for i in range(1, stories + 1)], more_href="?p=2")
+
+
+def write_fixtures(directory: str, seed: int = 19) -> List[str]:
+    """
+    Fixture set for the crawler, named <section>_p<N>.html:
+
+    news     -- 3 pages; the last story of page 1 shows up again at the top
+                of page 2 (it slipped down while the crawl ran) and page 1
+                has a job post
+    newest   -- 2 pages joined by a cursor More link (?next=<id>&n=31)
+    ask/show -- 1 page each
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    pages = {}
+
+    news = [45000000 - i * 7 for i in range(STORIES_PER_PAGE * 3)]
+    pages['news_p1'] = build_listing_page(rng, news[:30], 1, "?p=2", jobs=(news[12],))
+    pages['news_p2'] = build_listing_page(rng, [news[29]] + news[30:59], 31, "?p=3")
+    pages['news_p3'] = build_listing_page(rng, news[59:89], 61)
+
+    newest = [45100000 - i for i in range(STORIES_PER_PAGE * 2)]
+    pages['newest_p1'] = build_listing_page(rng, newest[:30], 1, f"newest?next={newest[29]}&n=31")
+    pages['newest_p2'] = build_listing_page(rng, newest[30:], 31)
+
+    pages['ask_p1'] = build_listing_page(rng, [44900000 - i * 3 for i in range(STORIES_PER_PAGE)])
+    pages['show_p1'] = build_listing_page(rng, [44800000 - i * 5 for i in range(STORIES_PER_PAGE)])
+
+    paths = []
+    for name, html in pages.items():
+        path = os.path.join(directory, f"{name}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html + "\n")
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write the synthetic listing fixtures")
+    parser.add_argument('--write', required=True, help="directory for the fixture files")
+    args = parser.parse_args()
+    for path in write_fixtures(args.write):
+        print(f"💾 {path}")
@@ -0,0 +1,221 @@
+"""
+💬 Hacker News comment threads
+
+Parses the nested comment tree of an item page (`item?id=<story id>`) and
+stores it as one JSON line per comment:
+
+    {"id": "45001234", "parent": "45000000", "depth": 1, "author": "pg",
+     "time": "2025-08-26T19:00:00", "text": "First paragraph\\n\\nSecond"}
+
+The tree is flattened in page order; `depth` is the indent level and
+`parent` the comment above it one level up (the story id at depth 0), so
+the nesting can be rebuilt without storing it.
+
+- the page is read with a streaming tokenizer and every comment is written
+  as soon as its row closes, so a large thread never sits in memory as a
+  list; long threads split over "More" pages keep their depth stack
+- ThreadStore keeps <story id>.jsonl files plus index.json with the
+  comment count each thread was fetched at: threads whose count has not
+  changed since the last run are skipped
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from hn_parser import _VOID_TAGS
+
+# Old item pages give the indent as a spacer image 40px wide per level
+INDENT_WIDTH = 40
+
+
+class CommentTreeParser(HTMLParser):
+    """
+    Streaming item-page parser: feed it page after page of one thread and it
+    calls `on_comment(comment)` for each comment, in page order.
+    """
+
+    def __init__(self, story_id: str, on_comment: Callable[[Dict], None]):
+        super().__init__(convert_charrefs=True)
+        self.story_id = story_id
+        self.on_comment = on_comment
+        self.count = 0
+        self.more: Optional[str] = None
+        self._ancestors: List[str] = []         # comment id per depth, for parent links
+        self._stack: List[Tuple[str, int]] = []
+        self._serial = 0
+        self._comment: Optional[Dict] = None    # comment row being read
+        self._comment_serial = 0
+        self._indent_serial = 0                 # open td.ind of the current comment
+        self._author_serial = 0
+        self._text_serial = 0
+        self._author: List[str] = []
+        self._text: List[str] = []
+
+    def feed_page(self, html: str) -> Optional[str]:
+        """Parse one page of the thread; returns its More link (None on the last page)"""
+        self.more = None
+        self.feed(html)
+        self.close()
+        self.reset()
+        self._stack.clear()
+        return self.more
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        classes = (attributes.get('class') or '').split()
+        self._serial += 1
+        serial = self._serial
+
+        if tag == 'tr' and 'comtr' in classes:
+            self._comment = {'id': attributes.get('id') or '', 'depth': 0, 'author': '', 'time': ''}
+            self._comment_serial = serial
+            self._text = []
+        elif self._comment is not None:
+            if tag == 'td' and 'ind' in classes:
+                self._indent_serial = serial
+                if (attributes.get('indent') or '').isdigit():
+                    self._comment['depth'] = int(attributes['indent'])
+            elif tag == 'img' and self._indent_serial and 'indent' not in attributes:
+                width = attributes.get('width') or ''
+                if width.isdigit():
+                    self._comment['depth'] = int(width) // INDENT_WIDTH
+            elif 'hnuser' in classes and not self._author_serial:
+                self._author_serial = serial
+                self._author = []
+            elif tag == 'span' and 'age' in classes:
+                # title is "<ISO time>" or "<ISO time> <unix time>"
+                self._comment['time'] = (attributes.get('title') or '').split(' ')[0]
+            elif 'commtext' in classes and not self._text_serial:
+                self._text_serial = serial
+            elif tag == 'p' and self._text_serial:
+                self._text.append("\n\n")
+        if tag == 'a' and 'morelink' in classes:
+            self.more = attributes.get('href')
+
+        self._stack.append((tag, serial))
+        if tag in _VOID_TAGS:
+            self._pop_to(len(self._stack) - 1)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if self._stack and self._stack[-1][1] == self._serial:
+            self._pop_to(len(self._stack) - 1)
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                self._pop_to(depth)
+                return
+
+    def handle_data(self, data):
+        if self._author_serial:
+            self._author.append(data)
+        if self._text_serial:
+            self._text.append(data)
+
+    def _pop_to(self, depth: int):
+        while len(self._stack) > depth:
+            _, serial = self._stack.pop()
+            if serial == self._indent_serial:
+                self._indent_serial = 0
+            elif serial == self._author_serial:
+                self._comment['author'] = "".join(self._author).strip()
+                self._author_serial = 0
+            elif serial == self._text_serial:
+                self._text_serial = 0
+            elif serial == self._comment_serial:
+                self._emit()
+
+    def _emit(self):
+        comment = self._comment
+        self._comment = None
+        self._comment_serial = 0
+        depth = comment['depth']
+        del self._ancestors[depth:]
+        parent = self._ancestors[-1] if self._ancestors else self.story_id
+        # Pad when a page starts mid-thread deeper than anything seen so far
+        self._ancestors.extend([parent] * (depth - len(self._ancestors)))
+        self._ancestors.append(comment['id'])
+        self.count += 1
+        self.on_comment({
+            'id': comment['id'],
+            'parent': parent,
+            'depth': depth,
+            'author': comment['author'],
+            'time': comment['time'],
+            'text': "".join(self._text).strip(),
+        })
+
+
+def parse_comments(html: str, story_id: str) -> List[Dict]:
+    """All comments of one saved item page as a list (for small threads and inspection)"""
+    comments = []
+    CommentTreeParser(story_id, comments.append).feed_page(html)
+    return comments
+
+
+class ThreadStore:
+    """
+    Comment threads on disk: <directory>/<story id>.jsonl, one comment per
+    line, and <directory>/index.json with the listing's comment count, the
+    number of comments parsed and the fetch time for every story.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.index: Dict[str, Dict] = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding='utf-8') as f:
+                self.index = json.load(f)
+
+    def path(self, story_id: str) -> str:
+        return os.path.join(self.directory, f"{story_id}.jsonl")
+
+    def is_current(self, story: Dict) -> bool:
+        """True when the thread on disk was fetched at the story's current comment count"""
+        entry = self.index.get(story['id'])
+        return bool(entry) and entry['comments'] == story['comments'] and os.path.exists(self.path(story['id']))
+
+    @contextmanager
+    def writer(self, story_id: str):
+        """
+        Yields write(comment). Lines go to a temporary file that replaces the
+        old thread only when the block finishes, so a failed fetch keeps the
+        previous copy.
+        """
+        path = self.path(story_id)
+        partial = f"{path}.part"
+        with open(partial, 'w', encoding='utf-8') as f:
+            try:
+                yield lambda comment: f.write(json.dumps(comment, ensure_ascii=False) + "\n")
+            except BaseException:
+                f.close()
+                os.remove(partial)
+                raise
+        os.replace(partial, path)
+
+    def record(self, story: Dict, parsed: int):
+        with self._lock:
+            self.index[story['id']] = {'comments': story['comments'], 'parsed': parsed,
+                                       'fetched_at': datetime.now().isoformat()}
+
+    def save_index(self):
+        with self._lock:
+            partial = f"{self.index_path}.part"
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2)
+            os.replace(partial, self.index_path)
+
+    def read(self, story_id: str) -> Iterator[Dict]:
+        """Comments of a stored thread, one at a time"""
+        with open(self.path(story_id), encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
@@ -0,0 +1,287 @@
+"""
+🕸️ Multi-page Hacker News crawler
+
+Crawls the first N pages of a listing (news, newest, ask, show):
+
+    crawler = HNCrawler(max_workers=4)
+    stories = crawler.crawl("news", pages=5)
+
+- page 1 is fetched first; its "More" link decides how to paginate. When the
+  link is `?p=2` (news, ask, show) pages 2..N are fetched concurrently by
+  number; otherwise (newest uses `?next=<id>&n=31`) More links are followed
+  one after another
+- every request goes through one pooled client and the shared per-host rate
+  limiter, so concurrency never exceeds the host budget
+- the listing moves while it is crawled, so a story can show up on two
+  pages: stories are deduplicated by their `athing` id (first page wins) and
+  ranks are renumbered 1..M across the whole crawl
+
+`fetch_threads(stories, ThreadStore(directory))` then downloads the comment
+tree of every story through the same client and rate limiter (see
+hn_comments).
+"""
+
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+import requests
+
+from hn_comments import CommentTreeParser, ThreadStore
+from hn_parser import parse_listing, resolve_backend
+
+# Shared infrastructure lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_common.http_cache import HTTPCache
+from scraping_common.http_client import PooledHTTPClient
+from scraping_common.metrics import shared_metrics
+from scraping_common.rate_limiter import HostRateLimiter, shared_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ('news', 'newest', 'ask', 'show')
+
+
+@dataclass
+class CrawlReport:
+    """Outcome of one section crawl"""
+    section: str
+    pages: int = 0
+    stories: int = 0
+    duplicates: int = 0
+    failed_pages: List[int] = field(default_factory=list)
+    problems: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class ThreadReport:
+    """Outcome of one fetch_threads run"""
+    threads: int = 0
+    fetched: int = 0
+    cached: int = 0
+    empty: int = 0
+    comments: int = 0
+    failed: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def threads_per_second(self) -> float:
+        return self.fetched / self.elapsed if self.elapsed else 0.0
+
+
+class HNCrawler:
+    """
+    Concurrent listing crawler.
+
+    max_workers -- listing pages in flight at once (the rate limiter still
+                   decides how fast requests actually go out)
+    parser      -- hn_parser backend: "auto", "lxml", "stream" or "bs4"
+    """
+
+    BASE_URL = "https://news.ycombinator.com"
+    HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+    def __init__(self, base_url: Optional[str] = None, max_workers: int = 4,
+                 rate_limiter: Optional[HostRateLimiter] = None, http_cache: Optional[HTTPCache] = None,
+                 http_client: Optional[PooledHTTPClient] = None, parser: str = "auto"):
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.max_workers = max_workers
+        self.parser = resolve_backend(parser)
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.http_cache = http_cache
+        self.http_client = http_client or PooledHTTPClient(max_connections_per_host=max_workers)
+        self.last_report: Optional[CrawlReport] = None
+
+    def crawl(self, section: str = "news", pages: int = 1) -> List[Dict]:
+        """Stories from the first `pages` pages of `section`, deduplicated and ranked 1..M"""
+        if section not in SECTIONS:
+            raise ValueError(f"Unknown section '{section}' (choose from {', '.join(SECTIONS)})")
+
+        report = CrawlReport(section)
+        start = time.perf_counter()
+        url = f"{self.base_url}/{section}"
+        listings = self._crawl_pages(url, pages, report)
+        report.pages = len(listings)
+        for _, _, problems in listings:
+            for name, count in problems.items():
+                report.problems[name] = report.problems.get(name, 0) + count
+
+        stories = self._merge(listings, report)
+        for story in stories:
+            story['section'] = section
+
+        report.stories = len(stories)
+        report.elapsed = time.perf_counter() - start
+        self.last_report = report
+        logger.info("🕸️ %s: %d stories from %d pages (%d duplicates dropped) in %.2fs", section,
+                    report.stories, report.pages, report.duplicates, report.elapsed,
+                    extra={'fields': {'section': section, 'pages': report.pages, 'stories': report.stories,
+                                      'duplicates': report.duplicates}})
+        return stories
+
+    def crawl_sections(self, sections: Sequence[str] = SECTIONS, pages: int = 1) -> Dict[str, List[Dict]]:
+        return {section: self.crawl(section, pages) for section in sections}
+
+    def fetch_threads(self, stories: Sequence[Dict], store: ThreadStore) -> ThreadReport:
+        """
+        Download the comment tree of every story into `store`, max_workers
+        threads at a time. Stories without comments, or whose comment count
+        matches the stored thread, are skipped.
+        """
+        report = ThreadReport(threads=len(stories))
+        start = time.perf_counter()
+        pending = []
+        for story in stories:
+            if not story['id'] or not story['comments']:
+                report.empty += 1
+            elif store.is_current(story):
+                report.cached += 1
+            else:
+                pending.append(story)
+        shared_metrics.inc("threads_total", report.cached, scraper="hn", cache="hit")
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                counts = list(pool.map(lambda story: self._fetch_thread(story, store), pending))
+        finally:
+            store.save_index()
+
+        for story, count in zip(pending, counts):
+            if count is None:
+                report.failed.append(story['id'])
+            else:
+                report.fetched += 1
+                report.comments += count
+        report.elapsed = time.perf_counter() - start
+        logger.info("💬 Threads: %d fetched (%d comments), %d unchanged, %d without comments, %d failed in %.2fs",
+                    report.fetched, report.comments, report.cached, report.empty, len(report.failed),
+                    report.elapsed, extra={'fields': {'fetched': report.fetched, 'comments': report.comments,
+                                                      'cached': report.cached, 'failed': len(report.failed)}})
+        return report
+
+    def close(self):
+        self.http_client.close()
+
+    def __enter__(self) -> 'HNCrawler':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _crawl_pages(self, url: str, pages: int, report: CrawlReport) -> List[Tuple[int, List[Dict], Dict[str, int]]]:
+        """(page number, stories, problems) for every page fetched, in page order"""
+        first = self._fetch_listing(url, 1, report)
+        if first is None:
+            return []
+        stories, problems, more = first
+        listings = [(1, stories, problems)]
+        if pages <= 1 or not more:
+            return listings
+
+        if self._numbered(more):
+            # ?p=N pagination: the remaining pages are independent requests
+            numbers = list(range(2, pages + 1))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(
+                    lambda page: self._fetch_listing(f"{url}?p={page}", page, report), numbers))
+            for page, result in zip(numbers, results):
+                if result is None:
+                    continue
+                stories, problems, more = result
+                listings.append((page, stories, problems))
+                if not more:
+                    break  # last page of the listing
+            return listings
+
+        # Cursor pagination: each More link is only known after the page before it
+        page = 1
+        while more and page < pages:
+            page += 1
+            result = self._fetch_listing(urljoin(url, more), page, report)
+            if result is None:
+                break
+            stories, problems, more = result
+            listings.append((page, stories, problems))
+        return listings
+
+    def _fetch_listing(self, url: str, page: int, report: CrawlReport):
+        """parse_listing's (stories, problems, more_href) for one page, None when the fetch fails"""
+        try:
+            response = self._get(url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error("❌ Failed to fetch page %d (%s): %s", page, url, e)
+            report.failed_pages.append(page)
+            return None
+
+        parsed = parse_listing(response.text, backend=self.parser)
+        logger.debug("📄 Page %d: %d stories", page, len(parsed[0]), extra={'fields': {'url': url, **parsed[1]}})
+        return parsed
+
+    def _fetch_thread(self, story: Dict, store: ThreadStore, max_pages: int = 50) -> Optional[int]:
+        """Stream one thread (following its More pages) into the store; comments written, None on failure"""
+        url = f"{self.base_url}/item?id={story['id']}"
+        seen = set()
+        try:
+            with store.writer(story['id']) as write:
+                parser = CommentTreeParser(story['id'], write)
+                while url and url not in seen and len(seen) < max_pages:
+                    seen.add(url)
+                    response = self._get(url)
+                    response.raise_for_status()
+                    with shared_metrics.span("parse", scraper="hn", kind="comments"):
+                        more = parser.feed_page(response.text)
+                    url = urljoin(url, more) if more else None
+        except (requests.RequestException, OSError) as e:
+            logger.error("❌ Failed to fetch comments for %s: %s", story['id'], e)
+            return None
+
+        store.record(story, parser.count)
+        shared_metrics.inc("threads_total", scraper="hn", cache="miss")
+        shared_metrics.inc("comments_total", parser.count, scraper="hn")
+        logger.debug("💬 %s: %d comments over %d pages", story['id'], parser.count, len(seen))
+        return parser.count
+
+    def _get(self, url: str) -> requests.Response:
+        """GET through the HTTP cache (if any), the rate limiter and the pooled client"""
+        def send(conditional_headers: Dict[str, str]) -> requests.Response:
+            waited = self.rate_limiter.acquire(url)
+            shared_metrics.observe("rate_limit_wait_seconds", waited, scraper="hn")
+            start = time.perf_counter()
+            response = self.http_client.get(url, headers={**self.HEADERS, **conditional_headers}, timeout=15)
+            shared_metrics.observe_http(response, time.perf_counter() - start, scraper="hn")
+            self.rate_limiter.observe(url, response)
+            return response
+
+        with shared_metrics.span("fetch", scraper="hn"):
+            if self.http_cache is None:
+                return send({})
+            return self.http_cache.fetch(url, send)
+
+    @staticmethod
+    def _numbered(more_href: str) -> bool:
+        return 'p' in parse_qs(urlparse(more_href).query)
+
+    @staticmethod
+    def _merge(listings: List[Tuple[int, List[Dict], Dict[str, int]]], report: CrawlReport) -> List[Dict]:
+        """Drop stories already seen on an earlier page and renumber ranks globally"""
+        seen = set()
+        merged = []
+        for page, stories, _ in listings:
+            for story in stories:
+                if story['id'] and story['id'] in seen:
+                    report.duplicates += 1
+                    continue
+                seen.add(story['id'])
+                merged.append({**story, 'rank': len(merged) + 1, 'page': page})
+        return merged
@@ -0,0 +1,236 @@
+"""
+📈 Hacker News listing monitor
+
+Polls a listing on a schedule and keeps a time series of every story's
+rank, score and comment count, without writing a full snapshot per poll:
+
+    with HNCrawler() as crawler:
+        monitor = HNMonitor(crawler, DeltaStore("hn_news_deltas.jsonl"), interval=60)
+        monitor.run()
+
+- each poll is diffed against the previous one by story id and only the
+  deltas are appended to the store, one compact JSON line per poll:
+
+    {"t":1756234800.0,"new":{"45000001":{"rank":30,"score":1,"comments":0,"title":"...","url":"...","author":"..."}},
+     "changed":{"44999990":{"rank":2,"score":151}},"dropped":["44999001"]}
+
+  a poll where nothing moved is just {"t":...}, so the log also shows when
+  the monitor was running
+- DeltaStore replays the log once at startup and then keeps the series in
+  memory, so `score_velocity("45000001")` is answered without reading any
+  file, and a restarted monitor carries on diffing where it stopped
+- polls with failed pages are not diffed, so a fetch error never shows up
+  as every story dropping off the front page
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from hn_crawler import HNCrawler
+
+# Shared infrastructure lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_common.metrics import shared_metrics
+
+logger = logging.getLogger(__name__)
+
+TRACKED = ('rank', 'score', 'comments')
+DETAILS = ('title', 'url', 'author')
+
+
+class StorySeries:
+    """Change points of one story: parallel lists, one entry per poll where something moved"""
+
+    __slots__ = ('title', 'url', 'author', 'times', 'ranks', 'scores', 'comments', 'dropped_at')
+
+    def __init__(self, details: Dict):
+        self.title = details.get('title', '')
+        self.url = details.get('url', '')
+        self.author = details.get('author', '')
+        self.times: List[float] = []
+        self.ranks: List[int] = []
+        self.scores: List[int] = []
+        self.comments: List[int] = []
+        self.dropped_at: Optional[float] = None
+
+    def add(self, t: float, rank: int, score: int, comments: int):
+        self.times.append(t)
+        self.ranks.append(rank)
+        self.scores.append(score)
+        self.comments.append(comments)
+        self.dropped_at = None
+
+    def latest(self) -> Dict:
+        return {'rank': self.ranks[-1], 'score': self.scores[-1], 'comments': self.comments[-1]}
+
+    def score_at(self, t: float) -> Optional[int]:
+        """Score as last observed at or before `t` (None before the story was first seen)"""
+        index = bisect_right(self.times, t)
+        return self.scores[index - 1] if index else None
+
+
+class DeltaStore:
+    """
+    Append-only delta log plus the in-memory series rebuilt from it.
+
+    path -- JSONL file; created on the first poll, replayed if it exists
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.series: Dict[str, StorySeries] = {}
+        self.current: Dict[str, Dict] = {}   # story id -> tracked fields at the last poll
+        self.polls = 0
+        self.first_poll: Optional[float] = None
+        self.last_poll: Optional[float] = None
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        self._apply(json.loads(line))
+
+    def diff(self, stories: List[Dict], t: float) -> Dict:
+        """Delta record between the last poll and `stories` (not yet stored)"""
+        record = {'t': round(t, 3)}
+        new, changed = {}, {}
+        seen = set()
+        for story in stories:
+            story_id = story['id']
+            if not story_id:
+                continue
+            seen.add(story_id)
+            previous = self.current.get(story_id)
+            if previous is None:
+                new[story_id] = {**{k: story[k] for k in TRACKED}, **{k: story[k] for k in DETAILS}}
+                continue
+            moved = {k: story[k] for k in TRACKED if story[k] != previous[k]}
+            if moved:
+                changed[story_id] = moved
+        dropped = [story_id for story_id in self.current if story_id not in seen]
+        if new:
+            record['new'] = new
+        if changed:
+            record['changed'] = changed
+        if dropped:
+            record['dropped'] = dropped
+        return record
+
+    def append(self, record: Dict):
+        """Write one delta record and apply it to the in-memory series"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._apply(record)
+
+    def history(self, story_id: str) -> List[Dict]:
+        """Every change point of a story: [{t, rank, score, comments}, ...]"""
+        series = self.series.get(story_id)
+        if series is None:
+            return []
+        return [{'t': t, 'rank': rank, 'score': score, 'comments': comments}
+                for t, rank, score, comments in zip(series.times, series.ranks, series.scores, series.comments)]
+
+    def score_velocity(self, story_id: str, window: Optional[float] = 3600.0) -> Optional[float]:
+        """
+        Points per hour over the last `window` seconds of monitoring (the
+        whole history with window=None); None for unknown stories or when
+        there is no time span yet.
+        """
+        series = self.series.get(story_id)
+        if series is None or self.last_poll is None:
+            return None
+        end = series.dropped_at or self.last_poll
+        start = series.times[0] if window is None else max(series.times[0], end - window)
+        if end <= start:
+            return None
+        return (series.score_at(end) - series.score_at(start)) * 3600.0 / (end - start)
+
+    def top_movers(self, count: int = 5, window: Optional[float] = 3600.0) -> List[Tuple[str, float]]:
+        """(story id, points per hour) of the fastest-rising stories still on the listing"""
+        velocities = []
+        for story_id in self.current:
+            velocity = self.score_velocity(story_id, window)
+            if velocity is not None:
+                velocities.append((story_id, velocity))
+        velocities.sort(key=lambda item: item[1], reverse=True)
+        return velocities[:count]
+
+    def _apply(self, record: Dict):
+        t = record['t']
+        for story_id, fields in record.get('new', {}).items():
+            series = self.series.get(story_id)
+            if series is None:
+                series = self.series[story_id] = StorySeries(fields)
+            series.add(t, fields['rank'], fields['score'], fields['comments'])
+            self.current[story_id] = {k: fields[k] for k in TRACKED}
+        for story_id, moved in record.get('changed', {}).items():
+            state = self.current[story_id]
+            state.update(moved)
+            self.series[story_id].add(t, state['rank'], state['score'], state['comments'])
+        for story_id in record.get('dropped', ()):
+            self.current.pop(story_id, None)
+            self.series[story_id].dropped_at = t
+        self.polls += 1
+        if self.first_poll is None:
+            self.first_poll = t
+        self.last_poll = t
+
+
+class HNMonitor:
+    """
+    Poll loop around a crawler and a DeltaStore.
+
+    interval -- seconds between poll starts; a slow poll delays the next one
+                instead of piling polls up
+    """
+
+    def __init__(self, crawler: HNCrawler, store: DeltaStore, section: str = "news",
+                 pages: int = 1, interval: float = 60.0):
+        self.crawler = crawler
+        self.store = store
+        self.section = section
+        self.pages = pages
+        self.interval = interval
+
+    def poll(self) -> Optional[Dict]:
+        """Crawl once and store the deltas; None when the poll was incomplete and skipped"""
+        stories = self.crawler.crawl(self.section, self.pages)
+        report = self.crawler.last_report
+        if report.failed_pages or not stories:
+            logger.warning("⚠️  Poll skipped: %d stories, failed pages %s", len(stories), report.failed_pages or "none")
+            shared_metrics.inc("monitor_polls_total", scraper="hn", outcome="skipped")
+            return None
+
+        record = self.store.diff(stories, time.time())
+        self.store.append(record)
+        counts = {kind: len(record.get(kind, ())) for kind in ('new', 'changed', 'dropped')}
+        shared_metrics.inc("monitor_polls_total", scraper="hn", outcome="stored")
+        for kind, count in counts.items():
+            shared_metrics.inc("monitor_deltas_total", count, scraper="hn", kind=kind)
+        logger.info("📈 Poll %d: %d new, %d changed, %d dropped", self.store.polls, counts['new'],
+                    counts['changed'], counts['dropped'], extra={'fields': {'section': self.section, **counts}})
+        return record
+
+    def run(self, polls: Optional[int] = None):
+        """Poll every `interval` seconds, `polls` times (forever with None) or until Ctrl+C"""
+        done = 0
+        next_poll = time.monotonic()
+        try:
+            while polls is None or done < polls:
+                self.poll()
+                done += 1
+                if polls is not None and done >= polls:
+                    break
+                next_poll = max(next_poll + self.interval, time.monotonic())
+                # The clamp above can already be in the past by now
+                time.sleep(max(0.0, next_poll - time.monotonic()))
+        except KeyboardInterrupt:
+            logger.info("🛑 Monitor stopped after %d polls", done)
+
+        for story_id, velocity in self.store.top_movers(3):
+            series = self.store.series[story_id]
+            logger.info("🚀 %+.0f points/h | #%d %s", velocity, series.ranks[-1], series.title[:60])
@@ -0,0 +1,385 @@
+"""
+🧩 Hacker News listing parser
+
+Turns the HTML of a listing page (news, newest, ask, show) into story dicts:
+id (the `athing` row id), rank, title, url, score, author, comments and
+scraped_at. Fields that are missing on a story (job posts have no score or
+author) keep their defaults and are counted in `problems`.
+
+Backends pull the same raw fields out of the page; one shared builder turns
+them into dicts, so every backend produces identical output:
+
+    bs4    -- BeautifulSoup + html.parser and CSS selectors per row (original)
+    lxml   -- libxml2 tree, precompiled XPath per row, all in C
+    stream -- stdlib tokenizer, one linear pass and no tree at all
+    auto   -- lxml when installed, else stream
+"""
+
+import logging
+import os
+import re
+import sys
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# Shared infrastructure lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_common.metrics import shared_metrics
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = re.compile(r'(\d+)')
+
+# Elements that never have an end tag (the stream backend must not wait for one)
+_VOID_TAGS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input",
+                        "link", "meta", "param", "source", "track", "wbr"))
+
+
+class RawStory(NamedTuple):
+    """What a backend found for one athing row, before any cleaning"""
+    item_id: str
+    title: Optional[str]         # None when the row has no title link
+    url: str
+    has_metadata: bool           # a sibling <tr> follows the row
+    score_text: Optional[str]    # full text of the first .score element
+    author: Optional[str]        # stripped text of the first .hnuser element
+    item_links: Tuple[str, ...]  # texts of the metadata row's a[href*="item"] links
+
+
+def available_backends() -> List[str]:
+    backends = ["bs4", "stream"]
+    if lxml is not None:
+        backends.append("lxml")
+    return backends
+
+
+def resolve_backend(backend: str) -> str:
+    if backend != "auto":
+        if backend not in available_backends():
+            raise ValueError(f"Parser backend '{backend}' is not available "
+                             f"(installed: {', '.join(available_backends())})")
+        return backend
+    return "lxml" if lxml is not None else "stream"
+
+
+def _stripped_text(fragments) -> str:
+    """BeautifulSoup's get_text(strip=True): every fragment stripped, then joined"""
+    return "".join(fragment.strip() for fragment in fragments)
+
+
+# --- bs4 ---------------------------------------------------------------------
+
+def _bs4_rows(html: str) -> Tuple[List[RawStory], Optional[str]]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for container in soup.find_all('tr', class_='athing'):
+        title_elem = container.select_one('td.title a')
+        metadata_row = container.find_next_sibling('tr')
+        score_elem = author_elem = None
+        item_links: Tuple[str, ...] = ()
+        if metadata_row:
+            score_elem = metadata_row.select_one('.score')
+            author_elem = metadata_row.select_one('.hnuser')
+            item_links = tuple(link.get_text() for link in metadata_row.select('a[href*="item"]'))
+        rows.append(RawStory(
+            item_id=container.get('id', ''),
+            title=title_elem.get_text(strip=True) if title_elem else None,
+            url=title_elem.get('href', '') if title_elem else '',
+            has_metadata=bool(metadata_row),
+            score_text=score_elem.get_text() if score_elem else None,
+            author=author_elem.get_text(strip=True) if author_elem else None,
+            item_links=item_links,
+        ))
+    more = soup.select_one('a.morelink')
+    return rows, more.get('href') if more else None
+
+
+# --- lxml --------------------------------------------------------------------
+
+def _has_class(name: str) -> str:
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+if lxml is not None:
+    _ATHING_ROWS = lxml.etree.XPath(f'//tr[{_has_class("athing")}]')
+    _TITLE_LINK = lxml.etree.XPath(f'(.//td[{_has_class("title")}]//a)[1]')
+    _NEXT_ROW = lxml.etree.XPath('following-sibling::tr[1]')
+    _SCORE = lxml.etree.XPath(f'(.//*[{_has_class("score")}])[1]')
+    _HNUSER = lxml.etree.XPath(f'(.//*[{_has_class("hnuser")}])[1]')
+    _ITEM_LINKS = lxml.etree.XPath('.//a[contains(@href, "item")]')
+    _MORE_LINK = lxml.etree.XPath(f'(//a[{_has_class("morelink")}])[1]/@href', smart_strings=False)
+    _TEXTS = lxml.etree.XPath('.//text()', smart_strings=False)
+
+
+def _lxml_rows(html: str) -> Tuple[List[RawStory], Optional[str]]:
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (ValueError, lxml.etree.ParserError):
+        return [], None
+
+    rows = []
+    for container in _ATHING_ROWS(root):
+        title_elem = _TITLE_LINK(container)
+        next_rows = _NEXT_ROW(container)
+        metadata_row = next_rows[0] if next_rows else None
+        has_metadata = metadata_row is not None
+        score_elem = author_elem = None
+        item_links: Tuple[str, ...] = ()
+        if has_metadata:
+            score_elem = _SCORE(metadata_row)
+            author_elem = _HNUSER(metadata_row)
+            item_links = tuple("".join(_TEXTS(link)) for link in _ITEM_LINKS(metadata_row))
+        rows.append(RawStory(
+            item_id=container.get('id', ''),
+            title=_stripped_text(_TEXTS(title_elem[0])) if title_elem else None,
+            url=title_elem[0].get('href', '') if title_elem else '',
+            has_metadata=has_metadata,
+            score_text="".join(_TEXTS(score_elem[0])) if score_elem else None,
+            author=_stripped_text(_TEXTS(author_elem[0])) if author_elem else None,
+            item_links=item_links,
+        ))
+    more = _MORE_LINK(root)
+    return rows, more[0] if more else None
+
+
+# --- stream ------------------------------------------------------------------
+
+class _StreamingListingParser(HTMLParser):
+    """
+    One pass over the tokens. An open-element stack (with a serial number per
+    element) stands in for the tree: it tells which <tr> is the next sibling
+    of an athing row and which text belongs to the element being captured.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stories: List[dict] = []
+        self.more: Optional[str] = None
+        self._stack: List[Tuple[str, int]] = []
+        self._serial = 0
+        # Text captures: element serial -> ([(story, field), ...], fragments)
+        self._captures: Dict[int, Tuple[list, List[str]]] = {}
+        self._row_story: Optional[dict] = None   # athing row being read
+        self._row_serial = 0
+        self._title_tds = 0
+        self._waiting_story: Optional[dict] = None  # athing row closed, metadata row not seen yet
+        self._waiting_parent = 0
+        self._meta_story: Optional[dict] = None  # metadata row being read
+        self._meta_serial = 0
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        classes = (attributes.get('class') or '').split()
+        self._serial += 1
+        serial = self._serial
+        parent = self._stack[-1][1] if self._stack else 0
+        meta = self._meta_story
+
+        if tag == 'tr':
+            if self._waiting_story is not None and parent == self._waiting_parent:
+                # First <tr> after the athing row under the same parent
+                meta = self._meta_story = self._waiting_story
+                meta['meta_found'] = True
+                self._meta_serial = serial
+                self._waiting_story = None
+            if 'athing' in classes:
+                self._row_story = {'item_id': attributes.get('id') or '', 'title': None, 'url': '',
+                                   'meta_found': False, 'score_text': None,
+                                   'author': None, 'item_links': [], 'capturing': set()}
+                self._row_serial = serial
+                self._title_tds = 0
+                self.stories.append(self._row_story)
+        elif tag == 'td' and 'title' in classes and self._row_story is not None:
+            self._title_tds += 1
+
+        targets = []
+        row = self._row_story
+        if tag == 'a':
+            if row is not None and self._title_tds and row['title'] is None and 'title' not in row['capturing']:
+                row['url'] = attributes.get('href') or ''
+                targets.append((row, 'title'))
+            if meta is not None and 'item' in (attributes.get('href') or ''):
+                targets.append((meta, 'item_links'))
+            if 'morelink' in classes and self.more is None:
+                self.more = attributes.get('href')
+        if meta is not None:
+            if 'score' in classes and meta['score_text'] is None and 'score_text' not in meta['capturing']:
+                targets.append((meta, 'score_text'))
+            if 'hnuser' in classes and meta['author'] is None and 'author' not in meta['capturing']:
+                targets.append((meta, 'author'))
+        if targets:
+            for story, name in targets:
+                story['capturing'].add(name)
+            self._captures[serial] = (targets, [])
+
+        self._stack.append((tag, serial))
+        if tag in _VOID_TAGS:
+            self._pop_to(len(self._stack) - 1)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if self._stack and self._stack[-1][1] == self._serial:
+            self._pop_to(len(self._stack) - 1)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element; stray end tags are ignored
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                self._pop_to(depth)
+                return
+
+    def handle_data(self, data):
+        for _, fragments in self._captures.values():
+            fragments.append(data)
+
+    def close(self):
+        super().close()
+        self._pop_to(0)
+
+    def _pop_to(self, depth: int):
+        while len(self._stack) > depth:
+            tag, serial = self._stack.pop()
+            capture = self._captures.pop(serial, None)
+            if capture is not None:
+                targets, fragments = capture
+                for story, name in targets:
+                    story['capturing'].discard(name)
+                    if name == 'item_links':
+                        story['item_links'].append("".join(fragments))
+                    elif name == 'score_text':
+                        story['score_text'] = "".join(fragments)
+                    else:
+                        story[name] = _stripped_text(fragments)
+
+            if tag == 'td' and self._title_tds and self._row_story is not None:
+                self._title_tds -= 1
+            if serial == self._row_serial:
+                # Athing row closed: its metadata row is the next <tr> under the same parent
+                self._waiting_story = self._row_story
+                self._waiting_parent = self._stack[-1][1] if self._stack else 0
+                self._row_story = None
+                self._row_serial = 0
+            if serial == self._meta_serial:
+                self._meta_story = None
+                self._meta_serial = 0
+            if serial == self._waiting_parent and self._waiting_story is not None:
+                self._waiting_story = None  # parent closed without another <tr>
+
+    def rows(self) -> List[RawStory]:
+        return [RawStory(story['item_id'], story['title'], story['url'], story['meta_found'],
+                         story['score_text'], story['author'], tuple(story['item_links']))
+                for story in self.stories]
+
+
+def _stream_rows(html: str) -> Tuple[List[RawStory], Optional[str]]:
+    parser = _StreamingListingParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows(), parser.more
+
+
+# --- shared ------------------------------------------------------------------
+
+def _build_story(raw: RawStory, rank: int, scraped_at: str, problems: Dict[str, int]) -> Optional[Dict]:
+    """Clean one row into a story dict, counting what is missing; None for unusable rows"""
+    if raw.title is None:
+        logger.debug("❌ No title element found in story %d", rank)
+        problems['failed'] += 1
+        return None
+    if not raw.title:
+        logger.debug("❌ Empty title in story %d", rank)
+        problems['failed'] += 1
+        return None
+
+    score = 0
+    author = "Unknown"
+    comments = 0
+
+    if raw.has_metadata:
+        score_match = _NUMBER.search(raw.score_text) if raw.score_text is not None else None
+        if score_match:
+            score = int(score_match.group(1))
+        else:
+            problems['no_score'] += 1
+
+        if raw.author is not None:
+            author = raw.author
+        else:
+            problems['no_author'] += 1
+
+        for text in raw.item_links:
+            if 'comment' in text.lower():
+                comment_match = _NUMBER.search(text)
+                if comment_match:
+                    comments = int(comment_match.group(1))
+                    break
+        else:
+            problems['no_comments'] += 1
+    else:
+        problems['no_metadata'] += 1
+
+    return {
+        'id': raw.item_id,
+        'rank': rank,
+        'title': raw.title,
+        'url': raw.url,
+        'score': score,
+        'author': author,
+        'comments': comments,
+        'scraped_at': scraped_at,
+    }
+
+
+def parse_listing(html: str, first_rank: int = 1,
+                  backend: str = "auto") -> Tuple[List[Dict], Dict[str, int], Optional[str]]:
+    """
+    Parse one listing page (front page, newest, ask, show...) into story dicts.
+    Returns: (stories, problems, more_href) - problems counts failed stories
+    and missing fields, so a run logs one summary instead of a warning per
+    story; more_href is the page's "More" link, None on the last page
+    """
+    backend = resolve_backend(backend)
+    # Per-story lines are only built when DEBUG is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    problems = {'failed': 0, 'no_score': 0, 'no_author': 0, 'no_comments': 0, 'no_metadata': 0}
+
+    with shared_metrics.span("parse", scraper="hn", backend=backend):
+        if backend == "lxml":
+            rows, more = _lxml_rows(html)
+        elif backend == "stream":
+            rows, more = _stream_rows(html)
+        else:
+            rows, more = _bs4_rows(html)
+    logger.debug("🔍 Found %d story containers", len(rows))
+
+    # One timestamp per page instead of one datetime.now() per story
+    scraped_at = datetime.now().isoformat()
+    stories = []
+    for i, raw in enumerate(rows):
+        story = _build_story(raw, first_rank + i, scraped_at, problems)
+        if story is None:
+            continue
+        stories.append(story)
+        if debug:
+            logger.debug("✅ Story #%d: %s | %d points | %s | %d comments", story['rank'], story['title'][:50],
+                         story['score'], story['author'], story['comments'],
+                         extra={'fields': {'id': story['id'], 'url': story['url']}})
+
+    shared_metrics.inc("stories_total", len(stories), scraper="hn")
+    shared_metrics.inc("failed_extractions_total", problems['failed'], scraper="hn")
+    return stories, problems, more
+
+
+def extract_stories(html: str, backend: str = "auto") -> Tuple[List[Dict], Dict[str, int]]:
+    """parse_listing without the More link: (stories, problems)"""
+    stories, problems, _ = parse_listing(html, backend=backend)
+    return stories, problems
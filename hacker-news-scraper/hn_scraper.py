@@ -4,176 +4,114 @@
 Based on super debug findings - no more hide and seek!
 """
 
-import requests
-from bs4 import BeautifulSoup
+import argparse
 import json
-import re
+import logging
+import os
+import sys
 from datetime import datetime
+from typing import Optional
 
-def scrape_hacker_news():
-    print("🚀 HACKER NEWS PRODUCTION SCRAPER")
-    print("Based on your DevTools detective work!")
-    print("=" * 50)
-    
-    url = "https://news.ycombinator.com"
+from hn_comments import ThreadStore
+from hn_crawler import SECTIONS, HNCrawler
+from hn_monitor import DeltaStore, HNMonitor
+
+# Shared infrastructure lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraping_common.logging_setup import configure_logging
+from scraping_common.metrics import shared_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def scrape_hacker_news(http_cache=None, section: str = "news", pages: int = 1,
+                       crawler: Optional[HNCrawler] = None, comments_dir: Optional[str] = None):
+    """
+    Crawl the first `pages` pages of a listing, save them as JSON and return the stories.
+    With `comments_dir`, each story's comment tree is saved there as <id>.jsonl too
+    """
+    logger.info("🚀 HACKER NEWS PRODUCTION SCRAPER")
     
-    # Get the page
+    own_crawler = crawler is None
+    crawler = crawler or HNCrawler(http_cache=http_cache)
     try:
-        print("🔍 Scraping Hacker News front page...")
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        print("=" * 50)
-        print(f"✅ Status: {response.status_code}")
-        print(f"📏 Page size: {len(response.text):,} characters")
-        
-    except requests.RequestException as e:
-        print(f"❌ Failed to fetch page: {e}")
-        return []
-    
-    # Parse HTML
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    # Find story containers
-    story_containers = soup.find_all('tr', class_='athing')
-    print(f"🔍 Found {len(story_containers)} story containers")
-    
-    stories = []
-    failed_extractions = 0
+        logger.info("🔍 Crawling Hacker News /%s (%d page%s)...", section, pages, "" if pages == 1 else "s")
+        stories = crawler.crawl(section, pages)
+        if comments_dir and stories:
+            logger.info("💬 Fetching comment threads into %s...", comments_dir)
+            crawler.fetch_threads(stories, ThreadStore(comments_dir))
+    finally:
+        if own_crawler:
+            crawler.close()
+    report = crawler.last_report
     
-    # Extract stories with VERBOSE error reporting
-    for i, container in enumerate(story_containers):
-        try:
-            print(f"\n🔄 Processing story #{i+1} (ID: {container.get('id', 'UNKNOWN')})")
-            
-            # Extract title and URL
-            title_elem = container.select_one('td.title a')
-            if not title_elem:
-                print(f"  ❌ No title element found in container {i+1}")
-                failed_extractions += 1
-                continue
-                
-            title = title_elem.get_text(strip=True)
-            url = title_elem.get('href', '')
-            
-            if not title:
-                print(f"  ❌ Empty title in container {i+1}")
-                failed_extractions += 1
-                continue
-            
-            print(f"  ✅ Title: {title[:50]}{'...' if len(title) > 50 else ''}")
-            print(f"  ✅ URL: {url[:50]}{'...' if len(url) > 50 else ''}")
-            
-            # Find metadata row
-            metadata_row = container.find_next_sibling('tr')
-            score = 0
-            author = "Unknown"
-            comments = 0
-            
-            if metadata_row:
-                print(f"  ✅ Found metadata row")
-                
-                # Extract score - BE FORGIVING
-                try:
-                    score_elem = metadata_row.select_one('.score')
-                    if score_elem:
-                        score_text = score_elem.get_text()
-                        score_match = re.search(r'(\d+)', score_text)
-                        if score_match:
-                            score = int(score_match.group(1))
-                            print(f"  ✅ Score: {score}")
-                        else:
-                            print(f"  ⚠️  Score element found but no number: '{score_text}'")
-                    else:
-                        print(f"  ⚠️  No score element found")
-                except Exception as e:
-                    print(f"  ⚠️  Score extraction error: {e}")
-                
-                # Extract author - BE FORGIVING  
-                try:
-                    author_elem = metadata_row.select_one('.hnuser')
-                    if author_elem:
-                        author = author_elem.get_text(strip=True)
-                        print(f"  ✅ Author: {author}")
-                    else:
-                        print(f"  ⚠️  No author found")
-                except Exception as e:
-                    print(f"  ⚠️  Author extraction error: {e}")
-                
-                # Extract comments - BE FORGIVING
-                try:
-                    comment_links = metadata_row.select('a[href*="item"]')
-                    if comment_links:
-                        for link in comment_links:
-                            link_text = link.get_text().lower()
-                            if 'comment' in link_text:
-                                comment_match = re.search(r'(\d+)', link.get_text())
-                                if comment_match:
-                                    comments = int(comment_match.group(1))
-                                    print(f"  ✅ Comments: {comments}")
-                                    break
-                        else:
-                            print(f"  ⚠️  Comment links found but no comment count")
-                    else:
-                        print(f"  ⚠️  No comment links found")
-                except Exception as e:
-                    print(f"  ⚠️  Comments extraction error: {e}")
-                    
-            else:
-                print(f"  ⚠️  No metadata row found")
-            
-            # Create story object - ALWAYS INCLUDE if we have title
-            story = {
-                'rank': i + 1,
-                'title': title,
-                'url': url,
-                'score': score,
-                'author': author,
-                'comments': comments,
-                'scraped_at': datetime.now().isoformat()
-            }
-            
-            stories.append(story)
-            print(f"  🎯 Story #{i+1}: SUCCESSFULLY ADDED!")
-            
-        except Exception as e:
-            print(f"  💥 CRITICAL ERROR in story #{i+1}: {e}")
-            print(f"  🔍 Container HTML preview: {str(container)[:100]}...")
-            failed_extractions += 1
-            continue
+    if report.failed_pages:
+        logger.error("❌ Failed to fetch pages: %s", ", ".join(map(str, report.failed_pages)))
     
-    print("=" * 50)
-    print(f"🎯 Successfully extracted {len(stories)} stories!")
-    if failed_extractions > 0:
-        print(f"⚠️  Failed extractions: {failed_extractions}")
+    # One summary line per run instead of a line per story and field
+    problems = report.problems
+    logger.info("🎯 Successfully extracted %d stories", len(stories),
+                extra={'fields': {'stories': len(stories), 'duplicates': report.duplicates, **problems}})
+    missing = {field: count for field, count in problems.items() if count and field != 'failed'}
+    if problems.get('failed') or missing:
+        logger.warning("⚠️  Failed extractions: %d | missing fields: %s", problems.get('failed', 0),
+                       ", ".join(f"{field[3:]} x{count}" for field, count in missing.items()) or "none")
     
     if len(stories) == 0:
-        print("❌ No stories extracted. Check the selectors or site structure.")
+        logger.error("❌ No stories extracted. Check the selectors or site structure.")
         return []
     
     # Save results
     try:
-        filename = f"hacker_news_stories_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
+        prefix = "hacker_news_stories" if section == "news" else f"hacker_news_{section}"
+        filename = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with shared_metrics.span("save", scraper="hn"), open(filename, 'w', encoding='utf-8') as f:
             json.dump(stories, f, indent=2, ensure_ascii=False)
-        print(f"💾 Saved {len(stories)} stories to: {filename}")
+        logger.info("💾 Saved %d stories to: %s", len(stories), filename)
         
         # Also show first few stories
-        print("\n📊 FIRST 3 STORIES PREVIEW:")
-        print("-" * 30)
-        for i, story in enumerate(stories[:3]):
-            print(f"\n{i+1}. {story['title']}")
-            print(f"   🔗 {story['url']}")
-            print(f"   ⭐ {story['score']} points | 👤 {story['author']} | 💬 {story['comments']} comments")
+        for story in stories[:3]:
+            logger.info("📊 %d. %s | ⭐ %d points | 👤 %s | 💬 %d comments | 🔗 %s", story['rank'], story['title'],
+                        story['score'], story['author'], story['comments'], story['url'])
             
     except Exception as e:
-        print(f"❌ Error saving file: {e}")
+        logger.error("❌ Error saving file: %s", e)
     
     return stories
 
 if __name__ == "__main__":
-    stories = scrape_hacker_news()
+    parser = argparse.ArgumentParser(description="Hacker News listing crawler")
+    parser.add_argument('--section', action='append', choices=SECTIONS,
+                        help="listing to crawl, repeatable (default: news)")
+    parser.add_argument('--pages', type=int, default=1, help="pages per listing (30 stories each)")
+    parser.add_argument('--workers', type=int, default=4, help="listing pages fetched concurrently")
+    parser.add_argument('--base-url', default=None, help="site root (e.g. a local fixture server)")
+    parser.add_argument('--parser', default="auto", choices=("auto", "lxml", "stream", "bs4"),
+                        help="listing parser backend (auto: lxml if installed, else stream)")
+    parser.add_argument('--comments', metavar='DIR', default=None,
+                        help="also save each story's comment tree as DIR/<id>.jsonl (unchanged threads are skipped)")
+    parser.add_argument('--monitor', type=float, metavar='SECONDS', default=None,
+                        help="keep polling the (first) section every SECONDS and record only what changed")
+    parser.add_argument('--polls', type=int, default=None, help="stop the monitor after N polls (default: run until Ctrl+C)")
+    parser.add_argument('--deltas', default=None, help="monitor delta log (default: hn_<section>_deltas.jsonl)")
+    args = parser.parse_args()
+    
+    # SCRAPER_LOG_LEVEL=DEBUG shows every story, SCRAPER_LOG_FORMAT=json for log pipelines
+    configure_logging(fmt='%(message)s')
+    if args.monitor:
+        section = (args.section or ["news"])[0]
+        store = DeltaStore(args.deltas or f"hn_{section}_deltas.jsonl")
+        logger.info("📈 Monitoring /%s every %gs into %s (%d earlier polls)", section, args.monitor,
+                    store.path, store.polls)
+        with HNCrawler(base_url=args.base_url, max_workers=args.workers, parser=args.parser) as crawler:
+            HNMonitor(crawler, store, section, args.pages, args.monitor).run(args.polls)
+        sys.exit(0)
+    
+    stories = []
+    with HNCrawler(base_url=args.base_url, max_workers=args.workers, parser=args.parser) as crawler:
+        for section in args.section or ["news"]:
+            stories += scrape_hacker_news(section=section, pages=args.pages, crawler=crawler,
+                                          comments_dir=args.comments)
     print(f"\n🏆 FINAL RESULT: {len(stories)} stories successfully scraped!")
     if len(stories) > 0:
-        print("🎉 Victory! Your DevTools detective work paid off!")
\ No newline at end of file
+        print("🎉 Victory! Your DevTools detective work paid off!")
@@ -0,0 +1,13 @@
+"""
+Shared building blocks for the scrapers in this repository.
+
+Each project adds the repository root to `sys.path` and imports from here,
+so every fetch path in a process shares the same infrastructure.
+"""
+
+from scraping_common.http_cache import HTTPCache
+from scraping_common.metrics import Metrics, shared_metrics
+from scraping_common.rate_limiter import HostRateLimiter, parse_retry_after, shared_rate_limiter
+
+__all__ = ['HTTPCache', 'HostRateLimiter', 'Metrics', 'parse_retry_after', 'shared_metrics',
+           'shared_rate_limiter']
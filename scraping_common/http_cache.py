@@ -0,0 +1,208 @@
+"""
+🗃️ On-disk HTTP response cache with conditional revalidation
+
+Wraps a scraper's own "send one GET" function:
+
+    response = cache.fetch(url, send, params=params)
+
+- fresh entries (younger than `ttl`) are returned without touching the network
+  (and without spending a rate-limiter token)
+- stale entries are revalidated with If-None-Match / If-Modified-Since; a 304
+  refreshes the entry and returns the cached body
+- only 200 responses are stored; `Cache-Control: no-store` is respected
+- total body size is bounded by `max_bytes`, evicting least recently used
+
+Entries live in a single SQLite file, so the cache survives restarts and is
+safe to share between threads.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# send(extra_headers) performs the real request, adding the conditional headers
+SendFunction = Callable[[Dict[str, str]], requests.Response]
+
+
+def cache_key(url: str, params: Optional[Mapping] = None) -> str:
+    """Key for a GET request: the URL plus its query parameters in stable order"""
+    query = json.dumps(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return hashlib.sha256(f"GET {url} {query}".encode('utf-8')).hexdigest()
+
+
+class HTTPCache:
+    """
+    Size-bounded LRU cache for GET responses.
+
+    cache_dir -- directory holding http_cache.db
+    ttl       -- seconds an entry is served without revalidation
+    max_bytes -- upper bound on the total size of cached bodies
+    """
+
+    def __init__(self, cache_dir: str = ".http_cache", ttl: float = 300.0,
+                 max_bytes: int = 100 * 1024 * 1024):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "http_cache.db")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.bytes_saved = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key         TEXT PRIMARY KEY,
+                url         TEXT NOT NULL,
+                headers     TEXT NOT NULL,
+                body        BLOB NOT NULL,
+                size        INTEGER NOT NULL,
+                stored_at   REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)")
+        self._conn.commit()
+
+    def fetch(self, url: str, send: SendFunction, params: Optional[Mapping] = None) -> requests.Response:
+        """Return a cached response when possible, otherwise call `send`"""
+        key = cache_key(url, params)
+        entry = self._load(key)
+        now = time.time()
+
+        if entry and now - entry['stored_at'] < self.ttl:
+            self._touch(key, now)
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += entry['size']
+            return self._build_response(entry)
+
+        conditional = {}
+        if entry:
+            if entry['headers'].get('ETag'):
+                conditional['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                conditional['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = send(conditional)
+
+        if response.status_code == 304 and entry:
+            headers = entry['headers']
+            headers.update(self._validator_headers(response.headers))
+            self._refresh(key, headers)
+            with self._lock:
+                self.revalidated += 1
+                self.bytes_saved += entry['size']
+            entry['headers'] = headers
+            return self._build_response(entry)
+
+        with self._lock:
+            self.misses += 1
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', ''):
+            self._store(key, response.url or url, response.headers, response.content)
+        return response
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.revalidated) / lookups if lookups else 0.0,
+            'bytes_saved': self.bytes_saved,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    @staticmethod
+    def _validator_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+        # Header names are case-insensitive (HTTP/2 sends them all lowercase)
+        headers = CaseInsensitiveDict(headers)
+        return {name: headers[name] for name in ('ETag', 'Last-Modified', 'Date') if name in headers}
+
+    def _load(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, headers, body, size, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'url': row[0],
+            'headers': CaseInsensitiveDict(json.loads(row[1])),
+            'body': row[2],
+            'size': row[3],
+            'stored_at': row[4],
+        }
+
+    def _touch(self, key: str, now: float):
+        with self._lock:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+    def _refresh(self, key: str, headers: Mapping[str, str]):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, accessed_at = ? WHERE key = ?",
+                (json.dumps(dict(headers)), now, now, key),
+            )
+            self._conn.commit()
+
+    def _store(self, key: str, url: str, headers: Mapping[str, str], body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        # Bodies are stored decoded, so transfer-level headers no longer apply
+        headers = {name: value for name, value in headers.items()
+                   if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, json.dumps(headers), body, len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        # Drop least recently used entries until the total size fits again
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _build_response(entry: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
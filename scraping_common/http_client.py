@@ -0,0 +1,134 @@
+"""
+🔌 Pooled keep-alive HTTP client
+
+One long-lived client per scraper instead of a bare `requests.get` per URL,
+so repeat fetches to a host reuse the open TCP/TLS connection:
+
+    client = PooledHTTPClient(max_connections_per_host=6)
+    response = client.get(url, headers=headers, timeout=10)
+
+- HTTP/2 through httpx when `httpx` and `h2` are installed (one multiplexed
+  connection per host, shared by all threads), otherwise one requests.Session
+  per calling thread (Sessions are not thread-safe), each keeping its own
+  keep-alive connections
+- at most `max_connections_per_host` requests in flight to any one host
+- always returns a requests.Response and raises requests exceptions, so the
+  rate limiter, the HTTP cache and existing error handling work unchanged
+"""
+
+import threading
+from typing import Dict, List, Mapping, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:
+    httpx = None
+
+
+class PooledHTTPClient:
+    """
+    Thread-safe GET client with connection reuse and per-host limits.
+
+    The httpx client is thread-safe and shared; the requests fallback gives
+    every thread its own Session, created on its first request and closed by
+    close().
+
+    max_connections_per_host -- concurrent requests (and pooled sockets) per host
+    max_hosts                -- number of per-host pools kept open
+    http2                    -- use HTTP/2 when httpx + h2 are available
+    """
+
+    def __init__(self, max_connections_per_host: int = 6, max_hosts: int = 16,
+                 http2: bool = True, headers: Optional[Mapping[str, str]] = None):
+        self.max_connections_per_host = max_connections_per_host
+        self.max_hosts = max_hosts
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+        if http2 and httpx is not None:
+            self.protocol = "HTTP/2"
+            self._client = httpx.Client(
+                http2=True,
+                headers=dict(headers or {}),
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections_per_host * max_hosts,
+                    max_keepalive_connections=max_connections_per_host * max_hosts,
+                ),
+            )
+        else:
+            self.protocol = "HTTP/1.1"
+            self._client = None
+        self._headers = dict(headers or {})
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None,
+            params: Optional[Mapping] = None, timeout: float = 10) -> requests.Response:
+        with self._slots(url):
+            if self._client is None:
+                return self._thread_session().get(url, headers=headers, params=params, timeout=timeout)
+            return self._get_httpx(url, headers, params, timeout)
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        if self._client is not None:
+            self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _thread_session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+            # One request at a time per session: one pooled socket per host
+            adapter = HTTPAdapter(pool_connections=self.max_hosts, pool_maxsize=1)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            with self._lock:
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+
+    def _slots(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc or url
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return self._host_slots[host]
+
+    def _get_httpx(self, url: str, headers: Optional[Mapping[str, str]],
+                   params: Optional[Mapping], timeout: float) -> requests.Response:
+        # Translate httpx errors so callers only ever deal with requests exceptions
+        try:
+            reply = self._client.get(url, headers=headers, params=params, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.reason = reply.reason_phrase
+        response.url = str(reply.url)
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response._content = reply.content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = reply.elapsed
+        response.http_version = reply.http_version
+        return response
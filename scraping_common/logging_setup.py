@@ -0,0 +1,109 @@
+"""
+📝 Level-gated, optionally structured logging for the scrapers
+
+    configure_logging()                          # INFO, human-readable lines
+    configure_logging("DEBUG", debug_sample=20)  # every 20th debug line per message
+    configure_logging(structured=True)           # one JSON object per line
+
+The same switches can come from the environment, so the scripts need no new
+flags: SCRAPER_LOG_LEVEL=DEBUG, SCRAPER_LOG_FORMAT=json, SCRAPER_LOG_SAMPLE=20.
+
+Per-item messages (one per story, product group...) are logged at DEBUG with
+%-style arguments, so below DEBUG they cost one level check and are never
+formatted. Fields passed as `extra={'fields': {...}}` become top-level keys
+in JSON mode and `key=value` pairs otherwise.
+"""
+
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, TextIO, Union
+
+DEFAULT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message and fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class FieldsFormatter(logging.Formatter):
+    """Plain-text formatter that appends `fields` as key=value pairs"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += " | " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class DebugSampler(logging.Filter):
+    """
+    Lets through every `every`-th DEBUG record per message template; records
+    at INFO and above always pass. Sampling by template keeps rare debug
+    messages visible while thinning out the per-item ones.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._counters: Dict[tuple, itertools.count] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        key = (record.name, record.msg)
+        counter = self._counters.get(key)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(key, itertools.count())
+        return next(counter) % self.every == 0
+
+
+def configure_logging(level: Union[int, str, None] = None, structured: Optional[bool] = None,
+                      debug_sample: Optional[int] = None, stream: Optional[TextIO] = None,
+                      fmt: str = DEFAULT_FORMAT, force: bool = False) -> logging.Handler:
+    """
+    Install one handler on the root logger (like logging.basicConfig, a no-op
+    when the root logger already has handlers unless `force` is set).
+    Arguments left as None fall back to the SCRAPER_LOG_* environment variables.
+    """
+    level = level or os.environ.get('SCRAPER_LOG_LEVEL', 'INFO')
+    if structured is None:
+        structured = os.environ.get('SCRAPER_LOG_FORMAT', '').lower() == 'json'
+    if debug_sample is None:
+        debug_sample = int(os.environ.get('SCRAPER_LOG_SAMPLE', '1'))
+
+    root = logging.getLogger()
+    if root.handlers and not force:
+        return root.handlers[0]
+
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    root.setLevel(level)
+
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JSONFormatter() if structured else FieldsFormatter(fmt))
+    if debug_sample > 1:
+        handler.addFilter(DebugSampler(debug_sample))
+    root.addHandler(handler)
+    return handler
@@ -0,0 +1,232 @@
+"""
+⏱️ Per-stage timings and counters
+
+A small in-process registry shared by every scraper in the repository:
+
+    with shared_metrics.span("parse", scraper="hn"):
+        soup = BeautifulSoup(html, 'html.parser')
+    shared_metrics.inc("stories_total", len(stories), scraper="hn")
+
+- spans record their duration in the `stage_seconds` histogram, labelled
+  with the stage name plus any extra labels
+- `observe_http` splits a response into time-to-headers (DNS, connect, TLS
+  and server wait) and body download, using `response.elapsed`
+- export as Prometheus text (`to_prometheus`) or JSON (`snapshot`); call
+  `shared_metrics.enable("metrics.json")` or set SCRAPER_METRICS=metrics.prom
+  to write the file at exit
+
+Disabled (the default) every call returns after one attribute check and
+`span` hands back a shared no-op context manager, so instrumented code pays
+well under a microsecond per call.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Upper bounds in seconds, from a cache hit to a slow LLM call
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    """Times one stage; stages left by an exception also count in stage_errors_total"""
+
+    def __init__(self, metrics: 'Metrics', stage: str, labels: Dict[str, str]):
+        self.metrics = metrics
+        self.labels = {'stage': stage, **labels}
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe("stage_seconds", time.perf_counter() - self.started, **self.labels)
+        if exc_type is not None:
+            self.metrics.inc("stage_errors_total", **self.labels)
+        return False
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def add(self, buckets: Tuple[float, ...], value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+class Metrics:
+    """
+    Thread-safe registry of counters and histograms.
+
+    namespace -- prefix for every exported metric name
+    buckets   -- histogram upper bounds in seconds
+    """
+
+    def __init__(self, enabled: bool = False, namespace: str = "scraper",
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+        self._export_path: Optional[str] = None
+
+    def enable(self, export_path: Optional[str] = None):
+        """Start recording; with export_path the metrics are written there at exit"""
+        self.enabled = True
+        if export_path and self._export_path is None:
+            atexit.register(self._export_at_exit)
+        self._export_path = export_path or self._export_path
+
+    def disable(self):
+        self.enabled = False
+
+    def span(self, stage: str, **labels):
+        """Context manager timing one stage (a no-op while disabled)"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, stage, labels)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = _Histogram(self.buckets)
+            series[key].add(self.buckets, value)
+
+    def observe_http(self, response, seconds: float, **labels):
+        """
+        Split one HTTP exchange into time-to-headers and body download.
+        requests sets `elapsed` when the headers arrive, so the rest of
+        `seconds` is the download; with httpx `elapsed` covers the body too.
+        """
+        if not self.enabled:
+            return
+        elapsed = getattr(response, 'elapsed', None)
+        headers = min(seconds, elapsed.total_seconds()) if elapsed is not None else seconds
+        self.observe("http_headers_seconds", headers, **labels)
+        self.observe("http_download_seconds", seconds - headers, **labels)
+        self.inc("http_responses_total", status=response.status_code, **labels)
+        self.inc("http_response_bytes_total", len(response.content or b""), **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict:
+        """Counters and histogram summaries as plain JSON-ready data"""
+        with self._lock:
+            counters = {
+                name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [{
+                    'labels': dict(key),
+                    'count': hist.count,
+                    'sum': round(hist.sum, 6),
+                    'mean': round(hist.sum / hist.count, 6) if hist.count else 0.0,
+                    'buckets': {str(bound): count for bound, count in zip(self.buckets, self._cumulative(hist))},
+                } for key, hist in series.items()]
+                for name, series in self._histograms.items()
+            }
+        return {'namespace': self.namespace, 'counters': counters, 'histograms': histograms}
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full_name}{_format_labels(key)} {value:g}")
+
+            for name, series in sorted(self._histograms.items()):
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, hist in sorted(series.items()):
+                    for bound, count in zip(self.buckets, self._cumulative(hist)):
+                        lines.append(f"{full_name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {count}")
+                    lines.append(f"{full_name}_bucket{_format_labels(key, ('le', '+Inf'))} {hist.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(key)} {hist.sum:.6f}")
+                    lines.append(f"{full_name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write a .json snapshot, or Prometheus text for any other extension"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.json'):
+                json.dump(self.snapshot(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+    @staticmethod
+    def _cumulative(hist: _Histogram) -> List[int]:
+        running, cumulative = 0, []
+        for count in hist.counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+    def _export_at_exit(self):
+        if self._export_path:
+            self.write(self._export_path)
+
+
+# One registry per process; SCRAPER_METRICS=<file.json|file.prom> turns it on
+shared_metrics = Metrics()
+if os.environ.get('SCRAPER_METRICS'):
+    shared_metrics.enable(os.environ['SCRAPER_METRICS'])
@@ -0,0 +1,157 @@
+"""
+🚦 Adaptive per-host rate limiting
+
+One token bucket per host. Callers reserve a slot with `acquire(url)` before
+each request and report the outcome with `observe(url, response)`:
+
+- 429/403/503 responses halve the host's rate and honour `Retry-After`;
+  a burst of them (e.g. every in-flight request of a blocked header set) halves
+  it once per `backoff_cooldown` seconds, not once per response
+- successful responses creep the rate back up towards `max_rate`
+
+Reservations are made under a lock but the waiting happens outside it, so
+concurrent workers are spaced out like a leaky bucket instead of racing.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+THROTTLE_STATUS_CODES = (403, 429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket for a single host with an adjustable refill rate"""
+
+    def __init__(self, rate: float, burst: int, min_rate: float, max_rate: float):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.backed_off_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+
+    def slow_down(self, factor: float, retry_after: Optional[float], cooldown: float = 0.0):
+        """Back off by `factor`, at most once per `cooldown` seconds; Retry-After always counts"""
+        with self.lock:
+            now = time.monotonic()
+            if self.backed_off_at is None or now - self.backed_off_at >= cooldown:
+                self.rate = max(self.min_rate, self.rate * factor)
+                self.tokens = min(self.tokens, 0.0)
+                self.backed_off_at = now
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def speed_up(self, step: float):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + step)
+
+
+class HostRateLimiter:
+    """
+    Shared, adaptive token-bucket limiter keyed by host.
+
+    rate      -- starting requests per second for a host
+    burst     -- requests allowed back to back before pacing kicks in
+    jitter    -- random extra wait, as a fraction of one request interval
+    max_rate  -- ceiling the rate recovers towards after successes
+    backoff_cooldown -- seconds after a back-off during which further
+                throttle responses (answers to requests already in flight)
+                don't lower the rate again
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 2, jitter: float = 0.3,
+                 min_rate: float = 0.05, max_rate: float = 4.0,
+                 backoff_factor: float = 0.5, recovery_step: float = 0.05,
+                 backoff_cooldown: float = 2.0):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.backoff_cooldown = backoff_cooldown
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str, rate: Optional[float] = None, burst: Optional[int] = None,
+                  max_rate: Optional[float] = None):
+        """Override the defaults for one host (e.g. a known-strict API)"""
+        with self._lock:
+            self._buckets[host] = TokenBucket(
+                rate=rate or self.rate,
+                burst=burst or self.burst,
+                min_rate=self.min_rate,
+                max_rate=max_rate or self.max_rate,
+            )
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc or url
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst, self.min_rate, self.max_rate)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to `url`'s host may go out; returns seconds waited"""
+        bucket = self.bucket(url)
+        wait = bucket.reserve()
+        if wait > 0:
+            wait += random.uniform(0, self.jitter / bucket.rate)
+            time.sleep(wait)
+        return wait
+
+    def record(self, url: str, status_code: Optional[int], retry_after: Optional[float] = None):
+        """Adapt the host's rate to the outcome of a request"""
+        bucket = self.bucket(url)
+        if status_code in THROTTLE_STATUS_CODES:
+            bucket.slow_down(self.backoff_factor, retry_after, self.backoff_cooldown)
+        elif status_code is not None and status_code < 400:
+            bucket.speed_up(self.recovery_step)
+
+    def observe(self, url: str, response) -> None:
+        """`record` for a requests.Response, reading Retry-After when present"""
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        self.record(url, response.status_code, retry_after)
+
+    def current_rate(self, url: str) -> float:
+        return self.bucket(url).rate
+
+
+# One limiter per process so every fetch path shares the same host budgets
+shared_rate_limiter = HostRateLimiter()
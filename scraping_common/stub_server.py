@@ -0,0 +1,121 @@
+"""
+🧪 Local HTTP stub server for benchmarks and offline runs
+
+    with StubServer(static_routes({'/': b'<html>...</html>'}), latency=0.05) as server:
+        requests.get(server.url('/'))
+
+A route function receives (path, query, request_headers) and returns
+(status, headers, body). `static_routes` serves fixed bodies with ETag /
+Last-Modified validators and answers conditional requests with 304.
+"""
+
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+StubResponse = Tuple[int, Dict[str, str], bytes]
+StubRoute = Callable[[str, Dict[str, list], Mapping[str, str]], StubResponse]
+
+
+def static_routes(pages: Dict[str, bytes], content_type: str = 'text/html; charset=utf-8',
+                  validators: bool = True) -> StubRoute:
+    """Route serving fixed bodies by path (query string ignored)"""
+    last_modified = formatdate(time.time() - 3600, usegmt=True)
+
+    def route(path: str, query: Dict[str, list], headers: Mapping[str, str]) -> StubResponse:
+        body = pages.get(path)
+        if body is None:
+            return 404, {'Content-Type': 'text/plain'}, b'not found'
+
+        response_headers = {'Content-Type': content_type}
+        if validators:
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            response_headers.update({'ETag': etag, 'Last-Modified': last_modified})
+            if headers.get('If-None-Match') == etag or headers.get('If-Modified-Since') == last_modified:
+                return 304, response_headers, b''
+        return 200, response_headers, body
+
+    return route
+
+
+class StubServer:
+    """
+    Threaded HTTP server on 127.0.0.1.
+
+    latency         -- fixed delay added to every response
+    connect_latency -- one-off delay per new connection, standing in for the
+                       TCP/TLS handshake a real remote host would cost
+    """
+
+    def __init__(self, route: StubRoute, latency: float = 0.0, connect_latency: float = 0.0):
+        self.route = route
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.connections = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def url(self, path: str = '') -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}{path}"
+
+    def start(self) -> 'StubServer':
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without TCP_NODELAY
+            # a keep-alive client stalls on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+                if stub.connect_latency:
+                    time.sleep(stub.connect_latency)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if stub.latency:
+                    time.sleep(stub.latency)
+                status, headers, body = stub.route(parsed.path, parse_qs(parsed.query), self.headers)
+
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_sent += len(body)
+                    if status == 304:
+                        stub.not_modified += 1
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,89 @@
+"""BatchScraper pipeline failure handling and LLM concurrency"""
+
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'ai-web-scraper'))
+
+from batch_scraper import BatchScraper  # noqa: E402
+from fake_llm import FakeLLM  # noqa: E402
+from gemini_scraper import GeminiWebScraper  # noqa: E402
+
+LONG_TEXT = "\n".join(f"Paragraph {i}: " + "lorem ipsum dolor sit amet " * 40 for i in range(200))
+
+
+class CountingLLM(FakeLLM):
+    """FakeLLM that remembers the most calls it had in flight at once"""
+
+    def __init__(self):
+        super().__init__(latency=0.01)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, messages):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await super().ainvoke(messages)
+        finally:
+            self.in_flight -= 1
+
+
+def page(content):
+    return {'content': content, 'fetch_status': "SUCCESS", 'extraction': "full", 'chars_saved': 0, 'tokens_saved': 0}
+
+
+def make_scraper(llm):
+    scraper = GeminiWebScraper(llm=llm)
+
+    def fetch_page(url, max_chars=10000, content_mode=None):
+        if url.endswith('/boom'):
+            raise RuntimeError("fetch exploded")
+        return page(LONG_TEXT if url.endswith('/long') else "short page text")
+
+    scraper.fetch_page = fetch_page
+    return scraper
+
+
+def run(batch, urls, output):
+    return asyncio.run(asyncio.wait_for(batch.run_async(urls, "Summarize", output), timeout=30))
+
+
+def test_failing_fetch_and_analysis_become_per_url_failures(tmp_path):
+    scraper = make_scraper(FakeLLM(latency=0))
+    analyze_any_async = scraper.analyze_any_async
+
+    async def flaky_analyze(content, user_prompt, **kwargs):
+        if content == "short page text" and flaky_analyze.first:
+            flaky_analyze.first = False
+            raise RuntimeError("model exploded")
+        return await analyze_any_async(content, user_prompt, **kwargs)
+
+    flaky_analyze.first = True
+    scraper.analyze_any_async = flaky_analyze
+
+    urls = ['https://a.example/ok', 'https://a.example/boom', 'https://a.example/ok2', 'https://a.example/ok3']
+    output = str(tmp_path / 'results.ndjson')
+    report = run(BatchScraper(scraper, fetch_workers=2, llm_concurrency=2), urls, output)
+    scraper.close()
+
+    with open(output, encoding='utf-8') as f:
+        records = {record['url']: record for record in map(json.loads, f)}
+    assert report.urls == 4 and report.failed == 2 and report.succeeded == 2
+    assert records['https://a.example/boom']['fetch_status'].startswith("ERROR: Fetch error")
+    assert sum(record['analysis'].startswith("ERROR: AI Analysis error") for record in records.values()) == 1
+
+
+def test_llm_calls_in_flight_are_capped_across_pages(tmp_path):
+    llm = CountingLLM()
+    scraper = make_scraper(llm)
+    urls = [f'https://a.example/{i}/long' for i in range(6)]
+    report = run(BatchScraper(scraper, fetch_workers=4, llm_concurrency=3), urls, str(tmp_path / 'out.ndjson'))
+    scraper.close()
+
+    assert report.succeeded == 6
+    assert llm.calls > 6 * 2          # long pages fanned out into map calls
+    assert llm.max_in_flight <= 3
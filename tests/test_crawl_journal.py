@@ -0,0 +1,37 @@
+"""CrawlJournal completion rules"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'ecommerce-api-scraper'))
+
+from crawl_journal import CrawlJournal  # noqa: E402
+
+
+def products(page):
+    return [{'product_id': f'P{page}{i}', 'name': f'Product {page}-{i}', 'scraped_at': '', 'currency': 'TRY'}
+            for i in range(3)]
+
+
+def test_empty_page_does_not_complete_a_crawl_with_a_missing_earlier_page(tmp_path):
+    with CrawlJournal(str(tmp_path / 'crawl.db')) as journal:
+        journal.begin('laptop')
+        for page in (1, 2, 4, 5):
+            journal.record_page('laptop', page, 'SIMPLE', products(page))
+        journal.record_page('laptop', 6, 'SIMPLE', [])   # page 3 failed, page 6 ends the listing
+
+        assert not journal.is_complete('laptop', 10)
+
+        journal.record_page('laptop', 3, 'ADVANCED', products(3))
+        assert journal.is_complete('laptop', 10)
+
+
+def test_every_requested_page_completes_a_crawl(tmp_path):
+    with CrawlJournal(str(tmp_path / 'crawl.db')) as journal:
+        journal.begin('laptop')
+        for page in (1, 2):
+            journal.record_page('laptop', page, 'SIMPLE', products(page))
+        assert not journal.is_complete('laptop', 3)
+        journal.record_page('laptop', 3, 'SIMPLE', products(3))
+        assert journal.is_complete('laptop', 3)
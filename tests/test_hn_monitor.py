@@ -0,0 +1,35 @@
+"""HNMonitor poll loop timing"""
+
+import itertools
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'hacker-news-scraper'))
+
+from hn_monitor import DeltaStore, HNMonitor  # noqa: E402
+
+
+class SlowMonitor(HNMonitor):
+    """Monitor whose polls take longer than the interval"""
+
+    def __init__(self, store: DeltaStore, interval: float):
+        super().__init__(crawler=None, store=store, interval=interval)
+        self.polled = 0
+
+    def poll(self):
+        self.polled += 1
+        return None
+
+
+def test_poll_longer_than_interval_does_not_crash(tmp_path, monkeypatch):
+    # Every clock read is one second later: each poll overruns the 0.5s
+    # interval, and the clamped deadline is in the past by the time it is slept on
+    clock = itertools.count(start=100.0, step=1.0)
+    monkeypatch.setattr(time, 'monotonic', lambda: next(clock))
+
+    monitor = SlowMonitor(DeltaStore(str(tmp_path / 'deltas.jsonl')), interval=0.5)
+    monitor.run(polls=3)
+
+    assert monitor.polled == 3
@@ -0,0 +1,61 @@
+"""HTTPCache revalidation against a local stub server"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraping_common.http_cache import HTTPCache, cache_key  # noqa: E402
+from scraping_common.stub_server import StubServer  # noqa: E402
+
+BODY = b'<html><body>cached page</body></html>'
+ETAG = '"abc123"'
+LAST_MODIFIED = 'Mon, 05 Oct 2026 10:00:00 GMT'
+
+
+def lowercase_validator_route(seen):
+    """Serves BODY with lowercase validator names, as HTTP/2 servers do"""
+
+    def route(path, query, headers):
+        seen.append(dict(headers))
+        if headers.get('If-None-Match') == ETAG or headers.get('If-Modified-Since') == LAST_MODIFIED:
+            return 304, {'etag': ETAG, 'last-modified': LAST_MODIFIED}, b''
+        return 200, {'content-type': 'text/html', 'etag': ETAG, 'last-modified': LAST_MODIFIED}, BODY
+
+    return route
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HTTPCache(cache_dir=str(tmp_path), ttl=0)
+    yield cache
+    cache.close()
+
+
+def test_lowercase_validators_trigger_304_revalidation(cache):
+    seen = []
+    with StubServer(lowercase_validator_route(seen)) as server, requests.Session() as session:
+        url = server.url('/page')
+
+        def fetch():
+            return cache.fetch(url, lambda extra: session.get(url, headers=extra, timeout=5))
+
+        assert fetch().content == BODY
+        response = fetch()
+
+        assert server.not_modified == 1
+        assert seen[1].get('If-None-Match') == ETAG
+        assert seen[1].get('If-Modified-Since') == LAST_MODIFIED
+        assert response.status_code == 200 and response.content == BODY
+        assert response.from_cache
+        assert cache.stats()['revalidated'] == 1
+
+        # The 304 validators replace the stored ones instead of adding a second copy
+        fetch()
+        stored = cache._load(cache_key(url))['headers']
+        names = [name.lower() for name in stored]
+        assert names.count('etag') == 1 and names.count('last-modified') == 1
+        assert server.not_modified == 2
@@ -0,0 +1,29 @@
+"""PooledHTTPClient with concurrent callers"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraping_common.http_client import PooledHTTPClient  # noqa: E402
+from scraping_common.stub_server import StubServer, static_routes  # noqa: E402
+
+
+def test_requests_fallback_gives_each_thread_its_own_session():
+    barrier = threading.Barrier(4)
+    with StubServer(static_routes({'/': b'ok'}), latency=0.01) as server, \
+            PooledHTTPClient(max_connections_per_host=4, http2=False) as client:
+
+        def fetch(_):
+            barrier.wait()
+            return [client.get(server.url('/')).status_code for _ in range(3)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            codes = [code for result in executor.map(fetch, range(4)) for code in result]
+
+        assert codes == [200] * 12
+        assert len(client._sessions) == 4
+        # Each thread reused its own keep-alive connection
+        assert server.connections == 4
@@ -0,0 +1,36 @@
+"""HostRateLimiter back-off"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraping_common.rate_limiter import HostRateLimiter  # noqa: E402
+
+URL = 'https://shop.example/api'
+
+
+def test_burst_of_403s_backs_off_once_per_cooldown(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    limiter = HostRateLimiter(rate=50.0, max_rate=50.0, backoff_cooldown=2.0)
+
+    # Every request a blocked header set had in flight answers 403 at once
+    for _ in range(8):
+        limiter.record(URL, 403)
+    assert limiter.current_rate(URL) == 25.0
+
+    now[0] += 2.5
+    limiter.record(URL, 403)
+    assert limiter.current_rate(URL) == 12.5
+
+
+def test_retry_after_is_honoured_during_the_cooldown(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    limiter = HostRateLimiter(rate=10.0, backoff_cooldown=2.0)
+
+    limiter.record(URL, 429)
+    limiter.record(URL, 429, retry_after=30)
+    assert limiter.bucket(URL).blocked_until == 1030.0
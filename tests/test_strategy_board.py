@@ -0,0 +1,41 @@
+"""StrategyScoreboard persistence"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'ecommerce-api-scraper'))
+
+from ecommerce_api_scraper import ECommerceAPIScraperV12_UltimateEdition  # noqa: E402
+from strategy_board import StrategyScoreboard  # noqa: E402
+
+
+def stored_rows(path):
+    with StrategyScoreboard(path, flush_interval=3600) as board:
+        return board._conn.execute("SELECT COUNT(*) FROM strategy_stats").fetchone()[0]
+
+
+def test_scores_are_written_in_batches_and_on_close(tmp_path):
+    path = str(tmp_path / 'strategies.db')
+    board = StrategyScoreboard(path, flush_interval=3600)
+    board.record('shop.example', 'SIMPLE', 'blocked')
+    board.record('shop.example', 'ADVANCED', 'ok', 0.2)
+    assert stored_rows(path) == 0
+
+    board.close()
+    assert stored_rows(path) == 2
+    with StrategyScoreboard(path) as reopened:
+        assert reopened.ranking('shop.example')[0] == 'ADVANCED'
+
+
+def test_scraper_opens_and_closes_its_own_board(tmp_path):
+    path = str(tmp_path / 'strategies.db')
+    with ECommerceAPIScraperV12_UltimateEdition(base_url='http://shop.example/api', strategy_db=path) as scraper:
+        scraper.strategy_board.record(scraper.host, 'SIMPLE', 'blocked')
+    assert stored_rows(path) == 1
+
+    shared = StrategyScoreboard(':memory:')
+    with ECommerceAPIScraperV12_UltimateEdition(strategy_board=shared):
+        pass
+    assert shared.ranking('shop.example')   # a board passed in stays open
+    shared.close()
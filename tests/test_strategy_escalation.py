@@ -0,0 +1,61 @@
+"""E-commerce strategy hand-over when a page fails before the end of the listing"""
+
+import json
+import os
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'ecommerce-api-scraper'))
+
+from ecommerce_api_scraper import ECommerceAPIScraperV12_UltimateEdition  # noqa: E402
+from page_fetcher import KeywordProgress  # noqa: E402
+from scraping_common.rate_limiter import HostRateLimiter  # noqa: E402
+from scraping_common.stub_server import StubServer  # noqa: E402
+from strategy_board import StrategyScoreboard  # noqa: E402
+
+LAST_PAGE = 5
+FAILING_PAGE = 3
+
+
+def listing_route():
+    """Pages 1..LAST_PAGE have 3 products, later pages none; FAILING_PAGE answers 500 once"""
+    failed = set()
+    lock = threading.Lock()
+
+    def route(path, query, headers):
+        page = int(query['page'][0])
+        with lock:
+            if page == FAILING_PAGE and page not in failed:
+                failed.add(page)
+                return 500, {'Content-Type': 'text/plain'}, b'server error'
+        ads = []
+        if page <= LAST_PAGE:
+            ads.append({'products': [
+                {'productId': f'P{page}{i}', 'name': f'Stub {page}-{i}', 'brand': 'Stub',
+                 'price': {'value': 100.0 + i}, 'merchantName': 'Stub Store', 'listingId': f'L{page}{i}'}
+                for i in range(3)
+            ]})
+        return 200, {'Content-Type': 'application/json'}, json.dumps({'ads': ads}).encode('utf-8')
+
+    return route
+
+
+def test_remaining_keeps_failed_pages_before_the_end():
+    progress = KeywordProgress(10, done={1, 2, 4, 5, 6})
+    progress.mark_end(6)
+    assert progress.remaining() == [3]
+
+
+def test_failed_middle_page_is_retried_by_the_next_strategy():
+    with StubServer(listing_route()) as server:
+        scraper = ECommerceAPIScraperV12_UltimateEdition(
+            base_url=server.url('/api'), rate_limiter=HostRateLimiter(rate=1000, burst=1000),
+            strategy_board=StrategyScoreboard(':memory:'),
+        )
+        with scraper:
+            products = scraper.search_products_ultimate('laptop', pages=10)
+
+    assert len(products) == LAST_PAGE * 3
+    assert {product['product_id'] for product in products} >= {f'P{FAILING_PAGE}{i}' for i in range(3)}